@@ -0,0 +1,121 @@
+"""
+Caching for the authenticated user lookup.
+
+JWT authentication loads the Account behind the token on every API request.
+AccountCache keeps a slim projection of the fields the permission layer reads
+(flags, role, status, organization) in the shared cache under a per-user
+version stamp and rebuilds Account instances from it without a query. All
+other fields are deferred and fetched together on first access.
+
+The stamp is bumped by Account post_save/post_delete signals (see
+apps.accounts.signals), which covers profile edits, password changes and
+status changes.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.core.cache import bump_version_stamp, cache_key, get_version_stamp
+
+logger = logging.getLogger(__name__)
+
+
+class AccountCache:
+    """Versioned per-user cache of slim Account projections."""
+
+    # Cache timeouts (in seconds)
+    TIMEOUT = 300  # 5 minutes
+    VERSION_TIMEOUT = 60 * 60 * 24  # 1 day
+
+    # Fields read by authentication and permission checks
+    PROJECTION_FIELDS = (
+        "id",
+        "email",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+        "is_email_verified",
+        "is_org_admin",
+        "is_org_creator",
+        "role",
+        "status",
+        "organization_id",
+    )
+
+    @classmethod
+    def get_projection_fields(cls) -> tuple:
+        """Projected fields, plus the password hash when tokens are revocable."""
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return cls.PROJECTION_FIELDS + ("password",)
+        return cls.PROJECTION_FIELDS
+
+    @classmethod
+    def get_version_key(cls, user_id) -> str:
+        """Generate cache key for a user's account version stamp."""
+        return cache_key("user", user_id, "account_version")
+
+    @classmethod
+    def get_account_key(cls, user_id, version) -> str:
+        """Generate cache key for a versioned account projection."""
+        return cache_key("user", user_id, "account", version)
+
+    @classmethod
+    def get_version(cls, user_id) -> int:
+        """Get the current account version stamp for a user."""
+        return get_version_stamp(cls.get_version_key(user_id), cls.VERSION_TIMEOUT)
+
+    @classmethod
+    def invalidate(cls, user_id) -> None:
+        """Invalidate the cached projection for a user."""
+        bump_version_stamp(cls.get_version_key(user_id), cls.VERSION_TIMEOUT)
+        logger.debug(f"Invalidated account cache for user {user_id}")
+
+    @classmethod
+    def get_user(cls, user_id):
+        """
+        Get an Account by primary key from its cached projection.
+
+        Args:
+            user_id: Account primary key (as found in the token)
+
+        Returns:
+            Account instance with only the projected fields loaded, or None
+            if the account doesn't exist
+        """
+        from apps.accounts.models import Account
+
+        key = cls.get_account_key(user_id, cls.get_version(user_id))
+        data = cache.get(key)
+
+        if data is None:
+            try:
+                data = (
+                    Account.objects.filter(pk=user_id)
+                    .values(*cls.get_projection_fields())
+                    .first()
+                )
+            except (TypeError, ValueError):
+                # Malformed primary key in the token
+                return None
+            if data is None:
+                return None
+            cache.set(key, data, cls.TIMEOUT)
+
+        return cls._build_instance(Account, data)
+
+    @staticmethod
+    def _build_instance(model, data):
+        """Build a model instance with every non-projected field deferred."""
+        field_names = [
+            field.attname
+            for field in model._meta.concrete_fields
+            if field.attname in data
+        ]
+        user = model.from_db(
+            DEFAULT_DB_ALIAS, field_names, [data[name] for name in field_names]
+        )
+        user._load_deferred_together = True
+        return user
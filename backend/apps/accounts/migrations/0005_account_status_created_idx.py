@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_add_password_reset_fields'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('organizations', '0006_organization_extended_properties'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='account_status_created_idx'),
+        ),
+    ]
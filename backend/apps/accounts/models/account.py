@@ -124,6 +124,20 @@ class Account(BaseFields, AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return f"{self.email}"
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        """
+        Reload fields from the database.
+
+        Instances built from the authentication cache (AccountCache) carry a
+        slim projection; the first deferred field accessed loads all of them
+        in one query instead of one query per field.
+        """
+        if fields is not None and getattr(self, "_load_deferred_together", False):
+            deferred_fields = self.get_deferred_fields()
+            if deferred_fields.issuperset(fields):
+                fields = deferred_fields
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
     @property
     def is_admin(self):
         return self.is_org_admin or self.is_org_creator
@@ -375,17 +389,23 @@ class Account(BaseFields, AbstractBaseUser, PermissionsMixin):
 
     def has_membership_in(self, organization):
         """Check if user has any membership in the given organization."""
-        return self.organization_memberships.filter(organization=organization).exists()
+        return self.get_membership_in(organization) is not None
 
     def has_active_membership_in(self, organization):
         """Check if user has active membership in the given organization."""
-        return self.organization_memberships.filter(
-            organization=organization, status="active"
-        ).exists()
+        membership = self.get_membership_in(organization)
+        return membership is not None and membership.is_active()
 
     def get_membership_in(self, organization):
-        """Get membership in the given organization, if any."""
-        return self.organization_memberships.filter(organization=organization).first()
+        """
+        Get membership in the given organization, if any.
+
+        Lookups are memoized on this instance for the rest of the request and
+        cached per (user, organization) until the membership changes.
+        """
+        from apps.organizations.cache import MembershipCache
+
+        return MembershipCache.get_membership(self, organization)
 
     def is_owner_of(self, organization):
         """Check if user is owner of the given organization."""
@@ -474,4 +494,9 @@ class Account(BaseFields, AbstractBaseUser, PermissionsMixin):
                 fields=["is_email_verified"], name="account_email_verified_idx"
             ),
             models.Index(fields=["date_joined"], name="account_date_joined_idx"),
+            # Keyset walk in cleanup_unverified_accounts
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="account_status_created_idx",
+            ),
         ]
@@ -1,15 +1,18 @@
 from datetime import timedelta
 
 from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.billing.models import Plan, Subscription, SubscriptionStatus
+from apps.core.side_effects import defer
 from apps.organizations.models import Organization, OrganizationMembership
 
 from .models import Account, AccountAuthProvider
+from .side_effects import send_verification_email
 
 
 class AccountSerializer(serializers.ModelSerializer):
@@ -215,12 +218,11 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
         return attrs
 
-    def _generate_unique_subdomain(self, first_name, last_name, preferred=None):
-        """Generate a unique subdomain for the organization."""
-        if preferred:
-            # Ensure preferred subdomain doesn't exceed 50 characters
-            return preferred[:50]
+    # Inserts attempted when concurrent registrations race for a subdomain
+    SUBDOMAIN_ATTEMPTS = 5
 
+    def _subdomain_base(self, first_name, last_name):
+        """Build the ASCII subdomain base for a user's name."""
         # Create base subdomain from name
         base = (
             f"{first_name.lower()}-{last_name.lower()}"
@@ -248,35 +250,87 @@ class RegistrationSerializer(serializers.ModelSerializer):
             base = f"user-{base}"
 
         # Truncate base to allow room for counter suffixes (leave 10 chars for counter)
-        base = base[:40]
+        return base[:40].rstrip("-")
 
-        # Check uniqueness and add suffix if needed
-        subdomain = base
-        counter = 1
-        while Organization.objects.filter(sub_domain=subdomain).exists():
-            # Ensure the full subdomain with counter doesn't exceed 50 chars
-            suffix = f"-{counter}"
-            if len(base) + len(suffix) > 50:
-                # Truncate base further to make room for suffix
-                truncated_base = base[: 50 - len(suffix)]
-                subdomain = f"{truncated_base}{suffix}"
-            else:
-                subdomain = f"{base}{suffix}"
+    def _taken_subdomains(self, base):
+        """Fetch the existing ``base`` and ``base-N`` subdomains in one query."""
+        import re
+
+        return set(
+            Organization.objects.filter(
+                Q(sub_domain=base)
+                | Q(
+                    sub_domain__startswith=f"{base}-",
+                    sub_domain__regex=rf"^{re.escape(base)}-[0-9]+$",
+                )
+            ).values_list("sub_domain", flat=True)
+        )
 
+    def _generate_unique_subdomain(
+        self, first_name, last_name, preferred=None, exclude=()
+    ):
+        """
+        Generate a unique subdomain for the organization.
+
+        Picks ``base`` or the smallest free ``base-N`` from a single query.
+        Subdomains in exclude are treated as taken (e.g. lost insert races).
+        """
+        if preferred:
+            # Ensure preferred subdomain doesn't exceed 50 characters
+            return preferred[:50]
+
+        base = self._subdomain_base(first_name, last_name)
+        taken = self._taken_subdomains(base) | set(exclude)
+        if base not in taken:
+            return base
+
+        used = {
+            int(subdomain[len(base) + 1 :])
+            for subdomain in taken
+            if subdomain.startswith(f"{base}-") and subdomain[len(base) + 1 :].isdigit()
+        }
+        counter = 1
+        while counter in used:
             counter += 1
-            if counter > 100:  # Safety break
-                import uuid
 
-                # Ensure UUID suffix doesn't exceed limit
-                uuid_suffix = str(uuid.uuid4())[:8]
-                if len(base) + len(uuid_suffix) + 1 > 50:
-                    truncated_base = base[: 50 - len(uuid_suffix) - 1]
-                    subdomain = f"{truncated_base}-{uuid_suffix}"
-                else:
-                    subdomain = f"{base}-{uuid_suffix}"
-                break
+        # The base leaves 10 chars for the counter, far more than needed
+        return f"{base}-{counter}"[:50]
+
+    def _create_organization(self, first_name, last_name, preferred=None, **fields):
+        """
+        Create an organization on a newly allocated subdomain.
 
-        return subdomain[:50]  # Final safety truncation
+        Concurrent registrations can pick the same free subdomain; the insert
+        that loses on the unique constraint retries with the next gap. A
+        preferred subdomain taken in the meantime is a validation error.
+        """
+        exclude = set()
+        for _attempt in range(self.SUBDOMAIN_ATTEMPTS):
+            subdomain = self._generate_unique_subdomain(
+                first_name, last_name, preferred, exclude
+            )
+            try:
+                with transaction.atomic():
+                    return Organization.objects.create(
+                        slug=subdomain,  # Use subdomain as slug as well
+                        sub_domain=subdomain,
+                        **fields,
+                    )
+            except IntegrityError:
+                if not Organization.objects.filter(
+                    Q(sub_domain=subdomain) | Q(slug=subdomain)
+                ).exists():
+                    # Some other constraint failed
+                    raise
+                if preferred:
+                    raise serializers.ValidationError(
+                        {"preferred_subdomain": _("This subdomain is already taken.")}
+                    ) from None
+                exclude.add(subdomain)
+
+        raise serializers.ValidationError(
+            {"non_field_errors": _("Unable to create organization. Please try again.")}
+        )
 
     @transaction.atomic
     def create(self, validated_data):
@@ -334,18 +388,12 @@ class RegistrationSerializer(serializers.ModelSerializer):
             # Ensure organization name doesn't exceed database limit
             organization_name = organization_name[:100]
 
-            # Generate unique subdomain
-            subdomain = self._generate_unique_subdomain(
+            # Create organization on a unique subdomain and link via membership
+            organization = self._create_organization(
                 user.first_name,
                 user.last_name,
                 preferred_subdomain,
-            )
-
-            # Create organization and link via membership
-            organization = Organization.objects.create(
                 name=organization_name,
-                slug=subdomain,  # Use subdomain as slug as well
-                sub_domain=subdomain,
                 creator_email=user.email,
                 creator_name=user.full_name,
                 created_by=user,
@@ -383,12 +431,9 @@ class RegistrationSerializer(serializers.ModelSerializer):
                 # If subscription creation fails, continue - user can still use basic features
                 pass
 
-        # Send email verification
-        try:
-            user.send_verification_email()
-        except Exception:
-            # If email sending fails, continue - user can still access their account
-            pass
+        # Send email verification once the account is committed; failures are
+        # logged and the user can still request a new verification email
+        defer(send_verification_email, user_id=str(user.pk))
 
         return user
 
@@ -564,12 +609,6 @@ class SocialRegistrationSerializer(serializers.Serializer):
                 or f"{email.split('@')[0]}'s Organization"
             )
 
-        # Generate unique subdomain (reuse method from RegistrationSerializer)
-        registration_serializer = RegistrationSerializer()
-        subdomain = registration_serializer._generate_unique_subdomain(
-            first_name, last_name, preferred_subdomain
-        )
-
         # Create user account first (without organization)
         user_data = {
             "email": email,
@@ -585,11 +624,13 @@ class SocialRegistrationSerializer(serializers.Serializer):
         user.set_unusable_password()  # Explicitly mark password as unusable for social-only accounts
         user.save(update_fields=["password"])
 
-        # Create organization and link via membership
-        organization = Organization.objects.create(
+        # Create organization on a unique subdomain (reuse method from
+        # RegistrationSerializer) and link via membership
+        organization = RegistrationSerializer()._create_organization(
+            first_name,
+            last_name,
+            preferred_subdomain,
             name=organization_name,
-            slug=subdomain,  # Use subdomain as slug as well
-            sub_domain=subdomain,
             creator_email=email,
             creator_name=f"{first_name} {last_name}".strip(),
             created_by=user,
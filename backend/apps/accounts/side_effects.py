@@ -0,0 +1,22 @@
+"""
+Post-commit side effects for account flows (see apps.core.side_effects).
+"""
+
+import logging
+
+from apps.core.side_effects import side_effect
+
+logger = logging.getLogger(__name__)
+
+
+@side_effect
+def send_verification_email(user_id):
+    """Render and queue the email verification message for a new account."""
+    from apps.accounts.models import Account
+
+    user = Account.objects.filter(pk=user_id).first()
+    if user is None:
+        logger.info(f"Skipping verification email for deleted account {user_id}")
+        return
+
+    user.send_verification_email()
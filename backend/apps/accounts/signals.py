@@ -0,0 +1,46 @@
+"""
+Signal handlers keeping account caches coherent with the database.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .cache import AccountCache
+from .models import Account
+from .token_blacklist import blacklist_filter
+
+
+@receiver(post_save, sender=Account)
+def invalidate_account_on_save(sender, instance, **kwargs):
+    """Bump the account version on profile, password or status changes."""
+    user_id = instance.pk
+    AccountCache.invalidate(user_id)
+
+    # Bump again after commit so a concurrent request can't re-cache the
+    # pre-commit row under the new version
+    transaction.on_commit(lambda: AccountCache.invalidate(user_id))
+
+
+@receiver(post_delete, sender=Account)
+def invalidate_account_on_delete(sender, instance, **kwargs):
+    """Bump the account version when an account is deleted."""
+    # delete() clears instance.pk before on_commit callbacks run
+    user_id = instance.pk
+    AccountCache.invalidate(user_id)
+    transaction.on_commit(lambda: AccountCache.invalidate(user_id))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def add_blacklisted_token_to_filter(sender, instance, created, **kwargs):
+    """Set the token's Bloom filter bits before the blacklist row commits."""
+    if not created:
+        return
+
+    jti = instance.token.jti
+    blacklist_filter.add(jti)
+
+    # Add again after commit in case a filter rebuild replaced the bitmap
+    # while this transaction was open
+    transaction.on_commit(lambda: blacklist_filter.add(jti))
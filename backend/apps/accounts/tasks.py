@@ -9,12 +9,30 @@ from celery import shared_task
 from django.utils import timezone
 
 from apps.accounts.models import Account
+from apps.accounts.token_blacklist import blacklist_filter
+from apps.core.batch_jobs import BatchJob, run_batch_job
 
 logger = logging.getLogger(__name__)
 
 
+class UnverifiedAccountCleanup(BatchJob):
+    """Delete pending, unverified accounts older than 24 hours."""
+
+    name = "accounts.cleanup_unverified_accounts"
+
+    def get_params(self):
+        return {"cutoff": timezone.now() - timedelta(hours=24)}
+
+    def get_queryset(self):
+        return Account.objects.filter(
+            status="PENDING",
+            is_email_verified=False,
+            created_at__lt=self.params["cutoff"],
+        )
+
+
 @shared_task(bind=True, max_retries=3)
-def cleanup_unverified_accounts(self):
+def cleanup_unverified_accounts(self, batch_size=500):
     """
     Delete unverified accounts that are older than 24 hours.
 
@@ -25,36 +43,89 @@ def cleanup_unverified_accounts(self):
     - is_email_verified = False
     - created_at < 24 hours ago
 
+    Accounts are deleted in keyset-ordered batches with a checkpoint (see
+    apps.core.batch_jobs), so retried or continued runs resume where the
+    previous one stopped, with the same cutoff. Accounts verified mid-run
+    are kept.
+
+    Args:
+        batch_size: Number of accounts deleted per transaction
+
     Returns:
         str: Summary of deleted accounts
     """
     try:
-        cutoff = timezone.now() - timedelta(hours=24)
-
-        # Find accounts to delete
-        accounts_to_delete = Account.objects.filter(
-            status='PENDING',
-            is_email_verified=False,
-            created_at__lt=cutoff
+        result = run_batch_job(
+            self, UnverifiedAccountCleanup(batch_size=batch_size), batch_size=batch_size
         )
+        deleted = result.processed
 
-        # Log for monitoring
-        count = accounts_to_delete.count()
-        emails = list(accounts_to_delete.values_list('email', flat=True))
-
-        logger.info(f"Cleanup task: Found {count} unverified accounts to delete")
+        if deleted:
+            logger.info(
+                f"Cleanup task: Successfully deleted {deleted} unverified accounts"
+            )
+            return f"Deleted {deleted} unverified accounts"
 
-        if count > 0:
-            # Delete accounts (this will cascade delete related objects)
-            accounts_to_delete.delete()
-
-            logger.info(f"Cleanup task: Successfully deleted {count} unverified accounts")
-            return f"Deleted {count} unverified accounts: {', '.join(emails)}"
-        else:
-            logger.info("Cleanup task: No unverified accounts to delete")
-            return "No unverified accounts to delete"
+        logger.info("Cleanup task: No unverified accounts to delete")
+        return "No unverified accounts to delete"
 
     except Exception as exc:
         logger.error(f"Cleanup task failed: {str(exc)}")
-        # Retry with exponential backoff
+        # Retry with exponential backoff; the checkpoint is kept for resuming
         raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
+
+
+@shared_task(bind=True, max_retries=3)
+def prune_token_blacklist(self, batch_size=1000):
+    """
+    Delete expired outstanding tokens (and their blacklist entries) in batches.
+
+    Runs daily at 3 AM via Celery Beat. Expired tokens fail signature
+    validation anyway, so their rows only slow down blacklist checks. Each
+    batch is a short DELETE by primary key; the blacklist rows go with them
+    through the cascade. The Bloom filter is rebuilt afterwards so pruned
+    tokens stop counting towards its false-positive rate.
+
+    Args:
+        batch_size: Number of tokens deleted per statement
+
+    Returns:
+        str: Summary of pruned tokens
+    """
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    try:
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by("pk")
+
+        pruned = 0
+        while True:
+            batch = list(expired.values_list("pk", flat=True)[:batch_size])
+            if not batch:
+                break
+            OutstandingToken.objects.filter(pk__in=batch).delete()
+            pruned += len(batch)
+
+        logger.info(f"Token prune task: Deleted {pruned} expired tokens")
+
+        blacklist_filter.rebuild()
+        return f"Pruned {pruned} expired tokens"
+
+    except Exception as exc:
+        logger.error(f"Token prune task failed: {str(exc)}")
+        raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
+
+
+@shared_task
+def rebuild_token_blacklist_filter():
+    """
+    Rebuild the token blacklist Bloom filter's shared bitmap.
+
+    Queued by the filter when it finds the bitmap missing or stale; a
+    rebuild already running elsewhere holds the lock, making this a no-op.
+
+    Returns:
+        str: Summary of the rebuilt filter
+    """
+    count = blacklist_filter.rebuild()
+    return f"Rebuilt token blacklist filter with {count} tokens"
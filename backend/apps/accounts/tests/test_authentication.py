@@ -0,0 +1,121 @@
+"""
+Tests for the cached JWT authentication user loader.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.accounts.authentication import CachedJWTAuthentication
+from apps.accounts.cache import AccountCache
+from apps.accounts.models import Account
+from apps.accounts.tests.factories import AccountFactory
+
+
+def authenticate(user):
+    """Authenticate a request carrying a fresh access token for user."""
+    token = AccessToken.for_user(user)
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return CachedJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestCachedJWTAuthentication:
+    """Test users are loaded through the versioned account cache."""
+
+    def test_warm_authentication_issues_no_queries(self):
+        """Test repeat requests authenticate without touching the database."""
+        user = AccountFactory()
+        authenticate(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticated_user, _ = authenticate(user)
+
+        assert len(queries) == 0
+        assert authenticated_user == user
+        assert isinstance(authenticated_user, Account)
+
+    def test_projection_serves_permission_fields(self):
+        """Test permission-layer fields are available without a query."""
+        user = AccountFactory(is_staff=True, is_email_verified=True)
+        authenticate(user)
+
+        authenticated_user, _ = authenticate(user)
+        with CaptureQueriesContext(connection) as queries:
+            assert authenticated_user.is_authenticated
+            assert authenticated_user.is_staff
+            assert not authenticated_user.is_superuser
+            assert authenticated_user.is_email_verified
+            assert authenticated_user.email == user.email
+
+        assert len(queries) == 0
+
+    def test_deferred_fields_load_together(self):
+        """Test profile fields load lazily in a single query."""
+        user = AccountFactory(first_name="Ada", last_name="Lovelace", bio="Notes")
+        authenticated_user, _ = authenticate(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert authenticated_user.first_name == "Ada"
+            assert authenticated_user.last_name == "Lovelace"
+            assert authenticated_user.bio == "Notes"
+
+        assert len(queries) == 1
+
+    def test_save_invalidates_cached_user(self):
+        """Test profile and status changes are visible on the next request."""
+        user = AccountFactory()
+        authenticate(user)
+
+        user.is_staff = True
+        user.save()
+
+        authenticated_user, _ = authenticate(user)
+        assert authenticated_user.is_staff
+
+    def test_deactivated_user_is_rejected(self):
+        """Test deactivation takes effect despite a warm cache."""
+        user = AccountFactory()
+        authenticate(user)
+
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        with pytest.raises(AuthenticationFailed):
+            authenticate(user)
+
+    def test_password_change_invalidates(self):
+        """Test set_password() + save() bumps the account version."""
+        user = AccountFactory()
+        version = AccountCache.get_version(user.pk)
+
+        user.set_password("N3w-Secure-Passw0rd!")
+        user.save()
+
+        assert AccountCache.get_version(user.pk) != version
+
+    def test_deleted_user_is_rejected(self):
+        """Test tokens for deleted accounts stop authenticating."""
+        user = AccountFactory()
+        token = AccessToken.for_user(user)
+        AccountCache.get_user(user.pk)
+
+        Account.objects.filter(pk=user.pk).delete()
+
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        with pytest.raises(AuthenticationFailed):
+            CachedJWTAuthentication().authenticate(request)
+
+    def test_api_request_authenticates(self):
+        """Test the class is wired into DRF's default authentication."""
+        user = AccountFactory()
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+        response = client.get("/api/v1/accounts/users/me/")
+
+        assert response.status_code == 200
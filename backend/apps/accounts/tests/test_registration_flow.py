@@ -3,8 +3,12 @@ Comprehensive test cases for user registration flows.
 Tests registration with and without organization details, including all edge cases.
 """
 
+from unittest.mock import patch
+
 import pytest
 from django.core import mail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from freezegun import freeze_time
@@ -12,8 +16,10 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from apps.accounts.models import Account
+from apps.accounts.serializers import RegistrationSerializer
 from apps.accounts.tests.factories import AccountFactory
 from apps.organizations.models import Organization, OrganizationMembership
+from apps.organizations.tests.factories import OrganizationFactory
 
 
 @pytest.mark.django_db
@@ -565,3 +571,59 @@ class TestRegistrationWithCustomOrganization:
                 if "organization_name" in issue.get("path", [])
             ]
             assert len(org_name_issues) > 0
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestSubdomainAllocation:
+    """Test set-based subdomain allocation for new organizations."""
+
+    def create_orgs(self, *subdomains):
+        for subdomain in subdomains:
+            OrganizationFactory(sub_domain=subdomain, slug=subdomain)
+
+    def test_allocation_uses_one_query(self):
+        """Test a busy name costs a single query regardless of collisions."""
+        self.create_orgs("john-smith", *(f"john-smith-{i}" for i in range(1, 30)))
+
+        with CaptureQueriesContext(connection) as queries:
+            subdomain = RegistrationSerializer()._generate_unique_subdomain(
+                "John", "Smith"
+            )
+
+        assert subdomain == "john-smith-30"
+        assert len(queries) == 1
+
+    def test_smallest_gap_is_reused(self):
+        """Test freed suffixes are handed out before new ones."""
+        self.create_orgs("john-smith", "john-smith-1", "john-smith-3")
+
+        subdomain = RegistrationSerializer()._generate_unique_subdomain("John", "Smith")
+
+        assert subdomain == "john-smith-2"
+
+    def test_unrelated_prefix_matches_are_ignored(self):
+        """Test only base and base-N subdomains count as taken."""
+        self.create_orgs("john-smithson", "john-smith-co")
+
+        subdomain = RegistrationSerializer()._generate_unique_subdomain("John", "Smith")
+
+        assert subdomain == "john-smith"
+
+    def test_insert_collision_retries_next_gap(self):
+        """Test losing an insert race retries instead of failing."""
+        self.create_orgs("john-smith")
+        serializer = RegistrationSerializer()
+
+        # Simulate a concurrent registration committing between query and insert
+        with patch.object(
+            RegistrationSerializer,
+            "_taken_subdomains",
+            side_effect=[set(), {"john-smith"}],
+        ):
+            organization = serializer._create_organization(
+                "John", "Smith", name="John Smith", creator_email="j@example.com"
+            )
+
+        assert organization.sub_domain == "john-smith-1"
+        assert organization.slug == "john-smith-1"
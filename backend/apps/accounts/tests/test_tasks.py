@@ -0,0 +1,81 @@
+"""
+Tests for account maintenance tasks.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.accounts.tasks import (
+    UnverifiedAccountCleanup,
+    cleanup_unverified_accounts,
+)
+from apps.accounts.tests.factories import AccountFactory
+
+
+def create_unverified(count, age=timedelta(days=2)):
+    """Create pending, unverified accounts older than the cleanup cutoff."""
+    accounts = [
+        AccountFactory(status="PENDING", is_email_verified=False) for _ in range(count)
+    ]
+    Account.objects.filter(pk__in=[a.pk for a in accounts]).update(
+        created_at=timezone.now() - age
+    )
+    return accounts
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestCleanupUnverifiedAccounts:
+    """Test chunked cleanup of unverified accounts."""
+
+    def test_deletes_in_batches_and_reports_counts(self):
+        """Test stale accounts are removed batch by batch with a count summary."""
+        stale = create_unverified(5)
+        verified = create_unverified(1)[0]
+        Account.objects.filter(pk=verified.pk).update(is_email_verified=True)
+        recent = create_unverified(1, age=timedelta(hours=1))[0]
+
+        result = cleanup_unverified_accounts.apply(kwargs={"batch_size": 2}).get()
+
+        assert result == "Deleted 5 unverified accounts"
+        assert not Account.objects.filter(pk__in=[a.pk for a in stale]).exists()
+        assert Account.objects.filter(pk__in=[verified.pk, recent.pk]).count() == 2
+        assert cache.get(UnverifiedAccountCleanup().checkpoint_key) is None
+
+    def test_resumes_from_checkpoint(self):
+        """Test a failed run resumes after the last deleted batch."""
+        create_unverified(5)
+        delete = QuerySet.delete
+        calls = []
+
+        def fail_on_third_batch(queryset):
+            calls.append(queryset)
+            if len(calls) == 3:
+                raise RuntimeError("worker lost")
+            return delete(queryset)
+
+        with patch.object(
+            QuerySet, "delete", autospec=True, side_effect=fail_on_third_batch
+        ):
+            with pytest.raises(RuntimeError):
+                cleanup_unverified_accounts.run(batch_size=2)
+
+        checkpoint = cache.get(UnverifiedAccountCleanup().checkpoint_key)
+        assert checkpoint["processed"] == 4
+
+        result = cleanup_unverified_accounts.apply(kwargs={"batch_size": 2}).get()
+
+        assert result == "Deleted 5 unverified accounts"
+        assert not Account.objects.filter(status="PENDING").exists()
+
+    def test_nothing_to_delete(self):
+        """Test an empty run reports that nothing was deleted."""
+        result = cleanup_unverified_accounts.apply().get()
+
+        assert result == "No unverified accounts to delete"
@@ -0,0 +1,280 @@
+"""
+Tests for the Bloom filter in front of the token blacklist.
+"""
+
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from apps.accounts.tasks import prune_token_blacklist
+from apps.accounts.tests.factories import AccountFactory
+from apps.accounts.token_blacklist import (
+    BloomFilter,
+    RedisBitmapStore,
+    TokenBlacklistFilter,
+    blacklist_filter,
+)
+from apps.accounts.tokens import RefreshToken
+
+
+class CacheBitmapStore(RedisBitmapStore):
+    """
+    The Redis store's state kept in the Django cache.
+
+    Read-modify-write on the bitmap is only safe within one process, which
+    is all the tests need.
+    """
+
+    def __init__(self):
+        super().__init__(client=None)
+
+    def state(self) -> tuple[bool, int | None]:
+        values = cache.get_many([self.ready_key, self.generation_key])
+        return self.ready_key in values, values.get(self.generation_key)
+
+    def load(self) -> bytes | None:
+        return cache.get(self.bitmap_key)
+
+    def set_positions(self, positions) -> None:
+        data = bytearray(cache.get(self.bitmap_key) or b"")
+        for position in positions:
+            if len(data) <= position >> 3:
+                data.extend(bytes((position >> 3) + 1 - len(data)))
+            data[position >> 3] |= 0x80 >> (position & 7)
+        cache.set(self.bitmap_key, bytes(data), None)
+        cache.set(self.generation_key, (cache.get(self.generation_key) or 0) + 1, None)
+
+    def test_positions(self, positions) -> tuple[int, bool]:
+        data = cache.get(self.bitmap_key) or b""
+        return len(data), all(
+            p >> 3 < len(data) and data[p >> 3] & (0x80 >> (p & 7)) for p in positions
+        )
+
+    def replace(self, data: bytes) -> None:
+        cache.set_many(
+            {
+                self.bitmap_key: data,
+                self.generation_key: time.time_ns(),
+                self.ready_key: 1,
+            },
+            None,
+        )
+
+    def mark_stale(self) -> None:
+        cache.delete(self.ready_key)
+
+    def acquire_lock(self, timeout: int) -> bool:
+        return cache.add(self.lock_key, 1, timeout)
+
+    def release_lock(self) -> None:
+        cache.delete(self.lock_key)
+
+
+@pytest.fixture
+def cache_bitmap_store(monkeypatch):
+    """Back every filter with one bitmap in the test cache, like Redis would."""
+    store = CacheBitmapStore()
+    monkeypatch.setattr(TokenBlacklistFilter, "_get_store", lambda self: store)
+    blacklist_filter.reset()
+    yield store
+    blacklist_filter.reset()
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Test the bit-level Bloom filter."""
+
+    def test_added_values_are_found(self):
+        """Test there are no false negatives."""
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        values = [f"jti-{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+
+        assert all(value in bloom for value in values)
+
+    def test_false_positive_rate_is_bounded(self):
+        """Test unknown values are mostly rejected at capacity."""
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        assert false_positives < 300
+
+    def test_bit_order_matches_redis(self):
+        """Test bit 0 is the most significant bit of the first byte."""
+        bloom = BloomFilter(16, 1)
+        bloom.set_positions([0, 9])
+
+        assert bloom.to_bytes() == bytes([0x80, 0x40])
+
+    def test_round_trip_through_bytes(self):
+        """Test a filter rebuilt from its bytes answers identically."""
+        bloom = BloomFilter.for_capacity(100, 0.01)
+        bloom.add("jti-1")
+
+        copy = BloomFilter(bloom.size, bloom.hash_count, bloom.to_bytes())
+
+        assert "jti-1" in copy
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.usefixtures("cache_bitmap_store")
+class TestTokenBlacklistFilter:
+    """Test refresh token blacklist checks go through the filter."""
+
+    def test_unblacklisted_token_skips_blacklist_query(self):
+        """Test decoding a valid refresh token doesn't query the blacklist."""
+        token = str(RefreshToken.for_user(AccountFactory()))
+        RefreshToken(token)
+
+        with CaptureQueriesContext(connection) as queries:
+            RefreshToken(token)
+
+        assert len(queries) == 0
+
+    def test_blacklisted_token_is_rejected(self):
+        """Test blacklisted tokens still fail verification."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        token = str(refresh)
+        RefreshToken(token)
+
+        refresh.blacklist()
+
+        with pytest.raises(TokenError):
+            RefreshToken(token)
+
+    def test_other_process_sees_blacklisting(self):
+        """Test a filter with a warm local copy picks up new additions."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        jti = refresh["jti"]
+        other_process = TokenBlacklistFilter()
+        assert other_process.might_contain(jti) is True  # builds the bitmap
+        assert other_process.might_contain(jti) is False
+
+        refresh.blacklist()
+
+        assert other_process.might_contain(jti) is True
+
+    def test_missing_bitmap_answers_maybe(self):
+        """Test an evicted bitmap never yields a false negative."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        refresh.blacklist()
+        blacklist_filter.might_contain("warm-up")
+
+        cache.delete(CacheBitmapStore().bitmap_key)
+        blacklist_filter._filter = None
+
+        assert blacklist_filter.might_contain(refresh["jti"]) is True
+
+    def test_missing_bitmap_is_rebuilt_in_the_background(self, monkeypatch):
+        """Test lookups answer maybe and queue one rebuild while it runs."""
+        queued = []
+        monkeypatch.setattr(
+            "apps.accounts.tasks.rebuild_token_blacklist_filter.delay",
+            lambda: queued.append(True),
+        )
+
+        assert blacklist_filter.might_contain("one") is True
+        assert blacklist_filter.might_contain("two") is True
+
+        assert queued == [True]
+
+    def test_rebuild_keeps_tokens_blacklisted_during_the_scan(
+        self, cache_bitmap_store, monkeypatch
+    ):
+        """Test the new bitmap holds recent tokens once it is marked ready."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        refresh.blacklist()
+        seen_at_replace = []
+        replace = cache_bitmap_store.replace
+
+        def check_replace(data):
+            bloom = BloomFilter(
+                blacklist_filter._template.size,
+                blacklist_filter._template.hash_count,
+                data,
+            )
+            seen_at_replace.append(refresh["jti"] in bloom)
+            replace(data)
+
+        monkeypatch.setattr(cache_bitmap_store, "replace", check_replace)
+        # Expired meanwhile: only the catch-up pass over recent tokens has it
+        OutstandingToken.objects.update(expires_at=timezone.now())
+
+        blacklist_filter.rebuild()
+
+        assert seen_at_replace == [True]
+
+    def test_disabled_filter_always_checks_database(self, settings):
+        """Test the filter can be switched off."""
+        settings.TOKEN_BLACKLIST_FILTER = {"ENABLED": False}
+
+        assert blacklist_filter.might_contain("anything") is True
+
+    def test_rebuild_includes_existing_blacklist(self):
+        """Test rebuilding reloads blacklisted tokens from the database."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        refresh.blacklist()
+
+        assert blacklist_filter.rebuild() == 1
+        assert blacklist_filter.might_contain(refresh["jti"]) is True
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestTokenBlacklistStore:
+    """Test the filter only trusts stores shared between processes."""
+
+    def test_process_local_cache_always_checks_database(self):
+        """Test a LocMemCache default isn't trusted to share the bitmap."""
+        refresh = RefreshToken.for_user(AccountFactory())
+        token = str(refresh)
+        refresh.blacklist()
+        local_filter = TokenBlacklistFilter()
+
+        assert local_filter._get_store() is None
+        assert local_filter.might_contain("never-blacklisted") is True
+        with pytest.raises(TokenError):
+            RefreshToken(token)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.usefixtures("cache_bitmap_store")
+class TestPruneTokenBlacklist:
+    """Test batched pruning of expired tokens."""
+
+    def test_prunes_expired_tokens_in_batches(self):
+        """Test expired outstanding and blacklisted tokens are removed."""
+        user = AccountFactory()
+        expired_at = timezone.now() - timedelta(days=1)
+        for i in range(5):
+            token = OutstandingToken.objects.create(
+                user=user, jti=f"expired-{i}", token="x", expires_at=expired_at
+            )
+            BlacklistedToken.objects.create(token=token)
+        live = RefreshToken.for_user(user)
+        live.blacklist()
+
+        result = prune_token_blacklist.apply(kwargs={"batch_size": 2}).get()
+
+        assert result == "Pruned 5 expired tokens"
+        assert list(
+            OutstandingToken.objects.filter(user=user).values_list("jti", flat=True)
+        ) == [live["jti"]]
+        assert BlacklistedToken.objects.filter(token__user=user).count() == 1
+        assert blacklist_filter.might_contain(live["jti"]) is True
@@ -0,0 +1,360 @@
+"""
+Bloom filter in front of simplejwt's token blacklist tables.
+
+Decoding a refresh token checks the blacklist with a query, and with
+BLACKLIST_AFTER_ROTATION the blacklist grows with every refresh. Nearly every
+lookup is a miss, which a Bloom filter answers without the database:
+
+- "definitely not blacklisted": no query
+- "maybe blacklisted": fall through to the usual SQL check
+
+The filter bits live in a shared bitmap (a plain Redis string manipulated
+with SETBIT/GETBIT) so additions are visible to every process at once. Each
+process keeps a copy in memory together with the generation counter it was
+read at; while the shared generation is unchanged the local copy is
+authoritative. When it moved, the few bits for the token are read from the
+shared bitmap directly and the copy is re-read at most every
+REFRESH_INTERVAL seconds.
+
+Blacklisting never waits for the filter: a BlacklistedToken post_save signal
+sets the bits before the row is committed. Expired tokens are pruned in
+batches by the prune_token_blacklist task, which then rebuilds the bitmap so
+the false-positive rate stays at its configured level. A missing or stale
+bitmap is rebuilt by the rebuild_token_blacklist_filter task; lookups answer
+"maybe" until it is ready.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.core.cache import cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 200_000
+DEFAULT_ERROR_RATE = 0.001
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Bits are numbered like Redis bit offsets (most significant bit of the
+    first byte is bit 0) so the byte array can be exchanged with a Redis
+    bitmap as-is.
+    """
+
+    def __init__(self, size: int, hash_count: int, data: bytes | None = None):
+        self.size = size
+        self.hash_count = hash_count
+        self.bits = bytearray((size + 7) // 8)
+        if data:
+            self.bits[: len(data)] = data[: len(self.bits)]
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        """Create an empty filter sized for capacity items at error_rate."""
+        size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hash_count = max(1, round(size / capacity * math.log(2)))
+        return cls(size, hash_count)
+
+    def positions(self, value: str) -> list[int]:
+        """Bit positions for a value (double hashing over one blake2b digest)."""
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def set_positions(self, positions) -> None:
+        for position in positions:
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def has_positions(self, positions) -> bool:
+        return all(self.bits[p >> 3] & (0x80 >> (p & 7)) for p in positions)
+
+    def add(self, value: str) -> None:
+        self.set_positions(self.positions(value))
+
+    def __contains__(self, value: str) -> bool:
+        return self.has_positions(self.positions(value))
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.bits)
+
+
+class RedisBitmapStore:
+    """Shared filter state in Redis: bitmap, generation counter and ready flag."""
+
+    def __init__(self, client):
+        self.client = client
+        self.bitmap_key = cache_key("token_blacklist", "bloom")
+        self.generation_key = cache_key("token_blacklist", "bloom", "generation")
+        self.ready_key = cache_key("token_blacklist", "bloom", "ready")
+        self.lock_key = cache_key("token_blacklist", "bloom", "lock")
+
+    def state(self) -> tuple[bool, int | None]:
+        ready, generation = self.client.mget(self.ready_key, self.generation_key)
+        return ready is not None, int(generation) if generation else None
+
+    def load(self) -> bytes | None:
+        return self.client.get(self.bitmap_key)
+
+    def set_positions(self, positions) -> None:
+        pipe = self.client.pipeline()
+        for position in positions:
+            pipe.setbit(self.bitmap_key, position, 1)
+        pipe.incr(self.generation_key)
+        pipe.execute()
+
+    def test_positions(self, positions) -> tuple[int, bool]:
+        """Return (bitmap length, whether every position is set)."""
+        pipe = self.client.pipeline()
+        pipe.strlen(self.bitmap_key)
+        for position in positions:
+            pipe.getbit(self.bitmap_key, position)
+        length, *bits = pipe.execute()
+        return length, all(bits)
+
+    def replace(self, data: bytes) -> None:
+        pipe = self.client.pipeline()
+        pipe.set(self.bitmap_key, data)
+        pipe.set(self.generation_key, time.time_ns())
+        pipe.set(self.ready_key, 1)
+        pipe.execute()
+
+    def mark_stale(self) -> None:
+        self.client.delete(self.ready_key)
+
+    def acquire_lock(self, timeout: int) -> bool:
+        return bool(self.client.set(self.lock_key, 1, nx=True, ex=timeout))
+
+    def release_lock(self) -> None:
+        self.client.delete(self.lock_key)
+
+
+class TokenBlacklistFilter:
+    """
+    Process-wide "might this JTI be blacklisted?" oracle.
+
+    Every failure mode answers "maybe", so the worst case is the plain SQL
+    check simplejwt would have done anyway.
+    """
+
+    REFRESH_INTERVAL = 60  # seconds between full re-reads of the bitmap
+    LOCK_TIMEOUT = 300  # seconds a rebuild may hold the lock
+    REBUILD_MARGIN = timedelta(minutes=5)  # catch-up window for rebuilds
+    REBUILD_RETRY = 60  # seconds between rebuild requests from one process
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Re-read settings and drop the local copy."""
+        config = getattr(settings, "TOKEN_BLACKLIST_FILTER", {})
+        self.enabled = config.get("ENABLED", True)
+        self.capacity = config.get("CAPACITY", DEFAULT_CAPACITY)
+        self.error_rate = config.get("ERROR_RATE", DEFAULT_ERROR_RATE)
+        self._template = BloomFilter.for_capacity(self.capacity, self.error_rate)
+        self._store = None
+        self._filter = None
+        self._generation = None
+        self._loaded_at = 0.0
+        self._rebuild_requested_at = None
+
+    def _get_store(self):
+        """
+        Pick the shared store matching the default cache backend.
+
+        Only Redis is supported. Process-local caches (LocMemCache) would hide
+        additions from other processes, and other shared caches lack atomic
+        bit operations, so both answer "maybe" and keep the SQL check.
+        """
+        if self._store is None:
+            backend = settings.CACHES["default"]["BACKEND"]
+            if backend.startswith("django_redis."):
+                from django_redis import get_redis_connection
+
+                self._store = RedisBitmapStore(get_redis_connection("default"))
+            else:
+                self._store = False
+        return self._store or None
+
+    def might_contain(self, jti: str) -> bool:
+        """
+        Check whether a JTI may be blacklisted.
+
+        Returns:
+            False only if the token is definitely not blacklisted
+        """
+        if not self.enabled:
+            return True
+
+        try:
+            store = self._get_store()
+            if store is None:
+                return True
+
+            ready, generation = store.state()
+            if not ready:
+                self._request_rebuild()
+                return True
+
+            positions = self._template.positions(jti)
+            local = self._get_local_filter(store, generation)
+            if local.has_positions(positions):
+                return True
+            if generation == self._generation:
+                return False
+
+            # Tokens were blacklisted since our copy was read
+            length, found = store.test_positions(positions)
+            self._check_length(store, length)
+            return found
+        except Exception as e:
+            logger.warning(f"Token blacklist filter unavailable: {e}")
+            return True
+
+    def _request_rebuild(self) -> None:
+        """
+        Queue a rebuild of a missing or stale bitmap, at most every
+        REBUILD_RETRY seconds per process. The rebuild lock dedupes the
+        tasks queued by different processes.
+        """
+        from apps.accounts.tasks import rebuild_token_blacklist_filter
+
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._rebuild_requested_at is not None
+                and now - self._rebuild_requested_at < self.REBUILD_RETRY
+            ):
+                return
+            self._rebuild_requested_at = now
+
+        rebuild_token_blacklist_filter.delay()
+
+    def _get_local_filter(self, store, generation) -> BloomFilter:
+        """Return the in-process copy, re-reading it when stale."""
+        with self._lock:
+            stale = self._filter is None or (
+                generation != self._generation
+                and time.monotonic() - self._loaded_at >= self.REFRESH_INTERVAL
+            )
+            if stale:
+                # generation was read before the bitmap, so the copy holds at
+                # least every bit written up to that generation
+                data = store.load() or b""
+                self._check_length(store, len(data))
+                self._filter = BloomFilter(
+                    self._template.size, self._template.hash_count, data
+                )
+                self._generation = generation
+                self._loaded_at = time.monotonic()
+            return self._filter
+
+    def _check_length(self, store, length: int) -> None:
+        """
+        Refuse a bitmap shorter than the filter.
+
+        rebuild() always writes the full length, so a short bitmap means it
+        was evicted (and possibly recreated by SETBIT) and has lost bits.
+        """
+        if length < len(self._template.bits):
+            store.mark_stale()
+            raise RuntimeError("token blacklist bitmap is missing or truncated")
+
+    def add(self, jti: str) -> None:
+        """Record a blacklisted JTI in the local copy and the shared bitmap."""
+        if not self.enabled:
+            return
+
+        positions = self._template.positions(jti)
+        with self._lock:
+            if self._filter is not None:
+                self._filter.set_positions(positions)
+
+        store = self._get_store()
+        if store is None:
+            return
+
+        try:
+            store.set_positions(positions)
+        except Exception as e:
+            logger.error(f"Failed to add token to blacklist filter: {e}")
+            try:
+                # Force a rebuild rather than risk a false negative
+                store.mark_stale()
+            except Exception:
+                pass
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the shared bitmap from the unexpired blacklisted tokens.
+
+        Returns:
+            Number of tokens in the rebuilt filter (0 if another process is
+            already rebuilding)
+        """
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        store = self._get_store()
+        if store is None or not store.acquire_lock(self.LOCK_TIMEOUT):
+            return 0
+
+        try:
+            now = timezone.now()
+            since = now - self.REBUILD_MARGIN
+            bloom = BloomFilter(self._template.size, self._template.hash_count)
+
+            jtis = (
+                BlacklistedToken.objects.filter(token__expires_at__gt=now)
+                .values_list("token__jti", flat=True)
+                .iterator(chunk_size=2000)
+            )
+            count = 0
+            for jti in jtis:
+                bloom.add(jti)
+                count += 1
+
+            # Tokens blacklisted while we were scanning may have set their bits
+            # in the old bitmap only. Add them before the new bitmap is marked
+            # ready, so no process can read it without them
+            recent = BlacklistedToken.objects.filter(
+                blacklisted_at__gte=since
+            ).values_list("token__jti", flat=True)
+            for jti in recent:
+                bloom.add(jti)
+
+            store.replace(bloom.to_bytes())
+
+            # and again for those blacklisted since, which may have set their
+            # bits just before the replace
+            for jti in recent.all():
+                store.set_positions(self._template.positions(jti))
+
+            with self._lock:
+                self._filter = None
+
+            logger.info(f"Rebuilt token blacklist filter with {count} tokens")
+            return count
+        finally:
+            store.release_lock()
+
+
+blacklist_filter = TokenBlacklistFilter()
+
+
+@receiver(setting_changed)
+def _reset_blacklist_filter(*, setting, **kwargs):
+    if setting in {"TOKEN_BLACKLIST_FILTER", "CACHES"}:
+        blacklist_filter.reset()
@@ -0,0 +1,20 @@
+"""
+JWT token classes.
+"""
+
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+from apps.accounts.token_blacklist import blacklist_filter
+
+
+class RefreshToken(BaseRefreshToken):
+    """
+    Refresh token whose blacklist check goes through the Bloom filter.
+
+    Only JTIs the filter can't rule out reach the blacklist tables.
+    """
+
+    def check_blacklist(self) -> None:
+        if blacklist_filter.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
@@ -7,7 +7,6 @@ from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import permissions, serializers, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.accounts.models import Account
 from apps.accounts.serializers import (
@@ -18,6 +17,7 @@ from apps.accounts.serializers import (
     SocialLoginSerializer,
     SocialRegistrationSerializer,
 )
+from apps.accounts.tokens import RefreshToken
 from apps.core.audit.models import AuditAction
 from apps.core.audit.utils import log_authentication_event
 from apps.core.codes import APIResponseCodes
@@ -53,62 +53,72 @@ def add_custom_claims(access_token, user):
     """
     from django.conf import settings
 
+    from apps.organizations.cache import MembershipCache
+    from apps.organizations.claims import MEMBERSHIP_VERSION_CLAIM
+
     # Basic user info
     access_token["email"] = user.email
     access_token["is_email_verified"] = user.is_email_verified
 
+    # Read the version before memberships so a concurrent change makes the
+    # claims stale rather than silently missing from them
+    access_token[MEMBERSHIP_VERSION_CLAIM] = MembershipCache.get_version(user.pk)
+
     # Check if Global Mode is enabled
     is_global_mode = getattr(settings, "GLOBAL_MODE_ENABLED", False)
 
     if is_global_mode:
-        # Global Mode: Use platform organization
-        from apps.organizations.models import Organization
+        # Global Mode: Use the pinned platform organization
+        from apps.organizations.cache import PlatformOrganizationCache
 
         global_org_slug = getattr(settings, "GLOBAL_SCOPE_ORG_SLUG", "platform")
-        try:
-            primary_org = Organization.objects.get(slug=global_org_slug)
+        primary_org = PlatformOrganizationCache.get(global_org_slug)
+
+        if primary_org is not None:
             membership = user.get_membership_in(primary_org)
+            is_active = membership is not None and membership.status == "active"
 
-            # Set organization context
+            # Set organization context. Users without a membership get the
+            # member defaults the tenant middleware grants on first request;
+            # suspended or pending members get none.
             access_token["primary_organization_id"] = str(primary_org.id)
-            access_token["organization_role"] = (
-                membership.role if membership else "member"
-            )
-            access_token["permissions"] = (
-                membership.get_permissions() if membership else ["view_organization"]
+            if is_active:
+                access_token["organization_role"] = membership.role
+                access_token["permissions"] = membership.get_permissions()
+            elif membership is None:
+                access_token["organization_role"] = "member"
+                access_token["permissions"] = ["view_organization"]
+            else:
+                access_token["organization_role"] = None
+                access_token["permissions"] = []
+
+            # In global mode, organizations list contains only platform org.
+            # It authorizes requests (apps.organizations.claims), so only an
+            # active membership is written; others resolve from the database.
+            access_token["organizations"] = (
+                [
+                    {
+                        "id": str(primary_org.id),
+                        "slug": primary_org.slug,
+                        "role": membership.role,
+                    }
+                ]
+                if is_active
+                else []
             )
-
-            # In global mode, organizations list contains only platform org
-            access_token["organizations"] = [
-                {
-                    "id": str(primary_org.id),
-                    "slug": primary_org.slug,
-                    "role": membership.role if membership else "member",
-                }
-            ]
-        except Organization.DoesNotExist:
+        else:
             # Fallback if platform org not found
             access_token["primary_organization_id"] = None
             access_token["organization_role"] = None
             access_token["permissions"] = []
             access_token["organizations"] = []
     else:
-        # Multi-Tenant Mode: Use user's primary organization
-        primary_org = user.get_primary_organization()
-        membership = user.get_membership_in(primary_org) if primary_org else None
-
-        # Organization context
-        access_token["primary_organization_id"] = (
-            str(primary_org.id) if primary_org else None
-        )
-        access_token["organization_role"] = membership.role if membership else None
-        access_token["permissions"] = membership.get_permissions() if membership else []
+        # Multi-Tenant Mode: primary org, role, permissions and the org list
+        # come from one query over active memberships (cached per user)
+        from apps.organizations.claims import build_tenant_claims
 
-        # All organizations user belongs to (for org switching)
-        access_token["organizations"] = [
-            {"id": str(m.organization.id), "slug": m.organization.slug, "role": m.role}
-            for m in user.get_active_memberships()
-        ]
+        for claim, value in build_tenant_claims(user).items():
+            access_token[claim] = value
 
 
 def convert_serializer_errors_to_rfc7807(serializer_errors):
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BillingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.billing"
+
+    def ready(self):
+        """Connect cached response invalidation signal handlers."""
+        from . import signals  # noqa: F401
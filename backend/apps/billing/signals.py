@@ -0,0 +1,49 @@
+"""
+Signal handlers invalidating cached plan responses.
+
+Plan listings are served through apps.core.conditional with a version stamp
+per organization; global plans (no organization) invalidate every tenant.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.core.conditional import bump_resource_version
+
+from .models import Plan
+
+
+def bump_plans_version(*organization_ids):
+    def bump():
+        for organization_id in set(organization_ids):
+            bump_resource_version("plans", organization_id)
+
+    bump()
+    # Again after commit, so a concurrent request can't cache pre-commit rows
+    transaction.on_commit(bump)
+
+
+@receiver(pre_save, sender=Plan)
+def remember_plan_organization(sender, instance, **kwargs):
+    """Capture the stored organization so moved plans invalidate both tenants."""
+    instance._previous_organization_ids = ()
+    if instance.pk and not instance._state.adding:
+        instance._previous_organization_ids = tuple(
+            Plan.objects.filter(pk=instance.pk).values_list(
+                "organization_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=Plan)
+def invalidate_plans_on_save(sender, instance, **kwargs):
+    """Invalidate plan responses when a plan is created or updated."""
+    previous = getattr(instance, "_previous_organization_ids", ())
+    bump_plans_version(instance.organization_id, *previous)
+
+
+@receiver(post_delete, sender=Plan)
+def invalidate_plans_on_delete(sender, instance, **kwargs):
+    """Invalidate plan responses when a plan is deleted."""
+    bump_plans_version(instance.organization_id)
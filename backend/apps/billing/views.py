@@ -7,6 +7,8 @@ from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.conditional import ConditionalGetMixin
+
 from .models import Invoice, Plan, Subscription
 from .serializers import (
     BillingOverviewSerializer,
@@ -25,10 +27,11 @@ log = logging.getLogger(f"{settings.LOG_APP_PREFIX}.billing.views")
     list=extend_schema(tags=["Billing"]),
     retrieve=extend_schema(tags=["Billing"]),
 )
-class PlanViewSet(viewsets.ReadOnlyModelViewSet):
+class PlanViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Plan.objects.filter(is_active=True)
     serializer_class = PlanSerializer
     permission_classes = [permissions.IsAuthenticated]
+    conditional_resource = "plans"
 
     def get_queryset(self):
         """Get plans scoped to the current organization."""
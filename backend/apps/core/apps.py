@@ -6,7 +6,12 @@ class CoreConfig(AppConfig):
     name = "apps.core"
 
     def ready(self):
-        """Initialize the code registry when Django starts up."""
-        from .code_registry import REGISTRY
+        """Precompute the platform capabilities when Django starts up."""
+        from django.utils.module_loading import autodiscover_modules
 
-        REGISTRY.load()
+        from .capabilities import prepare_capabilities
+
+        # The code registry (apps.core.code_registry) loads on first lookup
+        prepare_capabilities()
+        # Register every app's post-commit side effects, so workers know them
+        autodiscover_modules("side_effects")
@@ -4,6 +4,8 @@ Django admin configuration for audit logs.
 
 from django.contrib import admin
 
+from apps.core.counts import CappedCount, CountingPaginator, EstimatedCount
+
 from .models import AuditLog
 
 
@@ -56,6 +58,17 @@ class AuditLogAdmin(admin.ModelAdmin):
     date_hierarchy = "timestamp"
     ordering = ["-timestamp"]
 
+    # The table only grows: estimate the unfiltered total, cap filtered counts
+    count_strategy = EstimatedCount(fallback=CappedCount(limit=10000))
+    show_full_result_count = False
+
+    def get_paginator(
+        self, request, queryset, per_page, orphans=0, allow_empty_first_page=True
+    ):
+        return CountingPaginator(
+            queryset, per_page, count_strategy=self.count_strategy, request=request
+        )
+
     # Prevent modification of audit logs
     def has_add_permission(self, request):
         return False
@@ -6,6 +6,8 @@ import logging
 
 from django.utils.deprecation import MiddlewareMixin
 
+from apps.core.utils.routing import get_route_info
+
 from .models import AuditAction
 from .utils import log_audit_event
 
@@ -46,20 +48,5 @@ class AuditLoggingMiddleware(MiddlewareMixin):
 
     def _should_skip_logging(self, request):
         """Check if we should skip logging for this request."""
-        path = request.path_info
-
-        # Skip static files, admin media, health checks
-        skip_prefixes = [
-            "/static/",
-            "/media/",
-            "/health/",
-            "/ready/",
-            "/__debug__/",
-            "/favicon.ico",
-        ]
-
-        for prefix in skip_prefixes:
-            if path.startswith(prefix):
-                return True
-
-        return False
+        # Static files, admin media and health checks are flagged by the classifier
+        return get_route_info(request).skip_audit_logging
@@ -0,0 +1,237 @@
+"""
+Checkpointed batch jobs for periodic maintenance tasks.
+
+Deleting or updating a whole queryset in one statement holds locks and
+competes for I/O for as long as the statement runs. BatchJob instead walks the
+rows in keyset order and processes them in bounded batches, each in its own
+short transaction:
+
+    class PurgeOldLogs(BatchJob):
+        name = "email_service.purge_old_logs"
+
+        def get_params(self):
+            return {"cutoff": timezone.now() - timedelta(days=90)}
+
+        def get_queryset(self):
+            return EmailLog.objects.filter(created_at__lt=self.params["cutoff"])
+
+    result = PurgeOldLogs(batch_size=1000).run()
+
+After every batch the last key, the running count and the job params are
+checkpointed in the cache. A run that stops early (time budget exhausted,
+worker crash, task retry) resumes from the checkpoint with the same params,
+e.g. the same cutoff. process_batch() re-applies get_queryset() to the batch,
+so processing a batch twice is harmless. Only one run of a job is active at a
+time. run_batch_job() requeues the calling Celery task while work remains.
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from functools import reduce
+from operator import or_
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from apps.core.cache import cache_key
+from apps.core.observability.metrics import record_batch_job_progress
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchJobResult:
+    """Summary of one BatchJob run."""
+
+    job: str
+    processed: int = 0
+    batches: int = 0
+    complete: bool = False
+    resumed: bool = False
+    skipped: bool = False  # another run held the lock
+    elapsed: float = 0.0
+    stats: dict = field(default_factory=dict)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class BatchJob:
+    """
+    Base class for keyset-paginated, checkpointed batch jobs.
+
+    Subclasses set name and implement get_queryset(); process_batch() deletes
+    by default. ordering lists the keyset columns and must end with "pk" so
+    keys are unique. Job-specific counters can be kept in self.stats; they are
+    checkpointed along with the params.
+    """
+
+    name = ""
+    ordering = ("created_at", "pk")
+    batch_size = 500
+    sleep = 0.0  # seconds to pause between batches
+    time_budget = 300  # seconds per run; None for no limit
+
+    # Cache timeouts (in seconds)
+    CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+    LOCK_TIMEOUT = 60 * 60  # 1 hour, for runs without a time budget
+
+    def __init__(self, batch_size=None, sleep=None, time_budget=None):
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if sleep is not None:
+            self.sleep = sleep
+        if time_budget is not None:
+            self.time_budget = time_budget
+        self.params = {}
+        self.stats = {}
+
+    def get_params(self) -> dict:
+        """Parameters fixed for a run and its resumptions (e.g. a cutoff)."""
+        return {}
+
+    def get_queryset(self):
+        """Rows still to be processed; may use self.params."""
+        raise NotImplementedError("Subclasses must implement get_queryset()")
+
+    def process_batch(self, pks) -> int:
+        """
+        Process one batch inside a transaction.
+
+        Args:
+            pks: Primary keys of the batch, in keyset order
+
+        Returns:
+            Number of rows processed
+        """
+        _, per_model = self.get_queryset().filter(pk__in=pks).delete()
+        return per_model.get(self.get_queryset().model._meta.label, 0)
+
+    @property
+    def checkpoint_key(self) -> str:
+        return cache_key("batch_job", self.name, "checkpoint")
+
+    @property
+    def lock_key(self) -> str:
+        return cache_key("batch_job", self.name, "lock")
+
+    def reset(self) -> None:
+        """Discard the checkpoint so the next run starts over."""
+        cache.delete(self.checkpoint_key)
+
+    def run(self) -> BatchJobResult:
+        """Process batches until done, or until the time budget runs out."""
+        result = BatchJobResult(job=self.name)
+        lock_timeout = (
+            self.time_budget + 60 if self.time_budget is not None else self.LOCK_TIMEOUT
+        )
+        if not cache.add(self.lock_key, 1, lock_timeout):
+            logger.info(f"Batch job {self.name}: another run is active, skipping")
+            result.skipped = True
+            return result
+
+        started = time.monotonic()
+        try:
+            checkpoint = cache.get(self.checkpoint_key)
+            if checkpoint:
+                self.params = checkpoint["params"]
+                self.stats = checkpoint["stats"]
+                last_key = checkpoint["last_key"]
+                result.processed = checkpoint["processed"]
+                result.resumed = True
+                logger.info(
+                    f"Batch job {self.name}: resuming after {result.processed} rows"
+                )
+            else:
+                self.params = self.get_params()
+                last_key = None
+
+            while True:
+                keys = self._next_keys(last_key)
+                if not keys:
+                    result.complete = True
+                    break
+
+                with transaction.atomic():
+                    processed = self.process_batch([key[-1] for key in keys])
+                result.processed += processed
+                result.batches += 1
+                last_key = keys[-1]
+                self._save_checkpoint(last_key, result.processed)
+                record_batch_job_progress(self.name, processed)
+
+                if (
+                    self.time_budget is not None
+                    and time.monotonic() - started >= self.time_budget
+                ):
+                    break
+                if self.sleep:
+                    time.sleep(self.sleep)
+
+            if result.complete:
+                self.reset()
+        finally:
+            cache.delete(self.lock_key)
+
+        result.stats = dict(self.stats)
+        result.elapsed = round(time.monotonic() - started, 3)
+        logger.info(
+            f"Batch job {self.name}: processed {result.processed} rows in "
+            f"{result.batches} batches ({result.elapsed}s, "
+            f"{'complete' if result.complete else 'checkpointed'})"
+        )
+        return result
+
+    def _next_keys(self, last_key) -> list:
+        """Fetch the ordering keys of the next batch after last_key."""
+        queryset = self.get_queryset().order_by(*self.ordering)
+        if last_key is not None:
+            queryset = queryset.filter(self._after(last_key))
+        return list(queryset.values_list(*self.ordering)[: self.batch_size])
+
+    def _after(self, key) -> Q:
+        """Keyset condition: (a, b, ...) > (key[0], key[1], ...)."""
+        return reduce(
+            or_,
+            (
+                Q(
+                    **dict(zip(self.ordering[:i], key[:i], strict=True)),
+                    **{f"{self.ordering[i]}__gt": key[i]},
+                )
+                for i in range(len(self.ordering))
+            ),
+        )
+
+    def _save_checkpoint(self, last_key, processed) -> None:
+        cache.set(
+            self.checkpoint_key,
+            {
+                "params": self.params,
+                "stats": self.stats,
+                "last_key": last_key,
+                "processed": processed,
+            },
+            self.CHECKPOINT_TIMEOUT,
+        )
+
+
+def run_batch_job(task, job, countdown=60, **task_kwargs) -> BatchJobResult:
+    """
+    Run a batch job from a Celery task, requeueing it while work remains.
+
+    Args:
+        task: Bound task running the job
+        job: BatchJob instance
+        countdown: Seconds before the continuation runs
+        **task_kwargs: Keyword arguments for the continuation
+
+    Returns:
+        BatchJobResult of this run
+    """
+    result = job.run()
+    if not result.complete and not result.skipped:
+        # The time budget ran out; continue from the checkpoint shortly
+        task.apply_async(kwargs=task_kwargs, countdown=countdown)
+    return result
@@ -2,16 +2,23 @@
 Caching utilities for performance optimization.
 """
 
+from .local import LocalLRUCache, clear_local_caches
 from .utils import (
+    bump_version_stamp,
     cache_key,
     cache_user_permissions,
     cached_property_method,
+    get_version_stamp,
     invalidate_cache,
     invalidate_user_permissions,
 )
 
 __all__ = [
+    "LocalLRUCache",
+    "clear_local_caches",
     "cache_key",
+    "get_version_stamp",
+    "bump_version_stamp",
     "invalidate_cache",
     "cached_property_method",
     "cache_user_permissions",
@@ -0,0 +1,82 @@
+"""
+Bounded in-process LRU cache.
+
+Used as a first tier in front of the shared Django cache for hot lookups that
+run on nearly every request (tenant resolution, memberships). Entries expire
+after a short TTL so that other processes' invalidations are picked up quickly
+even though signals only reach the local process.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+_MISSING = object()
+
+# Every LocalLRUCache registers itself so tests can reset all of them at once
+_registry: "weakref.WeakSet[LocalLRUCache]" = weakref.WeakSet()
+
+
+class LocalLRUCache:
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    Args:
+        maxsize: Maximum number of entries kept in memory
+        timeout: Seconds an entry stays valid (default: 30 seconds)
+    """
+
+    def __init__(self, maxsize: int = 1024, timeout: float = 30):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        _registry.add(self)
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: float | None = None):
+        """Store value under key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+
+def clear_local_caches():
+    """Clear every LocalLRUCache in this process."""
+    for local_cache in list(_registry):
+        local_cache.clear()
@@ -3,6 +3,7 @@ Caching utility functions for performance optimization.
 """
 
 import functools
+import time
 from collections.abc import Callable
 
 from django.conf import settings
@@ -20,6 +21,41 @@ def cache_key(*parts) -> str:
     return f"{prefix}:{':'.join(str(p) for p in parts)}"
 
 
+def get_version_stamp(key: str, timeout: int) -> int:
+    """
+    Get a version stamp used to namespace related cache entries.
+
+    A missing stamp (evicted or never set) is re-seeded from the clock so
+    entries written under an older stamp can never be read again.
+
+    Args:
+        key: Cache key of the stamp
+        timeout: Seconds the stamp is kept
+
+    Returns:
+        Current stamp value
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout)
+        version = cache.get(key) or 0
+    return version
+
+
+def bump_version_stamp(key: str, timeout: int) -> None:
+    """
+    Advance a version stamp, orphaning every entry written under it.
+
+    Args:
+        key: Cache key of the stamp
+        timeout: Seconds the stamp is kept
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout)
+
+
 def invalidate_cache(pattern: str):
     """
     Invalidate cache keys matching a pattern.
@@ -6,15 +6,87 @@ based on the deployment mode (Global Mode vs Multi-Tenant Mode).
 
 Frontend applications query this to conditionally show/hide features like
 organization creation, workspace switching, etc.
+
+The map only depends on settings, so it's computed once (at app ready, and
+again if the settings are overridden in tests) together with the rendered
+body of the capabilities endpoint and its ETag.
 """
 
+import hashlib
+from dataclasses import dataclass
+from types import MappingProxyType
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .renderers import ConsistentDataRenderer
+from .responses import ok
+
+# Settings the capability map is derived from
+CAPABILITY_SETTINGS = ("GLOBAL_MODE_ENABLED", "GLOBAL_SCOPE_ORG_SLUG")
+
+
+@dataclass(frozen=True)
+class CapabilitiesDocument:
+    """The capability map and the endpoint response rendered from it."""
+
+    capabilities: MappingProxyType
+    envelope: MappingProxyType
+    body: bytes
+    content_type: str
+    etag: str
+
+
+_document: CapabilitiesDocument | None = None
+
+
+def prepare_capabilities() -> CapabilitiesDocument:
+    """Compute the capability map and render the endpoint response."""
+    global _document
+
+    capabilities = build_platform_capabilities()
+    envelope = ok(data=dict(capabilities)).data
+    renderer = ConsistentDataRenderer()
+    body = renderer.render(envelope, renderer.media_type)
+    digest = hashlib.sha256(body).hexdigest()[:32]
+
+    _document = CapabilitiesDocument(
+        capabilities=MappingProxyType(capabilities),
+        envelope=MappingProxyType(envelope),
+        body=body,
+        content_type=renderer.media_type,
+        etag=f'"{digest}"',
+    )
+    return _document
+
+
+def get_capabilities_document() -> CapabilitiesDocument:
+    """Get the precomputed capabilities, computing them on first use."""
+    return _document or prepare_capabilities()
+
+
+@receiver(setting_changed)
+def invalidate_capabilities(setting, **kwargs):
+    """Recompute the capabilities when their settings are overridden."""
+    if setting in CAPABILITY_SETTINGS:
+        prepare_capabilities()
 
 
 def get_platform_capabilities():
     """
     Get the platform capability map based on current configuration.
 
+    Returns:
+        dict: Capability map with boolean flags for each feature
+    """
+    return dict(get_capabilities_document().capabilities)
+
+
+def build_platform_capabilities():
+    """
+    Compute the platform capability map from settings.
+
     Returns:
         dict: Capability map with boolean flags for each feature
     """
@@ -0,0 +1,201 @@
+"""
+Batched bottom-up cascade deletion.
+
+QuerySet.delete() runs Django's deletion Collector, which loads every row
+that cascades from the deleted objects into memory (and every row of models
+with delete signals as instances) before deleting anything, all inside one
+transaction. For an organization that means every tenant-scoped row: audit
+logs, email logs, feature access, accounts and everything hanging off them.
+
+BulkCascade deletes the same object graph without that:
+
+    cascade = BulkCascade(batch_size=1000)
+    cascade.delete(Organization.objects.filter(pk=org.pk))
+    cascade.deleted  # Counter of deleted rows per model label
+
+It walks the reverse relations of the model graph (the same candidate
+relations the Collector follows) and, for each batch of parent keys, first
+deletes the CASCADE children in batches of their own, recursively, so leaf
+tables are emptied first. SET_NULL relations are cleared with batched
+UPDATEs, PROTECT relations raise ProtectedError (children protecting a
+sibling are deleted before it), DO_NOTHING is ignored. Every batch runs in
+its own short transaction, and only primary keys are loaded, except for
+models with pre_delete/post_delete receivers, whose instances are loaded one
+batch at a time so the signals still fire.
+
+A deletion interrupted halfway leaves the remaining graph consistent and can
+simply be run again. Models the engine can't handle in bulk (multi-table
+inheritance, generic relations, RESTRICT or SET(...) handlers) fall back to
+the Collector for their batch.
+"""
+
+import logging
+from collections import Counter
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import signals
+from django.db.models.deletion import (
+    CASCADE,
+    DO_NOTHING,
+    PROTECT,
+    SET_NULL,
+    ProtectedError,
+    get_candidate_relations_to_delete,
+)
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_ON_DELETE = (CASCADE, SET_NULL, PROTECT, DO_NOTHING)
+
+
+class BulkCascade:
+    """Delete querysets and everything cascading from them in batches."""
+
+    batch_size = 1000
+
+    def __init__(self, batch_size=None, using=None, on_progress=None):
+        """
+        Args:
+            batch_size: Rows per DELETE/UPDATE statement
+            using: Database alias
+            on_progress: Optional callable(model_label, action, rows) called
+                after every batch, action being "deleted" or "updated"
+        """
+        if batch_size is not None:
+            self.batch_size = batch_size
+        self.using = using or DEFAULT_DB_ALIAS
+        self.on_progress = on_progress
+        self.deleted = Counter()
+        self.updated = Counter()
+
+    def delete(self, queryset) -> int:
+        """
+        Delete the queryset's rows and everything cascading from them.
+
+        Returns:
+            Number of rows of the queryset's model deleted
+        """
+        model = queryset.model
+        queryset = queryset.using(self.using)
+        total = 0
+        while True:
+            pks = list(queryset.values_list("pk", flat=True)[: self.batch_size])
+            if not pks:
+                return total
+            total += self.delete_batch(model, pks)
+
+    def delete_batch(self, model, pks) -> int:
+        """Delete one batch of rows, children first."""
+        relations = self._relations(model)
+        if relations is None:
+            return self._collector_delete(model, pks)
+
+        children = [
+            (field, on_delete, self._children(model, field, pks))
+            for field, on_delete in relations
+        ]
+
+        # Check protection before deleting anything of this batch
+        for field, on_delete, related in children:
+            if on_delete is PROTECT and related.exists():
+                raise ProtectedError(
+                    f"Cannot delete some instances of model "
+                    f"'{model.__name__}' because they are referenced through "
+                    f"protected foreign key '{field.model.__name__}.{field.name}'",
+                    set(related[:10]),
+                )
+
+        for field, on_delete, related in children:
+            if on_delete is CASCADE:
+                self.delete(related)
+            elif on_delete is SET_NULL:
+                self._set_null(related, field)
+
+        return self._delete_rows(model, pks)
+
+    def _relations(self, model):
+        """(field, on_delete) of the relations to handle, or None if unsupported."""
+        opts = model._meta
+        if opts.parents or any(
+            hasattr(field, "bulk_related_objects") for field in opts.private_fields
+        ):
+            return None
+
+        relations = []
+        for relation in get_candidate_relations_to_delete(opts):
+            on_delete = relation.field.remote_field.on_delete
+            if on_delete not in SUPPORTED_ON_DELETE:
+                return None
+            if on_delete is not DO_NOTHING:
+                relations.append((relation.field, on_delete))
+
+        # A sibling protecting another (e.g. a subscription protecting the
+        # plan both belong to the same organization) must be deleted first
+        protected = {
+            field.related_model
+            for child, _ in relations
+            for field in child.model._meta.concrete_fields
+            if field.remote_field and field.remote_field.on_delete is PROTECT
+        }
+        return sorted(relations, key=lambda relation: relation[0].model in protected)
+
+    def _children(self, model, field, pks):
+        related = field.model._base_manager.using(self.using).filter(
+            **{f"{field.name}__pk__in": pks}
+        )
+        if field.model is model:
+            # Rows of the batch referencing each other go with the batch
+            related = related.exclude(pk__in=pks)
+        return related
+
+    def _set_null(self, related, field) -> None:
+        label = related.model._meta.label
+        while True:
+            pks = list(related.values_list("pk", flat=True)[: self.batch_size])
+            if not pks:
+                return
+            with transaction.atomic(using=self.using):
+                rows = (
+                    related.model._base_manager.using(self.using)
+                    .filter(pk__in=pks)
+                    .update(**{field.name: None})
+                )
+            self._report(label, "updated", rows)
+
+    def _delete_rows(self, model, pks) -> int:
+        queryset = model._base_manager.using(self.using).filter(pk__in=pks)
+        send_signals = signals.pre_delete.has_listeners(
+            model
+        ) or signals.post_delete.has_listeners(model)
+
+        with transaction.atomic(using=self.using):
+            instances = list(queryset) if send_signals else []
+            for obj in instances:
+                signals.pre_delete.send(
+                    sender=model, instance=obj, using=self.using, origin=obj
+                )
+            rows = queryset._raw_delete(self.using)
+            for obj in instances:
+                signals.post_delete.send(
+                    sender=model, instance=obj, using=self.using, origin=obj
+                )
+
+        self._report(model._meta.label, "deleted", rows)
+        return rows
+
+    def _collector_delete(self, model, pks) -> int:
+        with transaction.atomic(using=self.using):
+            _, per_model = (
+                model._base_manager.using(self.using).filter(pk__in=pks).delete()
+            )
+        for label, rows in per_model.items():
+            self._report(label, "deleted", rows)
+        return per_model.get(model._meta.label, 0)
+
+    def _report(self, label, action, rows) -> None:
+        if not rows:
+            return
+        getattr(self, action)[label] += rows
+        logger.debug(f"Cascade delete: {action} {rows} {label} rows")
+        if self.on_progress:
+            self.on_progress(label, action, rows)
@@ -7,11 +7,24 @@ Scans all installed Django apps for:
 - `error_catalog.yml` problem definitions
 
 Validates uniqueness and format compliance for RFC 7807 usage.
+
+Scanning imports every codes module and parses every catalog with PyYAML,
+which is slow for a process start. The compile_code_registry management
+command writes the scan result to a JSON artifact stamped with a hash of the
+scanned sources (CODE_REGISTRY["ARTIFACT_PATH"]). The global REGISTRY loads
+on first lookup, from the artifact when its hash matches the sources and by
+scanning otherwise.
 """
 
+import hashlib
+import json
 import logging
+import os
 import pathlib
+import tempfile
+import threading
 from importlib import import_module
+from importlib.util import find_spec
 from typing import Any
 
 from django.conf import settings
@@ -33,27 +46,87 @@ class CodeRegistryError(Exception):
     pass
 
 
+# Bumped when the artifact layout changes
+ARTIFACT_FORMAT = 1
+
+
+def get_artifact_path() -> pathlib.Path:
+    """Location of the compiled registry artifact."""
+    return pathlib.Path(settings.CODE_REGISTRY["ARTIFACT_PATH"])
+
+
+def compute_source_hash() -> str:
+    """
+    Hash the sources a scan reads: every installed app's codes module and
+    error catalog, plus the list of installed apps.
+
+    Only the files are read; nothing is imported or parsed.
+    """
+    digest = hashlib.sha256(f"format:{ARTIFACT_FORMAT}".encode())
+
+    for app_name in settings.INSTALLED_APPS:
+        digest.update(f"\0app:{app_name}".encode())
+        try:
+            app_spec = find_spec(app_name)
+            codes_spec = find_spec(f"{app_name}.codes")
+        except (ImportError, ValueError):
+            continue
+
+        sources = []
+        if codes_spec is not None and codes_spec.has_location:
+            sources.append(pathlib.Path(codes_spec.origin))
+        if app_spec is not None and app_spec.has_location:
+            sources.append(pathlib.Path(app_spec.origin).parent / "error_catalog.yml")
+
+        for path in sources:
+            if path.exists():
+                digest.update(f"\0{path.name}:".encode())
+                digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
 class CodeRegistry:
     """
     Central registry for error codes and problem type definitions.
 
     Scans Django apps for code enums and YAML error catalogs,
     validates format compliance, and provides lookup methods.
+
+    Args:
+        use_artifact: Load from the compiled artifact when it's up to date
+        autoload: Load on first lookup instead of waiting for load()
     """
 
-    def __init__(self):
+    def __init__(self, use_artifact=False, autoload=False):
         self.codes: set[str] = set()
         self.problem_types: dict[str, dict[str, Any]] = {}
+        self.use_artifact = use_artifact
+        self.autoload = autoload
         self._loaded = False
+        self._lock = threading.Lock()
 
     def load(self) -> None:
         """Load all codes and error catalogs from installed apps."""
-        if self._loaded:
-            logger.debug("Code registry already loaded, skipping")
-            return
+        with self._lock:
+            if self._loaded:
+                logger.debug("Code registry already loaded, skipping")
+                return
 
-        logger.info("Loading code registry...")
+            if self.use_artifact and self.load_artifact(get_artifact_path()):
+                source = "artifact"
+            else:
+                self.scan()
+                source = "scan"
+
+            self._loaded = True
+        logger.info(
+            f"Code registry loaded from {source}: {len(self.codes)} codes, "
+            f"{len(self.problem_types)} problem types"
+        )
 
+    def scan(self) -> None:
+        """Register the codes and error catalogs of every installed app."""
         for app_name in settings.INSTALLED_APPS:
             try:
                 self._load_app_codes(app_name)
@@ -62,10 +135,37 @@ class CodeRegistry:
                 logger.warning(f"Failed to load codes/catalog from {app_name}: {e}")
                 continue
 
-        self._loaded = True
-        logger.info(
-            f"Code registry loaded: {len(self.codes)} codes, {len(self.problem_types)} problem types"
-        )
+    def load_artifact(self, path: pathlib.Path) -> bool:
+        """
+        Load codes and problem types from a compiled artifact.
+
+        Returns:
+            False if the artifact is missing, unreadable or stale
+        """
+        try:
+            artifact = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            logger.debug(f"No code registry artifact at {path}")
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable code registry artifact {path}: {e}")
+            return False
+
+        if (
+            not isinstance(artifact, dict)
+            or artifact.get("format") != ARTIFACT_FORMAT
+            or artifact.get("source_hash") != compute_source_hash()
+        ):
+            logger.info(f"Code registry artifact {path} is stale, scanning apps")
+            return False
+
+        self.codes = set(artifact["codes"])
+        self.problem_types = artifact["problem_types"]
+        return True
+
+    def _ensure_loaded(self) -> None:
+        if self.autoload and not self._loaded:
+            self.load()
 
     def _load_app_codes(self, app_name: str) -> None:
         """Import `codes.py` from an app and register all codes."""
@@ -208,17 +308,53 @@ class CodeRegistry:
         logger.debug(f"Registered problem type: {slug} from {app_name}")
 
     def get_problem_type(self, slug: str) -> dict[str, Any] | None:
+        self._ensure_loaded()
         return self.problem_types.get(slug)
 
     def validate_code_exists(self, code: str) -> bool:
+        self._ensure_loaded()
         return code in self.codes
 
     def get_stats(self) -> dict[str, int]:
+        self._ensure_loaded()
         return {
             "codes": len(self.codes),
             "problem_types": len(self.problem_types),
         }
 
 
-# Global singleton registry
-REGISTRY = CodeRegistry()
+def compile_artifact(path: pathlib.Path) -> dict[str, Any]:
+    """
+    Scan installed apps and write the result to an artifact.
+
+    The write is atomic, so running workers never read a partial file.
+
+    Returns:
+        The artifact contents
+    """
+    # Hashed before scanning: sources edited mid-scan leave a stale hash
+    source_hash = compute_source_hash()
+    registry = CodeRegistry()
+    registry.scan()
+
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "source_hash": source_hash,
+        "codes": sorted(registry.codes),
+        "problem_types": registry.problem_types,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(artifact, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return artifact
+
+
+# Global singleton registry, loaded on first lookup
+REGISTRY = CodeRegistry(use_artifact=True, autoload=True)
@@ -0,0 +1,277 @@
+"""
+Conditional GET (ETag / Last-Modified) for polled read endpoints.
+
+Endpoints such as the plan list or feature flag listings return the same
+payload to most callers, and frontends poll them. Each cacheable resource has
+version stamps in the shared cache:
+
+    resource stamp          bumped for changes visible to every tenant
+    tenant stamp            bumped for changes of one tenant's rows
+    "any tenant" stamp      bumped with every tenant stamp, read by requests
+                            without a tenant (cross-tenant listings)
+
+The ETag of a response is a hash of those stamps and of everything else the
+rendered body depends on (URL, negotiated media type, language and, when
+configured, the user). Computing it costs one or two cache reads, so:
+
+- a matching If-None-Match is answered with 304 before the view runs;
+- otherwise the rendered body cached under the ETag is returned, if any;
+- otherwise the view runs and its rendered body is cached.
+
+Writes invalidate by bumping stamps, usually from model signals:
+
+    bump_resource_version("plans", tenant_id=plan.organization_id)
+
+Views use ConditionalGetMixin. Authentication, permission and throttling
+checks run before any of this.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from django.utils.translation import get_language
+
+from .cache import bump_version_stamp, cache_key, get_version_stamp
+
+# Cache timeouts (in seconds)
+BODY_TIMEOUT = 300  # 5 minutes
+VERSION_TIMEOUT = 60 * 60 * 24  # 1 day
+
+ANY_TENANT = "any"
+
+
+def resource_version_key(resource: str, scope) -> str:
+    """Generate cache key for a resource version stamp."""
+    return cache_key("conditional", resource, "version", scope)
+
+
+def get_resource_versions(resource: str, tenant_id=None) -> tuple[int, int]:
+    """
+    Get the version stamps a response of a resource depends on.
+
+    Args:
+        resource: Resource name, e.g. "plans"
+        tenant_id: Organization the response is scoped to, None for
+            responses spanning tenants
+
+    Returns:
+        (resource stamp, tenant or "any tenant" stamp)
+    """
+    scope = ANY_TENANT if tenant_id is None else tenant_id
+    return (
+        get_version_stamp(resource_version_key(resource, "*"), VERSION_TIMEOUT),
+        get_version_stamp(resource_version_key(resource, scope), VERSION_TIMEOUT),
+    )
+
+
+def bump_resource_version(resource: str, tenant_id=None) -> None:
+    """
+    Invalidate cached responses of a resource.
+
+    Args:
+        resource: Resource name, e.g. "plans"
+        tenant_id: Organization whose rows changed; None invalidates the
+            responses of every tenant
+    """
+    if tenant_id is None:
+        bump_version_stamp(resource_version_key(resource, "*"), VERSION_TIMEOUT)
+        return
+    bump_version_stamp(resource_version_key(resource, tenant_id), VERSION_TIMEOUT)
+    bump_version_stamp(resource_version_key(resource, ANY_TENANT), VERSION_TIMEOUT)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in parse_etags(if_none_match))
+
+
+class ConditionalGet:
+    """
+    ETag computation and rendered-body cache of one resource.
+
+    Args:
+        resource: Resource name whose stamps are bumped on writes
+        vary_on_user: The body depends on the requesting user
+        window: Seconds after which ETags change even without writes, for
+            bodies depending on the clock (e.g. scheduled flags)
+        timeout: Seconds rendered bodies are cached
+    """
+
+    def __init__(self, resource, vary_on_user=False, window=None, timeout=None):
+        self.resource = resource
+        self.vary_on_user = vary_on_user
+        self.window = window
+        self.timeout = BODY_TIMEOUT if timeout is None else timeout
+
+    def get_etag(self, request, tenant_id=None, extra=()) -> str:
+        """Compute the weak ETag of the response to a request."""
+        parts = [
+            self.resource,
+            *get_resource_versions(self.resource, tenant_id),
+            tenant_id,
+            request.build_absolute_uri(),
+            getattr(request, "accepted_media_type", None),
+            get_language(),
+            *extra,
+        ]
+        if self.vary_on_user:
+            parts.append(getattr(request.user, "pk", None))
+        if self.window:
+            parts.append(int(time.time() // self.window))
+
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+        return f'W/"{digest}"'
+
+    def get_body_key(self, etag: str) -> str:
+        """Generate cache key for the rendered body behind an ETag."""
+        return cache_key("conditional", self.resource, "body", etag[3:-1])
+
+    def lookup(self, request, etag: str) -> HttpResponse | None:
+        """
+        Answer a request without running the view, if possible.
+
+        Returns:
+            A 304 response, a response with the cached body, or None
+        """
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and etag_matches(if_none_match, etag):
+            return self.add_headers(HttpResponseNotModified(), etag)
+
+        cached = cache.get(self.get_body_key(etag))
+        if cached is None:
+            return None
+        content, content_type, last_modified = cached
+
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        if_modified_since = parse_http_date_safe(
+            request.META.get("HTTP_IF_MODIFIED_SINCE", "")
+        )
+        if not if_none_match and if_modified_since is not None:
+            if int(last_modified) <= if_modified_since:
+                return self.add_headers(HttpResponseNotModified(), etag, last_modified)
+
+        response = HttpResponse(content, content_type=content_type)
+        return self.add_headers(response, etag, last_modified)
+
+    def store(self, response, etag: str):
+        """Add validators to a fresh 200 response and cache its rendered body."""
+        if response.status_code != 200 or response.streaming:
+            return response
+
+        last_modified = time.time()
+        self.add_headers(response, etag, last_modified)
+
+        def cache_body(rendered):
+            cache.set(
+                self.get_body_key(etag),
+                (rendered.content, rendered["Content-Type"], last_modified),
+                self.timeout,
+            )
+
+        if getattr(response, "is_rendered", True):
+            cache_body(response)
+        else:
+            response.add_post_render_callback(cache_body)
+        return response
+
+    def add_headers(self, response, etag: str, last_modified=None):
+        """Set the validators and revalidation headers of a response."""
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Accept", "Accept-Language", "Authorization"))
+        return response
+
+
+class ConditionalResponse(Exception):
+    """Raised from APIView.initial() to short-circuit the handler."""
+
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Mixin answering GET requests of DRF views from ETags and cached bodies.
+
+    Usage:
+        class PlanViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+            conditional_resource = "plans"
+
+    Configuration:
+        conditional_resource (str): Resource whose stamps are bumped on writes
+        conditional_actions (tuple): Viewset actions to cache, None for every
+            GET handler
+        conditional_vary_on_user (bool): The body depends on the user
+        conditional_window (int): See ConditionalGet
+        conditional_timeout (int): Seconds rendered bodies are cached
+
+    The tenant defaults to request.org; override get_conditional_tenant_id()
+    and get_conditional_key_parts() for other scoping.
+    """
+
+    conditional_resource = None
+    conditional_actions = None
+    conditional_vary_on_user = False
+    conditional_window = None
+    conditional_timeout = None
+
+    def get_conditional_get(self) -> ConditionalGet:
+        return ConditionalGet(
+            self.conditional_resource,
+            vary_on_user=self.conditional_vary_on_user,
+            window=self.conditional_window,
+            timeout=self.conditional_timeout,
+        )
+
+    def get_conditional_tenant_id(self):
+        """Organization the response is scoped to."""
+        return getattr(getattr(self.request, "org", None), "pk", None)
+
+    def get_conditional_key_parts(self) -> tuple:
+        """Extra values the response depends on."""
+        return ()
+
+    def is_conditional(self, request) -> bool:
+        if request.method not in ("GET", "HEAD") or not self.conditional_resource:
+            return False
+        if self.conditional_actions is None:
+            return True
+        return getattr(self, "action", None) in self.conditional_actions
+
+    def initial(self, request, *args, **kwargs):
+        self._conditional_etag = None
+        super().initial(request, *args, **kwargs)
+
+        if not self.is_conditional(request):
+            return
+        conditional = self.get_conditional_get()
+        etag = conditional.get_etag(
+            request,
+            self.get_conditional_tenant_id(),
+            self.get_conditional_key_parts(),
+        )
+        response = conditional.lookup(request, etag)
+        if response is not None:
+            raise ConditionalResponse(response)
+        self._conditional_etag = etag
+
+    def handle_exception(self, exc):
+        if isinstance(exc, ConditionalResponse):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "_conditional_etag", None)
+        if etag is not None:
+            self.get_conditional_get().store(response, etag)
+        return response
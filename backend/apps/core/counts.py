@@ -0,0 +1,187 @@
+"""
+Count strategies for page-number pagination.
+
+StandardPagination needs a row count for "count" and "totalPages", and an
+exact COUNT(*) over millions of rows can cost more than fetching the page.
+A strategy decides how the count is obtained:
+
+    ExactCount()           COUNT(*) on every request (default)
+    CachedCount(30)        exact, cached per tenant and query for 30 seconds
+    EstimatedCount()       planner estimate (pg_class.reltuples) for
+                           unfiltered PostgreSQL querysets, exact otherwise
+    CappedCount(10000)     exact up to 10000 rows, then "10000+"
+
+Views opt in with a ``count_strategy`` attribute:
+
+    class InvoiceViewSet(viewsets.ReadOnlyModelViewSet):
+        count_strategy = CappedCount(limit=10000)
+
+Admin changelists do the same by returning a CountingPaginator from
+ModelAdmin.get_paginator() (see apps.core.audit.admin).
+
+Strategies return ``(count, exact)``; an inexact count is reported with
+"countIsExact": false and doesn't cap the page numbers that can be served.
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from .cache import cache_key
+
+
+class CountStrategy:
+    """Base class of count strategies."""
+
+    def count(self, queryset, request) -> tuple[int, bool]:
+        """
+        Count the rows of a queryset.
+
+        Returns:
+            (count, exact) - exact is False for estimates and capped counts
+        """
+        raise NotImplementedError
+
+
+class ExactCount(CountStrategy):
+    """SELECT COUNT(*) on every request."""
+
+    def count(self, queryset, request):
+        return queryset.count(), True
+
+
+class CachedCount(CountStrategy):
+    """
+    Exact count cached for a short time.
+
+    Entries are keyed by the request's tenant (request.org) and the SQL and
+    parameters of the queryset, so different filters, tenants and users
+    (whose visibility shows up in the query) never share a count. Counts can
+    be up to ``timeout`` seconds stale.
+    """
+
+    def __init__(self, timeout=30, fallback=None):
+        self.timeout = timeout
+        self.fallback = fallback or ExactCount()
+
+    def count(self, queryset, request):
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0, True
+
+        signature = hashlib.sha256(f"{sql}|{params!r}".encode()).hexdigest()[:32]
+        tenant = getattr(getattr(request, "org", None), "pk", None)
+        key = cache_key("pagination", "count", tenant, signature)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return tuple(cached)
+        result = self.fallback.count(queryset, request)
+        cache.set(key, result, self.timeout)
+        return result
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Planner row estimate for whole-table listings on PostgreSQL.
+
+    pg_class.reltuples is maintained by VACUUM/ANALYZE and costs one catalog
+    lookup. It only describes the whole table, so it's used for querysets
+    without filters, and only above ``threshold`` rows where an exact count
+    is actually slow (reltuples is -1 for never-analyzed tables). Anything
+    else is counted by ``fallback``.
+    """
+
+    def __init__(self, threshold=10000, fallback=None):
+        self.threshold = threshold
+        self.fallback = fallback or ExactCount()
+
+    def count(self, queryset, request):
+        query = queryset.query
+        connection = connections[queryset.db]
+        whole_table = not (
+            query.where or query.distinct or query.combinator or query.is_sliced
+        )
+
+        if connection.vendor == "postgresql" and whole_table:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.threshold:
+                return int(row[0]), False
+
+        return self.fallback.count(queryset, request)
+
+
+class CappedCount(CountStrategy):
+    """
+    Exact count up to ``limit`` rows, then ``limit`` reported as inexact.
+
+    Counts a LIMIT-ed subquery, so the database stops after limit + 1 rows.
+    """
+
+    def __init__(self, limit=10000):
+        self.limit = limit
+
+    def count(self, queryset, request):
+        queryset = queryset.order_by()
+        if not queryset.query.distinct:
+            queryset = queryset.values("pk")
+        count = queryset[: self.limit + 1].count()
+        if count > self.limit:
+            return self.limit, False
+        return count, True
+
+
+class CountingPaginator(Paginator):
+    """
+    Django Paginator counting its object list with a CountStrategy.
+
+    With an inexact count, pages past the counted ones are served anyway
+    (they may well have rows) and the last page isn't truncated at the
+    count.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy=None, request=None):
+        super().__init__(object_list, per_page)
+        self.count_strategy = count_strategy or ExactCount()
+        self.request = request
+        self._count_is_exact = True
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            # Plain sequences are cheap to count
+            return len(self.object_list)
+        count, self._count_is_exact = self.count_strategy.count(
+            self.object_list, self.request
+        )
+        return count
+
+    @property
+    def count_is_exact(self) -> bool:
+        _ = self.count  # Resolves the strategy
+        return self._count_is_exact
+
+    def validate_number(self, number):
+        if not self.count_is_exact and str(number).isdigit():
+            if int(number) > self.num_pages:
+                return int(number)
+        return super().validate_number(number)
+
+    def page(self, number):
+        if self.count_is_exact:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
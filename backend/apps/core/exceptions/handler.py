@@ -202,6 +202,17 @@ def _convert_drf_exception_to_rfc7807(exc, response) -> BaseHttpException:
             i18n_key="errors.unsupported_media_type",
         )
 
+    elif status_code == 413:
+        # Raised by apps.core.parsers for bodies over JSON_PARSER["MAX_BODY_SIZE"]
+        return BaseHttpException(
+            type="https://docs.yourapp.com/problems/payload-too-large",
+            title="Payload Too Large",
+            detail="The request body exceeds the maximum allowed size.",
+            status=413,
+            code=f"{APIResponseCodes.GEN_BAD_400.value.replace('400', '413')}",
+            i18n_key="errors.payload_too_large",
+        )
+
     elif isinstance(exc, Throttled):
         return BaseHttpException(
             type="https://docs.yourapp.com/problems/rate-limit-exceeded",
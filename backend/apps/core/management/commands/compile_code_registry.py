@@ -0,0 +1,63 @@
+"""
+Management command to compile the error code registry.
+
+Writes the codes and problem types of every installed app to the artifact
+the registry loads at runtime (see apps.core.code_registry), so processes
+don't import every codes module and parse every error catalog on startup.
+Run it as a build step, after the sources are in place.
+
+Usage:
+    python manage.py compile_code_registry
+    python manage.py compile_code_registry --output /tmp/code_registry.json
+    python manage.py compile_code_registry --check
+
+This command is idempotent - it can be run multiple times safely.
+"""
+
+import json
+import pathlib
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.code_registry import (
+    compile_artifact,
+    compute_source_hash,
+    get_artifact_path,
+)
+
+
+class Command(BaseCommand):
+    help = "Compile error codes and problem types into the registry artifact"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=pathlib.Path,
+            help="Artifact path (default: CODE_REGISTRY['ARTIFACT_PATH'])",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if the artifact is missing or stale instead of writing it",
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"] or get_artifact_path()
+
+        if options["check"]:
+            try:
+                artifact = json.loads(path.read_bytes())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"No readable artifact at {path}: {e}") from e
+            if artifact.get("source_hash") != compute_source_hash():
+                raise CommandError(f"Artifact {path} is stale")
+            self.stdout.write(self.style.SUCCESS(f"✓ {path} is up to date"))
+            return
+
+        artifact = compile_artifact(path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Compiled {len(artifact['codes'])} codes and "
+                f"{len(artifact['problem_types'])} problem types into {path}"
+            )
+        )
@@ -11,6 +11,8 @@ import time
 from django.http import HttpRequest, HttpResponse
 from django.utils.deprecation import MiddlewareMixin
 
+from apps.core.utils.routing import get_route_info
+
 # Lazy imports to avoid loading OpenTelemetry when disabled
 _prometheus_client = None
 _metrics_initialized = False
@@ -167,6 +169,11 @@ class MetricsMiddleware(MiddlewareMixin):
         if not self.enabled:
             return None
 
+        # Static files and the scrape endpoint are never measured
+        if get_route_info(request).skip_metrics:
+            request._metrics_sampled = False
+            return None
+
         # Check sampling
         if not self.config.should_sample_metrics():
             request._metrics_sampled = False
@@ -273,25 +280,15 @@ class MetricsMiddleware(MiddlewareMixin):
         Examples:
             /api/v1/users/123 -> /api/v1/users/{id}
             /api/v1/orgs/uuid-here/settings -> /api/v1/orgs/{id}/settings
+
+        The route template comes from the shared route classifier, so the
+        URL is resolved once per path rather than once per request.
         """
         try:
-            # Try to get URL pattern from resolver
-            from django.urls import resolve
-
-            match = resolve(request.path_info)
-            if match.route:
-                # Django 4.0+ has the route attribute
-                return f"/{match.route}"
-
-            # Fallback: use view name
-            if match.view_name:
-                return match.view_name
-
+            return get_route_info(request).metrics_endpoint
         except Exception:
-            pass
-
-        # Fallback: return raw path (may have high cardinality)
-        return request.path_info
+            # Fallback: return raw path (may have high cardinality)
+            return request.path_info
 
     def _record_detailed_metrics(
         self, request: HttpRequest, method: str, status_code: str
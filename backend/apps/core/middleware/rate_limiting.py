@@ -10,11 +10,11 @@ import time
 
 from django.conf import settings
 from django.http import JsonResponse
-from django.urls import resolve
 from django.utils.deprecation import MiddlewareMixin
 
 from apps.core.exceptions.client_errors import RateLimitException
 from apps.core.utils.rate_limiting import rate_limiter
+from apps.core.utils.routing import get_route_info
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +35,6 @@ class RateLimitMiddleware(MiddlewareMixin):
         super().__init__(get_response)
         self.enabled = self._get_setting("ENABLED", True)
         self.global_limits = self._get_setting("DEFAULT_LIMITS", {})
-        self.endpoint_limits = self._get_setting("ENDPOINT_LIMITS", {})
-
-        # Paths to exclude from global rate limiting
-        self.excluded_paths = self._get_setting(
-            "EXCLUDED_PATHS",
-            [
-                "/admin/",
-                "/api/schema/",
-                "/api/docs/",
-                "/api/redoc/",
-                "/health/",
-                "/ping/",
-            ],
-        )
 
     def _get_setting(self, key: str, default=None):
         """Get rate limiting setting from Django configuration"""
@@ -60,37 +46,12 @@ class RateLimitMiddleware(MiddlewareMixin):
         if not self.enabled:
             return True
 
-        # Skip for excluded paths
-        path = request.path
-        for excluded_path in self.excluded_paths:
-            if path.startswith(excluded_path):
-                return True
-
-        # Skip for static files
-        if path.startswith("/static/") or path.startswith("/media/"):
-            return True
-
-        return False
+        # Excluded paths and static files are flagged by the route classifier
+        return get_route_info(request).rate_limit_exempt
 
     def _get_endpoint_name(self, request) -> str:
-        """Get endpoint name from URL resolution"""
-        try:
-            resolved = resolve(request.path)
-            if resolved.url_name:
-                return resolved.url_name
-            elif resolved.view_name:
-                return resolved.view_name.split(".")[-1]  # Get the last part
-            else:
-                # Fallback to view function name if available
-                view_func = resolved.func
-                if hasattr(view_func, "__name__"):
-                    return view_func.__name__
-                elif hasattr(view_func, "view_class"):
-                    return view_func.view_class.__name__
-                else:
-                    return "unknown"
-        except Exception:
-            return "unknown"
+        """Get endpoint name from the shared route classification"""
+        return get_route_info(request).endpoint_name
 
     def _apply_global_rate_limits(self, request, endpoint_name: str) -> None:
         """Apply global rate limiting rules"""
@@ -125,10 +86,10 @@ class RateLimitMiddleware(MiddlewareMixin):
 
     def _apply_endpoint_rate_limits(self, request, endpoint_name: str) -> None:
         """Apply endpoint-specific rate limiting rules"""
-        if endpoint_name not in self.endpoint_limits:
+        endpoint_config = get_route_info(request).rate_limit_policy
+        if not endpoint_config:
             return
 
-        endpoint_config = self.endpoint_limits[endpoint_name]
         client_ip = rate_limiter.get_client_ip(request)
         user_id = rate_limiter.get_user_identifier(request)
 
@@ -0,0 +1,17 @@
+from apps.core.side_effects import collect_side_effects
+
+
+class SideEffectsMiddleware:
+    """
+    Dispatch the side effects committed during a request as one batch.
+
+    Effects deferred with apps.core.side_effects.defer() are collected while
+    the view runs and handed off together once the response is built.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_side_effects():
+            return self.get_response(request)
@@ -83,6 +83,12 @@ def _initialize_custom_metrics():
             labelnames=["task_name", "status"],
         )
 
+        _custom_metrics["batch_job_rows"] = Counter(
+            "app_batch_job_rows_total",
+            "Rows processed by maintenance batch jobs",
+            labelnames=["job"],
+        )
+
         # Database query performance
         _custom_metrics["db_query_duration"] = Histogram(
             "app_database_query_duration_seconds",
@@ -279,6 +285,25 @@ def record_rate_limit_hit(endpoint: str, user_type: str = "anonymous") -> None:
         logger.debug(f"Error recording rate limit hit metric: {e}")
 
 
+def record_batch_job_progress(job: str, rows: int) -> None:
+    """
+    Record rows processed by a maintenance batch job.
+
+    Args:
+        job: Batch job name
+        rows: Rows processed in the batch
+    """
+    if not is_metrics_enabled():
+        return
+
+    try:
+        _initialize_custom_metrics()
+        if _custom_metrics.get("batch_job_rows"):
+            _custom_metrics["batch_job_rows"].labels(job=job).inc(rows)
+    except Exception as e:
+        logger.debug(f"Error recording batch job metric: {e}")
+
+
 def track_celery_task(func):
     """
     Decorator to track Celery task execution metrics.
@@ -2,15 +2,36 @@
 RFC-compliant pagination for standardized paginated responses.
 
 This module provides pagination classes that emit responses matching
-the RFC 7807 success envelope format with numeric status codes.
+the RFC 7807 success envelope format with numeric status codes:
+StandardPagination (page numbers) and StandardCursorPagination (keyset
+cursors, for large append-mostly tables).
 """
 
 import math
 
-from rest_framework.pagination import PageNumberPagination
+from django.core import signing
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
 
 from .codes import APIResponseCodes
+from .counts import CountingPaginator, ExactCount
+
+
+def success_code(request):
+    """
+    Success code value and i18n key of a list response.
+
+    Views can set request.success_code (enum or string) and
+    request.success_i18n_key; lists default to GEN_LIST_200 / "list.ok".
+    """
+    code = getattr(request, "success_code", APIResponseCodes.GEN_LIST_200)
+    i18n_key = getattr(request, "success_i18n_key", "list.ok")
+
+    # Handle both enum and string codes
+    return (code.value if hasattr(code, "value") else str(code)), i18n_key
 
 
 class StandardPagination(PageNumberPagination):
@@ -23,12 +44,30 @@ class StandardPagination(PageNumberPagination):
     - i18n_key for localization
     - Pagination metadata
     - Data array
+
+    How the total is counted is pluggable: a view's ``count_strategy``
+    attribute (see apps.core.counts) overrides the exact default.
     """
 
     page_size_query_param = "page_size"
     page_query_param = "page"
     max_page_size = 100
     page_size = 20
+    count_strategy = ExactCount()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_strategy = getattr(view, "count_strategy", self.count_strategy)
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, queryset, page_size):
+        # Called by PageNumberPagination.paginate_queryset after self.request
+        # is set; a method so the paginator gets the strategy and request
+        return CountingPaginator(
+            queryset,
+            page_size,
+            count_strategy=self.count_strategy,
+            request=self.request,
+        )
 
     def get_paginated_response(self, data):
         """
@@ -42,20 +81,14 @@ class StandardPagination(PageNumberPagination):
         """
         # Calculate pagination metadata
         total = self.page.paginator.count
+        exact = getattr(self.page.paginator, "count_is_exact", True)
         page_size = self.get_page_size(self.request) or len(data) or 1
         page = self.page.number
         total_pages = math.ceil(total / page_size) if page_size else 1
+        # Past an inexact count, a full page means there may be more
+        has_next = self.page.has_next() or (not exact and len(data) == page_size)
 
-        # Get success code and i18n key from request if set by view
-        success_code = getattr(
-            self.request, "success_code", APIResponseCodes.GEN_LIST_200
-        )
-        success_i18n_key = getattr(self.request, "success_i18n_key", "list.ok")
-
-        # Handle both enum and string codes
-        code_value = (
-            success_code.value if hasattr(success_code, "value") else str(success_code)
-        )
+        code_value, success_i18n_key = success_code(self.request)
 
         return Response(
             {
@@ -64,9 +97,10 @@ class StandardPagination(PageNumberPagination):
                 "i18n_key": success_i18n_key,
                 "pagination": {
                     "count": total,
+                    "countIsExact": exact,
                     "totalPages": total_pages,
                     "currentPage": page,
-                    "next": page + 1 if self.page.has_next() else None,
+                    "next": page + 1 if has_next else None,
                     "previous": page - 1 if self.page.has_previous() else None,
                     "pageSize": page_size,
                 },
@@ -111,6 +145,14 @@ class StandardPagination(PageNumberPagination):
                             "description": "Total number of items",
                             "example": 100,
                         },
+                        "countIsExact": {
+                            "type": "boolean",
+                            "description": (
+                                "False when count is an estimate or a lower "
+                                "bound (e.g. 10000+)"
+                            ),
+                            "example": True,
+                        },
                         "totalPages": {
                             "type": "integer",
                             "description": "Total number of pages",
@@ -147,6 +189,211 @@ class StandardPagination(PageNumberPagination):
         }
 
 
+class StandardCursorPagination(BasePagination):
+    """
+    Keyset (cursor) pagination with the StandardPagination envelope.
+
+    Pages are fetched with a WHERE on the (ordering, pk) key of the row the
+    cursor points at instead of an OFFSET, and no COUNT(*) is run, so deep
+    pages cost the same as the first one. The trade-off is that there are
+    no page numbers or totals: clients follow the opaque "next"/"previous"
+    cursors of each response.
+
+    Cursors are signed, so clients can't forge positions. The ordering field
+    must be a non-null concrete field; subclasses override ``ordering``
+    (e.g. "-timestamp"), the primary key always breaks ties.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    page_size = 20
+    ordering = "-created_at"
+    invalid_cursor_message = _("Invalid cursor")
+    cursor_salt = "apps.core.pagination.cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        field = self.ordering.lstrip("-")
+        # Walking backwards is walking forwards in the opposite order
+        descending = self.ordering.startswith("-") != reverse
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{field}", f"{prefix}pk")
+
+        if position is not None:
+            value, pk = position
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": value})
+                | Q(**{field: value, f"pk__{lookup}": pk})
+            )
+
+        # One extra row tells whether there is a page beyond this one
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, instance, reverse=False) -> str:
+        field = instance._meta.get_field(self.ordering.lstrip("-"))
+        payload = {
+            "o": self.ordering,
+            "p": [field.value_to_string(instance), str(instance.pk)],
+            "r": int(reverse),
+        }
+        return signing.dumps(payload, salt=self.cursor_salt, compress=True)
+
+    def decode_cursor(self, request):
+        """(position, reverse) of the request's cursor; (None, False) if absent."""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = signing.loads(token, salt=self.cursor_salt)
+            value, pk = payload["p"]
+            reverse = bool(payload["r"])
+            ordering = payload["o"]
+        except (signing.BadSignature, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message) from None
+
+        # Cursors of another ordering point at meaningless positions
+        if ordering != self.ordering:
+            raise NotFound(self.invalid_cursor_message)
+        return (value, pk), reverse
+
+    def get_next_cursor(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_cursor(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        """
+        Create a cursor-paginated response with the RFC-compliant envelope.
+
+        Args:
+            data: The serialized data for the current page
+
+        Returns:
+            Response: Paginated response with standard envelope
+        """
+        code_value, success_i18n_key = success_code(self.request)
+
+        return Response(
+            {
+                "status": 200,
+                "code": code_value,
+                "i18n_key": success_i18n_key,
+                "pagination": {
+                    "next": self.get_next_cursor(),
+                    "previous": self.get_previous_cursor(),
+                    "pageSize": self.page_size,
+                },
+                "data": data,
+            },
+            status=200,
+        )
+
+    def get_paginated_response_schema(self, schema):
+        """
+        Define the OpenAPI schema for cursor-paginated responses.
+
+        Args:
+            schema: The schema for individual items
+
+        Returns:
+            dict: OpenAPI schema for the paginated response
+        """
+        return {
+            "type": "object",
+            "properties": {
+                "status": {
+                    "type": "integer",
+                    "description": "HTTP status code",
+                    "example": 200,
+                },
+                "code": {
+                    "type": "string",
+                    "description": "Machine-readable success code",
+                    "example": "VDJ-GEN-LIST-200",
+                },
+                "i18n_key": {
+                    "type": "string",
+                    "description": "Internationalization key",
+                    "example": "list.ok",
+                },
+                "pagination": {
+                    "type": "object",
+                    "properties": {
+                        "next": {
+                            "type": "string",
+                            "nullable": True,
+                            "description": "Cursor of the next page",
+                            "example": "eyJvIjoiLWNyZWF0ZWRfYXQiLCJwIjpb...",
+                        },
+                        "previous": {
+                            "type": "string",
+                            "nullable": True,
+                            "description": "Cursor of the previous page",
+                            "example": None,
+                        },
+                        "pageSize": {
+                            "type": "integer",
+                            "description": "Number of items per page",
+                            "example": 20,
+                        },
+                    },
+                    "required": ["next", "previous", "pageSize"],
+                },
+                "data": {"type": "array", "items": schema},
+            },
+            "required": ["status", "code", "i18n_key", "pagination", "data"],
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor of the page, from a previous response",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
 # Keep the old pagination class for backward compatibility during transition
 class CustomPaginationClass(PageNumberPagination):
     """
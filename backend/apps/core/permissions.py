@@ -17,6 +17,7 @@ from apps.core.capabilities import (
     can_manage_organization,
     is_global_mode_enabled,
 )
+from apps.organizations.claims import get_claims_membership
 
 
 class OrganizationAccessPermission(BasePermission):
@@ -185,8 +186,10 @@ class IsOrgMember(BasePermission):
         if request.user.is_superuser:
             return True
 
-        # Check membership
-        membership = request.user.get_membership_in(obj)
+        # Check membership (verified token claims first, then the database)
+        membership = get_claims_membership(request, obj)
+        if membership is None:
+            membership = request.user.get_membership_in(obj)
         return membership is not None and membership.is_active()
 
 
@@ -207,6 +210,10 @@ class IsOrgAdmin(BasePermission):
         if request.user.is_superuser:
             return True
 
+        membership = get_claims_membership(request, obj)
+        if membership is not None:
+            return membership.is_admin()
+
         # Check if user is admin or owner
         return request.user.is_admin_of(obj) or request.user.is_owner_of(obj)
 
@@ -228,5 +235,9 @@ class IsOrgOwner(BasePermission):
         if request.user.is_superuser:
             return True
 
+        membership = get_claims_membership(request, obj)
+        if membership is not None:
+            return membership.is_owner()
+
         # Check if user is owner
         return request.user.is_owner_of(obj)
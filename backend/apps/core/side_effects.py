@@ -0,0 +1,199 @@
+"""
+Deferred side effects that run after the surrounding transaction commits.
+
+Request handlers often follow their core inserts with work the client doesn't
+wait for: rendering and queueing emails, audit entries, bookkeeping. defer()
+records such a call and runs it once the transaction commits (nothing runs if
+it rolls back):
+
+    from apps.core.side_effects import defer
+
+    defer(send_verification_email, user_id=str(user.pk))
+
+Only functions registered with the @side_effect decorator can be deferred,
+and workers only run registered names, so a message on the broker can't call
+arbitrary code. Apps keep their effects in a side_effects module, which
+CoreConfig.ready() imports:
+
+    @side_effect
+    def send_verification_email(user_id):
+        ...
+
+Calls are identified by the function's dotted path and JSON-serializable
+keyword arguments, so they can cross a process boundary. Within a request
+(SideEffectsMiddleware) committed calls are collected and dispatched together
+as a single run_side_effects Celery task when the response is ready. Outside a
+request each commit dispatches its own batch. When the broker can't be reached
+the batch runs on a small, bounded thread pool in this process instead.
+
+Effects run independently: one failing is logged and doesn't stop the rest.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+# Batches queued on the fallback pool per worker before callers run them inline
+QUEUE_FACTOR = 10
+
+# Registered effects by dotted path (see side_effect)
+_registry = {}
+
+_local = threading.local()
+_executor = None
+_executor_slots = None
+_executor_lock = threading.Lock()
+
+
+def _get_config() -> dict:
+    return getattr(settings, "SIDE_EFFECTS", {})
+
+
+def _effect_name(func) -> str:
+    return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', None)}"
+
+
+def side_effect(func):
+    """
+    Register a module-level function as a side effect defer() accepts.
+
+    Raises:
+        ValueError: For lambdas and nested functions, which can't be looked
+            up by name in another process
+    """
+    name = _effect_name(func)
+    if "<" in name:
+        raise ValueError(f"Side effects must be module-level functions, got {name}")
+    _registry[name] = func
+    return func
+
+
+def get_effect(name):
+    """Look up a registered side effect, or None."""
+    return _registry.get(name)
+
+
+def defer(func, **kwargs) -> None:
+    """
+    Run func(**kwargs) after the current transaction commits.
+
+    Args:
+        func: Function registered with @side_effect
+        **kwargs: JSON-serializable keyword arguments
+
+    Raises:
+        ValueError: If func isn't a registered side effect
+    """
+    name = _effect_name(func)
+    if _registry.get(name) is not func:
+        raise ValueError(f"{name} is not a registered side effect")
+    effect = (name, kwargs)
+
+    if _get_config().get("ALWAYS_EAGER", False):
+        # Like CELERY_TASK_ALWAYS_EAGER: run inline, e.g. in tests
+        run_effects([effect])
+        return
+
+    transaction.on_commit(lambda: _collect(effect))
+
+
+def _collect(effect) -> None:
+    """Add a committed effect to the request batch, or dispatch it."""
+    batch = getattr(_local, "batch", None)
+    if batch is None:
+        dispatch([effect])
+    else:
+        batch.append(effect)
+
+
+@contextmanager
+def collect_side_effects():
+    """Collect effects committed inside the block and dispatch them as one batch."""
+    previous = getattr(_local, "batch", None)
+    _local.batch = []
+    try:
+        yield
+    finally:
+        batch, _local.batch = _local.batch, previous
+        if batch:
+            dispatch(batch)
+
+
+def dispatch(effects) -> None:
+    """Hand a batch of committed effects to Celery, or the fallback pool."""
+    from apps.core.tasks import run_side_effects
+
+    if _get_config().get("USE_CELERY", True):
+        try:
+            # Fail fast instead of retrying the publish while the client waits
+            run_side_effects.apply_async(
+                args=[[list(effect) for effect in effects]], retry=False
+            )
+            return
+        except Exception as e:
+            logger.warning(f"Celery unavailable, running side effects locally: {e}")
+
+    _submit(effects)
+
+
+def _submit(effects) -> None:
+    """Run a batch on the bounded thread pool, or inline when it is saturated."""
+    global _executor, _executor_slots
+
+    with _executor_lock:
+        if _executor is None:
+            max_workers = _get_config().get("MAX_WORKERS", DEFAULT_MAX_WORKERS)
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="side-effects"
+            )
+            _executor_slots = threading.BoundedSemaphore(max_workers * QUEUE_FACTOR)
+
+    if not _executor_slots.acquire(blocking=False):
+        # Back-pressure: don't let the queue grow without bound
+        run_effects(effects)
+        return
+
+    def run():
+        try:
+            run_effects(effects)
+        finally:
+            # Pool threads open their own database connection
+            connection.close()
+            _executor_slots.release()
+
+    _executor.submit(run)
+
+
+def run_effects(effects) -> int:
+    """
+    Run a batch of effects, isolating failures.
+
+    Names missing from the registry are refused, never imported.
+
+    Args:
+        effects: Iterable of (dotted path, kwargs) pairs
+
+    Returns:
+        Number of effects that failed
+    """
+    failed = 0
+    for path, kwargs in effects:
+        func = get_effect(path)
+        if func is None:
+            failed += 1
+            logger.error(f"Refusing unregistered side effect {path}")
+            continue
+        try:
+            func(**kwargs)
+        except Exception as e:
+            failed += 1
+            logger.error(f"Side effect {path} failed: {e}", exc_info=True)
+    return failed
@@ -0,0 +1,28 @@
+"""
+Celery tasks for core infrastructure.
+"""
+
+import logging
+
+from celery import shared_task
+
+from apps.core.side_effects import run_effects
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_side_effects(effects):
+    """
+    Run a batch of post-commit side effects (see apps.core.side_effects).
+
+    Args:
+        effects: List of [dotted path, kwargs] pairs
+
+    Returns:
+        str: Summary of the batch
+    """
+    failed = run_effects(effects)
+    if failed:
+        logger.warning(f"Side effects task: {failed} of {len(effects)} failed")
+    return f"Ran {len(effects) - failed} of {len(effects)} side effects"
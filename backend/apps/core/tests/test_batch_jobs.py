@@ -0,0 +1,88 @@
+"""
+Tests for checkpointed batch jobs.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.accounts.tests.factories import AccountFactory
+from apps.core.batch_jobs import BatchJob, run_batch_job
+
+
+class DeactivateAccounts(BatchJob):
+    """Job used by the tests: deactivates active accounts."""
+
+    name = "tests.deactivate_accounts"
+
+    def get_queryset(self):
+        return Account.objects.filter(is_active=True)
+
+    def process_batch(self, pks):
+        seen.extend(pks)
+        return self.get_queryset().filter(pk__in=pks).update(is_active=False)
+
+
+seen = []
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestBatchJob:
+    """Test keyset iteration, checkpoints and resumption."""
+
+    def setup_method(self):
+        seen.clear()
+
+    def test_processes_every_row_once_despite_key_ties(self):
+        """Test rows sharing created_at are neither skipped nor repeated."""
+        accounts = AccountFactory.create_batch(7)
+        Account.objects.update(created_at=timezone.now())
+
+        result = DeactivateAccounts(batch_size=3).run()
+
+        assert result.complete
+        assert result.processed == 7
+        assert result.batches == 3
+        assert sorted(seen) == sorted(a.pk for a in accounts)
+        assert cache.get(DeactivateAccounts().checkpoint_key) is None
+
+    def test_time_budget_checkpoints_and_resumes(self):
+        """Test a run stopped by its time budget continues where it left off."""
+        AccountFactory.create_batch(5)
+
+        first = DeactivateAccounts(batch_size=2, time_budget=0).run()
+
+        assert not first.complete
+        assert first.processed == 2
+        assert cache.get(DeactivateAccounts().checkpoint_key)["processed"] == 2
+
+        second = DeactivateAccounts(batch_size=2).run()
+
+        assert second.complete
+        assert second.resumed
+        assert second.processed == 5
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_concurrent_run_is_skipped(self):
+        """Test only one run of a job is active at a time."""
+        AccountFactory()
+        job = DeactivateAccounts()
+        cache.add(job.lock_key, 1)
+
+        result = job.run()
+
+        assert result.skipped
+        assert Account.objects.filter(is_active=True).exists()
+
+    def test_run_batch_job_requeues_unfinished_work(self):
+        """Test the task is requeued while the job has work left."""
+        AccountFactory.create_batch(3)
+        task = Mock()
+
+        run_batch_job(task, DeactivateAccounts(batch_size=1, time_budget=0))
+
+        task.apply_async.assert_called_once_with(kwargs={}, countdown=60)
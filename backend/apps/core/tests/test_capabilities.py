@@ -4,6 +4,9 @@ Tests for the platform capabilities system.
 Tests both Global Mode and Multi-Tenant Mode configurations.
 """
 
+import hashlib
+from unittest.mock import patch
+
 import pytest
 from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
@@ -17,6 +20,7 @@ from apps.core.capabilities import (
     get_platform_capabilities,
     is_global_mode_enabled,
 )
+from apps.core.renderers import ConsistentDataRenderer
 
 
 class CapabilitiesTestCase(TestCase):
@@ -162,3 +166,54 @@ class CapabilitiesAPITestCase(TestCase):
         self.assertIsInstance(data["org_creation"], bool)
         self.assertIsInstance(data["org_switching"], bool)
         self.assertIsInstance(data["org_management"], bool)
+
+
+class CapabilitiesPrecomputedResponseTestCase(TestCase):
+    """Test the precomputed capabilities response."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_etag_is_content_hash(self):
+        """Test that the ETag is derived from the rendered body."""
+        response = self.client.get("/api/v1/capabilities/")
+        digest = hashlib.sha256(response.content).hexdigest()[:32]
+
+        self.assertEqual(response["ETag"], f'"{digest}"')
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("orgCreation", response.json()["data"])
+
+    def test_matching_etag_returns_304(self):
+        """Test that clients holding the current body get 304."""
+        etag = self.client.get("/api/v1/capabilities/")["ETag"]
+
+        response = self.client.get("/api/v1/capabilities/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_body_is_rendered_once(self):
+        """Test that requests don't render the capabilities again."""
+        self.client.get("/api/v1/capabilities/")
+
+        with patch.object(ConsistentDataRenderer, "render") as render:
+            response = self.client.get("/api/v1/capabilities/")
+
+        self.assertEqual(response.status_code, 200)
+        render.assert_not_called()
+
+    def test_settings_override_recomputes(self):
+        """Test that overridden settings are reflected in the response."""
+        with override_settings(GLOBAL_MODE_ENABLED=False):
+            response = self.client.get("/api/v1/capabilities/")
+            self.assertEqual(response.json()["data"]["mode"], "multi_tenant")
+
+        with override_settings(GLOBAL_MODE_ENABLED=True):
+            response = self.client.get("/api/v1/capabilities/")
+            self.assertEqual(response.json()["data"]["mode"], "global")
+
+    def test_returned_map_is_a_copy(self):
+        """Test that callers can't modify the precomputed map."""
+        get_platform_capabilities()["mode"] = "changed"
+
+        self.assertNotEqual(get_platform_capabilities()["mode"], "changed")
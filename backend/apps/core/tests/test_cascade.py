@@ -0,0 +1,121 @@
+"""
+Tests for batched cascade deletion.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.db.models import ProtectedError
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+from apps.accounts.models import Account
+from apps.accounts.tests.factories import AccountFactory
+from apps.billing.models import Plan, Subscription
+from apps.core.audit.models import AuditAction, AuditLog
+from apps.core.cascade import BulkCascade
+from apps.organizations.models import (
+    Invite,
+    Organization,
+    OrganizationMembership,
+)
+from apps.organizations.tests.factories import (
+    ActiveMembershipFactory,
+    InviteFactory,
+    OrganizationFactory,
+)
+
+
+def create_plan(organization, slug):
+    return Plan.objects.create(
+        organization=organization, name=slug, slug=slug, amount=Decimal("10.00")
+    )
+
+
+def create_subscription(organization, plan):
+    now = timezone.now()
+    return Subscription.objects.create(
+        organization=organization,
+        plan=plan,
+        current_period_start=now,
+        current_period_end=now + timedelta(days=30),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestBulkCascade:
+    """Test bottom-up batched deletion of an organization's data."""
+
+    def test_deletes_graph_like_the_collector(self):
+        """Test CASCADE children are deleted and SET_NULL references cleared."""
+        org = OrganizationFactory()
+        other_org = OrganizationFactory()
+        tenant_users = AccountFactory.create_batch(3)
+        Account.objects.filter(pk__in=[u.pk for u in tenant_users]).update(
+            organization=org
+        )
+        for user in tenant_users:
+            ActiveMembershipFactory(organization=org, user=user)
+        InviteFactory(organization=org, invited_by=tenant_users[0])
+        outsider = AccountFactory(created_by=tenant_users[0])
+        AuditLog.log_event(action=AuditAction.ORG_UPDATE, organization=org)
+
+        cascade = BulkCascade(batch_size=2)
+        deleted = cascade.delete(Organization.objects.filter(pk=org.pk))
+
+        assert deleted == 1
+        assert not Organization.objects.filter(pk=org.pk).exists()
+        assert not Account.objects.filter(organization_id=org.pk).exists()
+        assert not OrganizationMembership.objects.filter(
+            organization_id=org.pk
+        ).exists()
+        assert not Invite.objects.filter(organization_id=org.pk).exists()
+        assert cascade.deleted["accounts.Account"] == 3
+        assert cascade.deleted["organizations.OrganizationMembership"] == 3
+
+        # Audit logs are kept, detached from the organization
+        audit_log = AuditLog.objects.get(organization_slug=org.slug)
+        assert audit_log.organization is None
+        outsider.refresh_from_db()
+        assert outsider.created_by is None
+        assert Organization.objects.filter(pk=other_org.pk).exists()
+
+    def test_delete_signals_fire_per_instance(self):
+        """Test models with delete receivers still get their signals."""
+        org = OrganizationFactory()
+        ActiveMembershipFactory.create_batch(3, organization=org)
+        received = []
+
+        def receiver(sender, instance, **kwargs):
+            received.append(instance.pk)
+
+        post_delete.connect(receiver, sender=OrganizationMembership)
+        try:
+            BulkCascade(batch_size=2).delete(Organization.objects.filter(pk=org.pk))
+        finally:
+            post_delete.disconnect(receiver, sender=OrganizationMembership)
+
+        assert len(received) == 3
+
+    def test_protected_sibling_is_deleted_first(self):
+        """Test a plan protected only by the organization's own subscription goes."""
+        org = OrganizationFactory()
+        create_subscription(org, create_plan(org, "own-plan"))
+
+        BulkCascade().delete(Organization.objects.filter(pk=org.pk))
+
+        assert not Plan.objects.filter(slug="own-plan").exists()
+        assert not Subscription.objects.filter(organization_id=org.pk).exists()
+
+    def test_protected_reference_raises(self):
+        """Test a plan used by another organization's subscription is protected."""
+        org = OrganizationFactory()
+        plan = create_plan(org, "shared-plan")
+        create_subscription(OrganizationFactory(), plan)
+
+        with pytest.raises(ProtectedError):
+            BulkCascade().delete(Organization.objects.filter(pk=org.pk))
+
+        assert Plan.objects.filter(pk=plan.pk).exists()
@@ -5,11 +5,18 @@ Tests the central registry for error codes and problem type definitions,
 including app scanning, YAML catalog loading, and validation.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
-
-from apps.core.code_registry import REGISTRY, CodeRegistry, CodeRegistryError
+from django.core.management import CommandError, call_command
+
+from apps.core.code_registry import (
+    REGISTRY,
+    CodeRegistry,
+    CodeRegistryError,
+    compile_artifact,
+)
 from apps.core.codes import BaseAPICodeMixin
 
 
@@ -519,6 +526,75 @@ class TestGlobalRegistrySingleton:
         assert hasattr(REGISTRY, "get_stats")
 
 
+@pytest.mark.code_registry
+class TestCodeRegistryArtifact:
+    """Test the compiled registry artifact."""
+
+    @pytest.fixture
+    def artifact_path(self, tmp_path, settings):
+        path = tmp_path / "code_registry.json"
+        settings.CODE_REGISTRY = {"ARTIFACT_PATH": str(path)}
+        return path
+
+    def test_artifact_matches_scan(self, artifact_path):
+        """Test that loading the artifact gives the scanned codes."""
+        compile_artifact(artifact_path)
+        scanned = CodeRegistry()
+        scanned.load()
+
+        registry = CodeRegistry(use_artifact=True)
+        with patch.object(registry, "scan") as scan:
+            registry.load()
+
+        scan.assert_not_called()
+        assert registry.codes == scanned.codes
+        assert registry.problem_types == scanned.problem_types
+
+    def test_stale_artifact_falls_back_to_scan(self, artifact_path):
+        """Test that an artifact of other sources is ignored."""
+        compile_artifact(artifact_path)
+        artifact = json.loads(artifact_path.read_text())
+        artifact["source_hash"] = "0" * 64
+        artifact["codes"] = ["VDJ-STALE-CODE-200"]
+        artifact_path.write_text(json.dumps(artifact))
+
+        registry = CodeRegistry(use_artifact=True)
+        registry.load()
+
+        assert "VDJ-STALE-CODE-200" not in registry.codes
+        assert registry.get_stats()["codes"] > 0
+
+    def test_missing_artifact_falls_back_to_scan(self, artifact_path):
+        """Test that registries scan when no artifact was compiled."""
+        registry = CodeRegistry(use_artifact=True)
+        with patch.object(registry, "scan") as scan:
+            registry.load()
+
+        scan.assert_called_once()
+
+    def test_autoload_on_first_lookup(self, artifact_path):
+        """Test that autoloading registries load on first lookup only."""
+        registry = CodeRegistry(autoload=True)
+        assert registry._loaded is False
+
+        with patch.object(registry, "scan") as scan:
+            registry.validate_code_exists("VDJ-GEN-OK-200")
+            registry.get_problem_type("validation-error")
+
+        scan.assert_called_once()
+        assert registry._loaded is True
+
+    def test_compile_command(self, artifact_path):
+        """Test compiling and checking the artifact from the command line."""
+        with pytest.raises(CommandError):
+            call_command("compile_code_registry", "--check")
+
+        call_command("compile_code_registry")
+        assert artifact_path.exists()
+
+        call_command("compile_code_registry", "--check")
+
+
 @pytest.mark.code_registry
 class TestCodeRegistryErrorHandling:
     """Test error handling in various scenarios."""
@@ -0,0 +1,165 @@
+"""
+Tests for conditional GET responses (apps.core.conditional).
+"""
+
+from unittest.mock import patch
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from apps.accounts.tests.factories import AccountFactory
+from apps.billing.models import Plan
+from apps.billing.views import PlanViewSet
+from apps.core.conditional import (
+    ConditionalGet,
+    bump_resource_version,
+    etag_matches,
+    get_resource_versions,
+)
+from apps.organizations.tests.factories import OrganizationFactory
+
+PLANS_URL = "/api/v1/billing/plans/"
+
+
+def create_plan(**kwargs):
+    defaults = {"name": "Pro", "slug": "pro", "amount": "10.00"}
+    defaults.update(kwargs)
+    return Plan.objects.create(external_price_id=defaults["slug"], **defaults)
+
+
+@pytest.mark.django_db
+@pytest.mark.views
+class TestConditionalGet:
+    """Test ETag validation and rendered body caching of read endpoints."""
+
+    def test_response_has_validators(self, authenticated_api_client):
+        """Test that cacheable responses carry ETag and Last-Modified."""
+        response = authenticated_api_client.get(PLANS_URL)
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('W/"')
+        assert "Last-Modified" in response
+        assert "no-cache" in response["Cache-Control"]
+        assert "private" in response["Cache-Control"]
+
+    def test_matching_etag_returns_304_without_running_view(
+        self, authenticated_api_client
+    ):
+        """Test that If-None-Match is answered before the view runs."""
+        etag = authenticated_api_client.get(PLANS_URL)["ETag"]
+
+        with patch.object(PlanViewSet, "list") as view:
+            response = authenticated_api_client.get(PLANS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+        view.assert_not_called()
+
+    def test_cached_body_served_without_running_view(self, authenticated_api_client):
+        """Test that repeated requests are answered from the cached body."""
+        first = authenticated_api_client.get(PLANS_URL)
+
+        with patch.object(PlanViewSet, "list") as view:
+            second = authenticated_api_client.get(PLANS_URL)
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second["Content-Type"] == first["Content-Type"]
+        assert second["ETag"] == first["ETag"]
+        view.assert_not_called()
+
+    def test_if_modified_since(self, authenticated_api_client):
+        """Test that If-Modified-Since is honored for cached bodies."""
+        last_modified = authenticated_api_client.get(PLANS_URL)["Last-Modified"]
+
+        response = authenticated_api_client.get(
+            PLANS_URL, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        assert response.status_code == 304
+
+    def test_version_bump_invalidates(self, authenticated_api_client):
+        """Test that bumping the resource version changes the ETag."""
+        etag = authenticated_api_client.get(PLANS_URL)["ETag"]
+
+        bump_resource_version("plans")
+        response = authenticated_api_client.get(PLANS_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_errors_are_not_cached(self, api_client):
+        """Test that unauthenticated requests are refused, not served."""
+        response = api_client.get(PLANS_URL)
+
+        assert response.status_code == 401
+        assert "ETag" not in response
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestConditionalVersions:
+    """Test resource version stamps and ETag computation."""
+
+    def test_tenant_bump_is_scoped(self):
+        """Test that a tenant bump leaves other tenants' stamps alone."""
+        tenant_a = get_resource_versions("plans", "a")
+        tenant_b = get_resource_versions("plans", "b")
+        any_tenant = get_resource_versions("plans")
+
+        bump_resource_version("plans", "a")
+
+        assert get_resource_versions("plans", "a") != tenant_a
+        assert get_resource_versions("plans", "b") == tenant_b
+        assert get_resource_versions("plans") != any_tenant
+
+    def test_resource_bump_reaches_every_tenant(self):
+        """Test that bumping without a tenant invalidates all tenants."""
+        tenant_a = get_resource_versions("plans", "a")
+        any_tenant = get_resource_versions("plans")
+
+        bump_resource_version("plans")
+
+        assert get_resource_versions("plans", "a") != tenant_a
+        assert get_resource_versions("plans") != any_tenant
+
+    def test_plan_changes_bump_versions(self):
+        """Test that plan signals bump the stamps of the plan's tenant."""
+        organization = OrganizationFactory()
+        other = OrganizationFactory()
+        tenant = get_resource_versions("plans", organization.pk)
+        other_tenant = get_resource_versions("plans", other.pk)
+
+        plan = create_plan(organization=organization)
+        assert get_resource_versions("plans", organization.pk) != tenant
+        assert get_resource_versions("plans", other.pk) == other_tenant
+
+        create_plan(name="Global", slug="global")
+        assert get_resource_versions("plans", other.pk) != other_tenant
+
+        tenant = get_resource_versions("plans", organization.pk)
+        plan.delete()
+        assert get_resource_versions("plans", organization.pk) != tenant
+
+    def test_etag_varies_on_user_when_configured(self):
+        """Test that per-user resources get per-user ETags."""
+        factory = APIRequestFactory()
+        first, second = factory.get("/flags/"), factory.get("/flags/")
+        first.user, second.user = AccountFactory(), AccountFactory()
+
+        shared = ConditionalGet("flags")
+        per_user = ConditionalGet("flags", vary_on_user=True)
+
+        assert shared.get_etag(first) == shared.get_etag(second)
+        assert per_user.get_etag(first) != per_user.get_etag(second)
+
+    def test_etag_matches(self):
+        """Test weak comparison of If-None-Match headers."""
+        etag = 'W/"abc"'
+
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches('"abc"', etag)
+        assert etag_matches('"xyz", W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"xyz"', etag)
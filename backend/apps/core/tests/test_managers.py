@@ -21,7 +21,8 @@ from apps.core.models import TenantAwareModel
 Account = get_user_model()
 
 
-# Create a test model for manager testing
+# Create a test model for manager testing. Abstract, so it has no reverse
+# relation on Organization (there is no table to cascade deletes to)
 class SampleTenantModel(TenantAwareModel):
     """Test model for manager testing."""
 
@@ -31,6 +32,7 @@ class SampleTenantModel(TenantAwareModel):
     objects = TenantAwareManager()
 
     class Meta:
+        abstract = True
         app_label = "core"
 
 
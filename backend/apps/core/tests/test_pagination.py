@@ -5,15 +5,31 @@ Tests the RFC-compliant pagination classes that produce standardized
 paginated responses with proper metadata and envelope format.
 """
 
+from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
 
+from apps.accounts.tests.factories import AccountFactory
+from apps.core.audit.admin import AuditLogAdmin
+from apps.core.audit.models import AuditAction, AuditLog
 from apps.core.codes import APIResponseCodes
-from apps.core.pagination import CustomPaginationClass, StandardPagination
+from apps.core.counts import CachedCount, CappedCount, EstimatedCount
+from apps.core.pagination import (
+    CustomPaginationClass,
+    StandardCursorPagination,
+    StandardPagination,
+)
+from apps.organizations.models import Organization
+from apps.organizations.tests.factories import OrganizationFactory
 
 
 @pytest.mark.django_db
@@ -281,6 +297,161 @@ class TestStandardPagination:
         assert properties["data"]["items"] == item_schema
 
 
+@pytest.mark.django_db
+@pytest.mark.pagination
+class TestCountStrategies:
+    """Test pluggable count strategies of StandardPagination."""
+
+    def setup_method(self):
+        """Create a handful of organizations to count."""
+        self.factory = APIRequestFactory()
+        OrganizationFactory.create_batch(5)
+        self.request = Request(self.factory.get("/api/test/"))
+
+    def test_capped_count(self):
+        """Test counts stop at the limit and are then flagged inexact."""
+        queryset = Organization.objects.all()
+
+        assert CappedCount(limit=3).count(queryset, self.request) == (3, False)
+        assert CappedCount(limit=10).count(queryset, self.request) == (5, True)
+
+    def test_cached_count_keyed_by_query(self):
+        """Test cached counts are reused only for the same query."""
+        strategy = CachedCount(timeout=30)
+        queryset = Organization.objects.all()
+        assert strategy.count(queryset, self.request) == (5, True)
+
+        OrganizationFactory()
+        with CaptureQueriesContext(connection) as queries:
+            assert strategy.count(queryset, self.request) == (5, True)
+        assert len(queries.captured_queries) == 0
+
+        filtered = Organization.objects.filter(is_active=True)
+        assert strategy.count(filtered, self.request) == (6, True)
+
+    def test_cached_count_keyed_by_tenant(self):
+        """Test tenants never share a cached count for the same query."""
+        strategy = CachedCount(timeout=30)
+        queryset = Organization.objects.all()
+        self.request.org = OrganizationFactory()
+        assert strategy.count(queryset, self.request) == (6, True)
+
+        OrganizationFactory()
+        other = Request(self.factory.get("/api/test/"))
+        other.org = OrganizationFactory()
+
+        assert strategy.count(queryset, self.request) == (6, True)
+        assert strategy.count(queryset, other) == (8, True)
+
+    def test_estimated_count_falls_back_to_exact(self):
+        """Test estimates are only used for unfiltered PostgreSQL querysets."""
+        strategy = EstimatedCount(threshold=0)
+        filtered = Organization.objects.filter(is_active=True)
+
+        assert strategy.count(filtered, self.request) == (5, True)
+        if connection.vendor != "postgresql":
+            assert strategy.count(Organization.objects.all(), self.request) == (
+                5,
+                True,
+            )
+
+    def test_view_strategy_drives_metadata(self):
+        """Test an inexact count is reported and doesn't cap page numbers."""
+        view = Mock(count_strategy=CappedCount(limit=2))
+        pagination = StandardPagination()
+        queryset = Organization.objects.order_by("pk")
+
+        request = Request(self.factory.get("/api/test/", {"page_size": 2}))
+        page = pagination.paginate_queryset(queryset, request, view)
+        meta = pagination.get_paginated_response(page).data["pagination"]
+        assert meta["count"] == 2
+        assert meta["countIsExact"] is False
+        assert meta["totalPages"] == 1
+        assert meta["next"] == 2
+
+        # Pages past the capped count are still served
+        request = Request(self.factory.get("/api/test/", {"page_size": 2, "page": 3}))
+        page = pagination.paginate_queryset(queryset, request, view)
+        assert len(page) == 1
+        meta = pagination.get_paginated_response(page).data["pagination"]
+        assert meta["next"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.pagination
+class TestStandardCursorPagination:
+    """Test keyset pagination over (created_at, pk)."""
+
+    def setup_method(self):
+        """Create organizations sharing timestamps to exercise tie-breaks."""
+        self.factory = APIRequestFactory()
+        orgs = OrganizationFactory.create_batch(7)
+        now = timezone.now()
+        for index, org in enumerate(orgs):
+            Organization.objects.filter(pk=org.pk).update(
+                created_at=now - timedelta(minutes=index // 2)
+            )
+        self.expected = list(
+            Organization.objects.order_by("-created_at", "-pk").values_list(
+                "pk", flat=True
+            )
+        )
+
+    def paginate(self, **params):
+        pagination = StandardCursorPagination()
+        request = Request(self.factory.get("/api/test/", {"page_size": 3, **params}))
+        page = pagination.paginate_queryset(Organization.objects.all(), request)
+        response = pagination.get_paginated_response([org.pk for org in page])
+        return response.data
+
+    def test_walks_all_rows_forward_without_count(self):
+        """Test following next cursors yields every row once, in order."""
+        seen, cursor = [], None
+        with CaptureQueriesContext(connection) as queries:
+            while True:
+                data = self.paginate(**({"cursor": cursor} if cursor else {}))
+                seen += data["data"]
+                cursor = data["pagination"]["next"]
+                if cursor is None:
+                    break
+
+        assert seen == self.expected
+        assert len(queries.captured_queries) == 3
+        assert not any("COUNT" in q["sql"] for q in queries.captured_queries)
+        assert "count" not in data["pagination"]
+        assert data["status"] == 200
+        assert data["code"] == APIResponseCodes.GEN_LIST_200.value
+
+    def test_previous_cursor_returns_prior_page(self):
+        """Test the previous cursor walks back to the page before."""
+        first = self.paginate()
+        assert first["pagination"]["previous"] is None
+
+        second = self.paginate(cursor=first["pagination"]["next"])
+        back = self.paginate(cursor=second["pagination"]["previous"])
+
+        assert second["data"] == self.expected[3:6]
+        assert back["data"] == first["data"]
+        assert back["pagination"]["previous"] is None
+        assert back["pagination"]["next"] is not None
+
+    def test_tampered_cursor_rejected(self):
+        """Test cursors that weren't issued by the server are rejected."""
+        cursor = self.paginate()["pagination"]["next"]
+
+        with pytest.raises(NotFound):
+            self.paginate(cursor=cursor[:-2] + "xx")
+
+    def test_get_paginated_response_schema(self):
+        """Test the schema documents cursors instead of page numbers."""
+        schema = StandardCursorPagination().get_paginated_response_schema({})
+
+        pagination_props = schema["properties"]["pagination"]["properties"]
+        assert set(pagination_props) == {"next", "previous", "pageSize"}
+        assert pagination_props["next"]["type"] == "string"
+        assert pagination_props["next"]["nullable"] is True
+
+
 @pytest.mark.django_db
 @pytest.mark.pagination
 class TestCustomPaginationClass:
@@ -504,3 +675,30 @@ class TestPaginationIntegration:
         assert hasattr(
             legacy_pagination, "max_page_size"
         )  # Inherits from DRF base class
+
+
+@pytest.mark.django_db
+@pytest.mark.pagination
+class TestAuditLogAdminCount:
+    """Test the audit log admin list doesn't count the whole table."""
+
+    def test_changelist_uses_count_strategy(self, client, monkeypatch):
+        """Test a capped count still serves the list and its later pages."""
+        admin = AccountFactory(is_staff=True, is_superuser=True)
+        client.force_login(admin)
+        for _ in range(3):
+            AuditLog.log_event(event_type=AuditAction.DATA_DELETE, user=admin)
+        monkeypatch.setattr(AuditLogAdmin, "count_strategy", CappedCount(limit=2))
+        monkeypatch.setattr(AuditLogAdmin, "list_per_page", 1)
+        url = reverse(f"admin:{AuditLog._meta.app_label}_auditlog_changelist")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, {"p": 3})
+
+        assert response.status_code == 200
+        assert len(response.context["cl"].result_list) == 1
+        assert not any(
+            "COUNT(*)" in q["sql"] and "LIMIT" not in q["sql"]
+            for q in queries.captured_queries
+            if "core_auditlog" in q["sql"]
+        )
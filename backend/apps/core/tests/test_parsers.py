@@ -0,0 +1,90 @@
+"""
+Tests for the camelCase JSON request parser.
+"""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.tests.factories import AccountFactory
+from apps.core.parsers import FastCamelCaseJSONParser, RequestBodyTooLarge
+
+PAYLOAD = {
+    "flagKeys": ["analytics", "betaUi"],
+    "targetType": "user",
+    "targetIds": ["a", "b"],
+    "ruleSettings": {"rolloutPercentage": 50.5, "isEnabled": True, "v2Api": None},
+    "items": [{"recipientEmail": "a@example.com", "contextData": {"firstName": "A"}}],
+    "HTTPResponseCode": 200,
+}
+
+
+def parse(parser, data, **meta):
+    body = json.dumps(data).encode()
+    request = Mock(META={"CONTENT_LENGTH": str(len(body)), **meta})
+    context = {"request": request}
+    return parser.parse(io.BytesIO(body), "application/json", context)
+
+
+@pytest.mark.unit
+class TestFastCamelCaseJSONParser:
+    """Test the parser matches the library parser and enforces its limits."""
+
+    def test_same_result_as_library_parser(self):
+        """Test keys are translated exactly like CamelCaseJSONParser does."""
+        expected = parse(CamelCaseJSONParser(), PAYLOAD)
+
+        assert parse(FastCamelCaseJSONParser(), PAYLOAD) == expected
+        with patch("apps.core.parsers.orjson", None):
+            assert parse(FastCamelCaseJSONParser(), PAYLOAD) == expected
+        assert expected["rule_settings"]["rollout_percentage"] == 50.5
+
+    def test_malformed_body_is_parse_error(self):
+        """Test invalid JSON still raises ParseError."""
+        from rest_framework.exceptions import ParseError
+
+        request = Mock(META={})
+        with pytest.raises(ParseError):
+            FastCamelCaseJSONParser().parse(
+                io.BytesIO(b'{"a": '), "application/json", {"request": request}
+            )
+
+    @override_settings(JSON_PARSER={"MAX_BODY_SIZE": 64})
+    def test_body_size_limit(self):
+        """Test bodies over the limit are refused, with or without a length."""
+        parser = FastCamelCaseJSONParser()
+
+        with pytest.raises(RequestBodyTooLarge):
+            parse(parser, PAYLOAD)
+        # Missing Content-Length: the limit applies to what is read
+        with pytest.raises(RequestBodyTooLarge):
+            parse(parser, PAYLOAD, CONTENT_LENGTH="")
+        assert parse(parser, {"targetType": "user"}) == {"target_type": "user"}
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestRequestBodyLimitResponse:
+    """Test oversized bodies are answered with a problem-details 413."""
+
+    @override_settings(JSON_PARSER={"MAX_BODY_SIZE": 16})
+    def test_oversized_body_returns_413(self):
+        """Test the exception handler renders the 413 response."""
+        client = APIClient()
+        client.force_authenticate(user=AccountFactory())
+
+        response = client.post(
+            reverse("organization-list"),
+            {"name": "A name long enough to exceed the limit"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert response.data["code"] == "VDJ-GEN-BAD-413"
@@ -417,13 +417,12 @@ class TestRateLimitMiddleware:
 
             assert middleware.enabled is True
             assert middleware.global_limits == rate_limit_settings["DEFAULT_LIMITS"]
-            assert middleware.endpoint_limits == rate_limit_settings["ENDPOINT_LIMITS"]
 
     def test_middleware_skip_excluded_paths(self, rate_limit_settings):
         """Test middleware skips excluded paths."""
         with override_settings(RATE_LIMITING=rate_limit_settings):
             request = Mock()
-            request.path = "/admin/users/"
+            request.path = request.path_info = "/admin/users/"
 
             middleware = RateLimitMiddleware(Mock())
             result = middleware.process_request(request)
@@ -434,7 +433,7 @@ class TestRateLimitMiddleware:
         """Test middleware skips static files."""
         with override_settings(RATE_LIMITING=rate_limit_settings):
             request = Mock()
-            request.path = "/static/css/style.css"
+            request.path = request.path_info = "/static/css/style.css"
 
             middleware = RateLimitMiddleware(Mock())
             result = middleware.process_request(request)
@@ -36,7 +36,7 @@ class TestConsistentDataRenderer:
         simple_data = {"message": "Hello World", "status_code": 200, "user_id": 123}
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = json.dumps(
                 {"message": "Hello World", "statusCode": 200, "userId": 123}
@@ -81,7 +81,7 @@ class TestConsistentDataRenderer:
         }
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = json.dumps(expected_camel_case).encode()
 
@@ -107,7 +107,7 @@ class TestConsistentDataRenderer:
         ]
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = json.dumps(expected_camel_case).encode()
 
@@ -148,7 +148,7 @@ class TestConsistentDataRenderer:
         }
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = json.dumps(expected_camel_case).encode()
 
@@ -179,7 +179,7 @@ class TestConsistentDataRenderer:
         }
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = json.dumps(expected_camel_case).encode()
 
@@ -192,7 +192,7 @@ class TestConsistentDataRenderer:
     def test_render_none_data(self, mock_render_context):
         """Test rendering None data."""
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = b"null"
 
@@ -214,7 +214,7 @@ class TestConsistentDataRenderer:
 
         for data, expected_json in empty_data_cases:
             with patch(
-                "apps.core.renderers.CamelCaseJSONRenderer.render"
+                "apps.core.renderers.FastCamelCaseJSONRenderer.render"
             ) as mock_parent_render:
                 mock_parent_render.return_value = expected_json
 
@@ -239,7 +239,7 @@ class TestConsistentDataRenderer:
 
         for media_type in media_types:
             with patch(
-                "apps.core.renderers.CamelCaseJSONRenderer.render"
+                "apps.core.renderers.FastCamelCaseJSONRenderer.render"
             ) as mock_parent_render:
                 mock_parent_render.return_value = b'{"testField": "value"}'
 
@@ -254,7 +254,7 @@ class TestConsistentDataRenderer:
         data = {"test_field": "value"}
 
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = b'{"testField": "value"}'
 
@@ -271,7 +271,7 @@ class TestConsistentDataRenderer:
 
         # Test that it calls parent with exact same parameters
         with patch(
-            "apps.core.renderers.CamelCaseJSONRenderer.render"
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
         ) as mock_parent_render:
             mock_parent_render.return_value = b"camelized_json"
 
@@ -471,7 +471,9 @@ class TestRendererComparison:
         snake_renderer = ConsistentDataJSONRenderer()
 
         # Mock CamelCaseJSONRenderer to return camelized data
-        with patch("apps.core.renderers.CamelCaseJSONRenderer.render") as mock_camel:
+        with patch(
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
+        ) as mock_camel:
             camelized_data = {
                 "userId": 123,
                 "firstName": "John",
@@ -543,7 +545,9 @@ class TestRendererEdgeCases:
         camel_renderer = ConsistentDataRenderer()
         data = {"test": "data"}
 
-        with patch("apps.core.renderers.CamelCaseJSONRenderer.render") as mock_parent:
+        with patch(
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
+        ) as mock_parent:
             mock_parent.side_effect = Exception("Parent renderer failed")
 
             # Should propagate the exception
@@ -564,7 +568,9 @@ class TestRendererEdgeCases:
 
         camel_renderer = ConsistentDataRenderer()
 
-        with patch("apps.core.renderers.CamelCaseJSONRenderer.render") as mock_parent:
+        with patch(
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
+        ) as mock_parent:
             # Simulate successful rendering of large data
             mock_parent.return_value = b'{"large": "data"}'
 
@@ -585,7 +591,9 @@ class TestRendererEdgeCases:
 
         camel_renderer = ConsistentDataRenderer()
 
-        with patch("apps.core.renderers.CamelCaseJSONRenderer.render") as mock_parent:
+        with patch(
+            "apps.core.renderers.FastCamelCaseJSONRenderer.render"
+        ) as mock_parent:
             # Parent would typically raise ValueError for circular refs
             mock_parent.side_effect = ValueError("Circular reference detected")
 
@@ -622,3 +630,97 @@ class TestRendererEdgeCases:
 
             mock_parent.assert_called_once()
             assert result is not None
+
+
+def sample_payload():
+    """Payload exercising every value type the renderers see."""
+    import datetime
+    import decimal
+    from uuid import UUID
+
+    from django.utils import timezone
+    from django.utils.translation import gettext_lazy
+
+    return {
+        "status": 200,
+        "i18n_key": "list.ok",
+        "pagination": {"count": 2, "page_size": 20, "next": None},
+        "data": [
+            {
+                "id": UUID("12345678-1234-5678-1234-123456789abc"),
+                "created_at": timezone.now(),
+                "naive_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678),
+                "trial_ends_on": datetime.date(2026, 10, 18),
+                "amount": decimal.Decimal("123.45"),
+                "tiny_amount": decimal.Decimal("0.00001"),
+                "ratio": 0.1,
+                "small_ratio": 1e-7,
+                "large_value": 1e16,
+                "is_active": True,
+                "display_name": "Zo\u00eb \u2028 \u540d\u524d",
+                "label": gettext_lazy("Active"),
+                "tags": ("a", "b"),
+                "roles": {"owner"},
+                "settings_2fa": {"mfa_enabled": False, 3: "non string key"},
+            },
+            {"id": 2, "nested_list": [[{"deep_key": 1}]], "big_int": 2**70},
+        ],
+    }
+
+
+@pytest.mark.renderers
+class TestFastCamelCaseJSONRenderer:
+    """Test the fast renderer is byte-compatible with CamelCaseJSONRenderer."""
+
+    def render_both(self, data, accepted_media_type="application/json"):
+        from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+        expected = CamelCaseJSONRenderer().render(data, accepted_media_type, {})
+        actual = ConsistentDataRenderer().render(data, accepted_media_type, {})
+        return expected, actual
+
+    def test_byte_compatible(self):
+        """Test mixed payloads render to the same bytes."""
+        expected, actual = self.render_both(sample_payload())
+
+        assert actual == expected
+        assert b'"i18nKey"' in actual
+        assert b'"settings2fa"' in actual
+
+    def test_byte_compatible_on_orjson_path(self):
+        """Test payloads orjson can encode itself render to the same bytes."""
+        from apps.core import renderers
+
+        data = sample_payload()
+        data["data"][0].pop("settings_2fa")
+        data["data"][0].pop("small_ratio")
+        data["data"][0].pop("large_value")
+        data["data"][1].pop("big_int")
+
+        with patch.object(
+            renderers.orjson, "dumps", wraps=renderers.orjson.dumps
+        ) as dumps:
+            expected, actual = self.render_both(data)
+
+        assert actual == expected
+        assert b"\\u2028" in actual
+        dumps.assert_called_once()
+
+    def test_byte_compatible_without_orjson(self):
+        """Test the json module fallback when orjson isn't installed."""
+        with patch("apps.core.renderers.orjson", None):
+            expected, actual = self.render_both(sample_payload())
+
+        assert actual == expected
+
+    def test_byte_compatible_with_indent(self):
+        """Test indented output requested through the media type."""
+        expected, actual = self.render_both(
+            sample_payload(), "application/json; indent=4"
+        )
+
+        assert actual == expected
+
+    def test_render_none(self):
+        """Test None renders to an empty body."""
+        assert ConsistentDataRenderer().render(None) == b""
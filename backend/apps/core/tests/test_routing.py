@@ -0,0 +1,117 @@
+"""
+Tests for the shared route classifier used by the middleware stack.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from apps.core.utils.routing import (
+    RouteClassifier,
+    RouteInfo,
+    get_route_info,
+    route_classifier,
+)
+
+
+@pytest.mark.unit
+class TestRouteClassifier:
+    """Test path classification and memoization."""
+
+    def test_classifies_tenant_scoped_api_path(self):
+        """Test regular API paths require an organization context."""
+        info = RouteClassifier().classify("/api/v1/organizations/")
+
+        assert info.requires_tenant is True
+        assert info.rate_limit_exempt is False
+        assert info.skip_audit_logging is False
+        assert info.skip_metrics is False
+
+    def test_classifies_exempt_paths(self):
+        """Test auth, docs and static paths are flagged correctly."""
+        classifier = RouteClassifier()
+
+        assert classifier.classify("/api/v1/auth/login/").requires_tenant is False
+        assert classifier.classify("/api/docs/").rate_limit_exempt is True
+        assert classifier.classify("/admin/login/").requires_tenant is False
+
+        static = classifier.classify("/static/css/app.css")
+        assert static.rate_limit_exempt is True
+        assert static.skip_audit_logging is True
+        assert static.skip_metrics is True
+        assert static.requires_tenant is False
+
+    def test_resolves_endpoint_name_and_route(self):
+        """Test the URL is resolved to its name and route template."""
+        info = RouteClassifier().classify("/api/v1/auth/login/")
+
+        assert info.endpoint_name == "login"
+        assert info.route == "api/v1/auth/login/"
+        assert info.metrics_endpoint == "/api/v1/auth/login/"
+
+    def test_unresolvable_path(self):
+        """Test unknown paths fall back to 'unknown' and the raw path."""
+        info = RouteClassifier().classify("/does-not-exist/")
+
+        assert info.endpoint_name == "unknown"
+        assert info.route is None
+        assert info.metrics_endpoint == "/does-not-exist/"
+
+    def test_rate_limit_policy_from_endpoint_limits(self):
+        """Test endpoint-specific rate limit policies are attached."""
+        limits = {"login": {"PER_IP": "5/minute"}}
+        with override_settings(RATE_LIMITING={"ENDPOINT_LIMITS": limits}):
+            info = RouteClassifier().classify("/api/v1/auth/login/")
+
+        assert info.rate_limit_policy == {"PER_IP": "5/minute"}
+
+    def test_paths_are_resolved_once(self):
+        """Test repeated classification of a path hits the memo."""
+        classifier = RouteClassifier()
+
+        with patch("apps.core.utils.routing.resolve") as mock_resolve:
+            mock_resolve.return_value.url_name = "organization-list"
+            mock_resolve.return_value.route = "api/v1/organizations/"
+            mock_resolve.return_value.view_name = "organization-list"
+
+            for _ in range(3):
+                classifier.classify("/api/v1/organizations/")
+
+        assert mock_resolve.call_count == 1
+        assert classifier.cache_info().hits == 2
+
+    def test_setting_change_resets_classifier(self):
+        """Test overriding settings rebuilds the shared classifier."""
+        route_classifier.classify("/custom/")
+
+        with override_settings(TENANT_EXEMPT_PATHS=["/api/v1/public/"]):
+            assert route_classifier.cache_info().currsize == 0
+            info = route_classifier.classify("/api/v1/public/things/")
+            assert info.requires_tenant is False
+
+        assert route_classifier.classify("/api/v1/public/things/").requires_tenant
+
+
+@pytest.mark.unit
+class TestGetRouteInfo:
+    """Test request-level caching of route information."""
+
+    def test_stores_route_info_on_request(self):
+        """Test the classification is stored on the request."""
+        request = RequestFactory().get("/api/v1/organizations/")
+
+        info = get_route_info(request)
+
+        assert isinstance(info, RouteInfo)
+        assert request.route_info is info
+
+    def test_reuses_route_info_on_request(self):
+        """Test later middleware reuse the stored classification."""
+        request = RequestFactory().get("/api/v1/organizations/")
+        first = get_route_info(request)
+
+        with patch.object(route_classifier, "classify") as mock_classify:
+            assert get_route_info(request) is first
+
+        mock_classify.assert_not_called()
@@ -0,0 +1,137 @@
+"""
+Tests for deferred post-commit side effects.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from apps.core.side_effects import (
+    collect_side_effects,
+    defer,
+    run_effects,
+    side_effect,
+)
+
+calls = []
+ran = threading.Event()
+
+
+@side_effect
+def record(value):
+    """Side effect used by the tests."""
+    calls.append(value)
+    ran.set()
+
+
+@side_effect
+def explode():
+    """Side effect that always fails."""
+    raise RuntimeError("boom")
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestSideEffects:
+    """Test side effects run after commit, batched per request."""
+
+    @pytest.fixture(autouse=True)
+    def deferred_settings(self, settings):
+        settings.SIDE_EFFECTS = {"ALWAYS_EAGER": False}
+        calls.clear()
+        ran.clear()
+
+    def test_effects_wait_for_commit(self, django_capture_on_commit_callbacks):
+        """Test nothing runs until the transaction commits."""
+        with django_capture_on_commit_callbacks(execute=True):
+            defer(record, value="welcome")
+            assert calls == []
+
+        assert calls == ["welcome"]
+
+    def test_rolled_back_effects_never_run(self, django_capture_on_commit_callbacks):
+        """Test effects deferred in a rolled back block are dropped."""
+        with django_capture_on_commit_callbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    defer(record, value="welcome")
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+
+        assert calls == []
+
+    def test_request_effects_dispatch_as_one_task(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test effects committed during a request share one Celery task."""
+        with patch("apps.core.tasks.run_side_effects.apply_async") as apply_async:
+            with collect_side_effects():
+                with django_capture_on_commit_callbacks(execute=True):
+                    defer(record, value="email")
+                    defer(record, value="audit")
+
+        apply_async.assert_called_once()
+        assert apply_async.call_args.kwargs["args"] == [
+            [
+                ["apps.core.tests.test_side_effects.record", {"value": "email"}],
+                ["apps.core.tests.test_side_effects.record", {"value": "audit"}],
+            ]
+        ]
+
+    def test_broker_failure_falls_back_to_thread_pool(
+        self, django_capture_on_commit_callbacks
+    ):
+        """Test effects still run locally when the broker is unreachable."""
+        with patch(
+            "apps.core.tasks.run_side_effects.apply_async",
+            side_effect=ConnectionError("broker down"),
+        ):
+            with django_capture_on_commit_callbacks(execute=True):
+                defer(record, value="email")
+
+        assert ran.wait(timeout=5)
+        assert calls == ["email"]
+
+    def test_failing_effect_does_not_block_batch(self):
+        """Test one failing effect is isolated from the rest."""
+        failed = run_effects(
+            [
+                ("apps.core.tests.test_side_effects.explode", {}),
+                ("apps.core.tests.test_side_effects.record", {"value": "audit"}),
+            ]
+        )
+
+        assert failed == 1
+        assert calls == ["audit"]
+
+    def test_unregistered_functions_are_refused(self):
+        """Test only registered module-level functions can be deferred."""
+
+        def nested(value):
+            calls.append(value)
+
+        with pytest.raises(ValueError):
+            defer(threading.current_thread)
+        with pytest.raises(ValueError):
+            defer(nested, value="email")
+        with pytest.raises(ValueError):
+            side_effect(nested)
+        with pytest.raises(ValueError):
+            side_effect(lambda: None)
+
+    def test_unregistered_names_never_run(self):
+        """Test a payload naming an unregistered function isn't imported."""
+        with patch("subprocess.getoutput") as getoutput:
+            failed = run_effects(
+                [
+                    ("subprocess.getoutput", {"cmd": "id"}),
+                    ("apps.core.tests.test_side_effects.record", {"value": "audit"}),
+                ]
+            )
+
+        assert failed == 1
+        getoutput.assert_not_called()
+        assert calls == ["audit"]
@@ -0,0 +1,51 @@
+"""
+Memoized camelCase <-> snake_case key translation.
+
+API payloads reuse a small vocabulary of keys ("created_at", "member_count",
+...) across every object of every request and response, so translating each
+key with a regex, as djangorestframework_camel_case does, repeats the same
+work thousands of times per large list. The translations here produce the
+same keys as the library and remember them in bounded tables.
+"""
+
+from djangorestframework_camel_case.util import (
+    camel_to_underscore,
+    camelize_re,
+    underscore_to_camel,
+)
+
+# Keys can come from user data (JSON fields), so the tables stop growing at
+# this size; lookups of keys beyond it are translated every time.
+MAX_CACHED_KEYS = 8192
+
+_camel_keys: dict[str, str] = {}
+_underscore_keys: dict[tuple[str, bool], str] = {}
+
+
+def camelize_key(key: str) -> str:
+    """Translate a snake_case key like the camel case renderer does."""
+    try:
+        return _camel_keys[key]
+    except KeyError:
+        pass
+
+    camel = camelize_re.sub(underscore_to_camel, key) if "_" in key else key
+    if len(_camel_keys) < MAX_CACHED_KEYS:
+        _camel_keys[key] = camel
+    return camel
+
+
+def underscore_key(key: str, no_underscore_before_number: bool = False) -> str:
+    """Translate a camelCase key like the camel case parsers do."""
+    cache_key = (key, no_underscore_before_number)
+    try:
+        return _underscore_keys[cache_key]
+    except KeyError:
+        pass
+
+    snake = camel_to_underscore(
+        key, no_underscore_before_number=no_underscore_before_number
+    )
+    if len(_underscore_keys) < MAX_CACHED_KEYS:
+        _underscore_keys[cache_key] = snake
+    return snake
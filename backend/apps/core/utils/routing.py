@@ -0,0 +1,193 @@
+"""
+Route classification shared by the custom middleware stack.
+
+Rate limiting, tenant resolution, audit logging and metrics all need to know
+"what kind of request is this?". Instead of every middleware scanning its own
+prefix list and re-resolving the URL, the classifier resolves each path once,
+derives every flag in a single pass and memoizes the result per path.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+# Paths that never require an organization context
+DEFAULT_TENANT_EXEMPT_PATHS = (
+    "/admin/",
+    "/api/v1/auth/",
+    "/api/v1/accounts/users/me/",  # User profile doesn't need org
+    "/api/v1/capabilities/",  # Capabilities endpoint is public
+    "/api/v1/organizations/exports/",  # Signed export download links
+    "/api/docs/",
+    "/api/redoc/",
+    "/api/schema/",
+    "/health/",
+    "/ready/",
+)
+
+# Paths excluded from rate limiting when RATE_LIMITING has no EXCLUDED_PATHS
+DEFAULT_RATE_LIMIT_EXCLUDED_PATHS = (
+    "/admin/",
+    "/api/schema/",
+    "/api/docs/",
+    "/api/redoc/",
+    "/health/",
+    "/ping/",
+)
+
+# Static assets are never rate limited, logged or measured
+STATIC_PATHS = ("/static/", "/media/")
+
+AUDIT_EXCLUDED_PATHS = (
+    "/static/",
+    "/media/",
+    "/health/",
+    "/ready/",
+    "/__debug__/",
+    "/favicon.ico",
+)
+
+METRICS_EXCLUDED_PATHS = ("/static/", "/media/", "/metrics", "/favicon.ico")
+
+# Settings that invalidate the memoized classifications when changed
+_CLASSIFIER_SETTINGS = {
+    "ROOT_URLCONF",
+    "RATE_LIMITING",
+    "TENANT_EXEMPT_PATHS",
+    "ROUTE_CLASSIFIER_CACHE_SIZE",
+}
+
+
+@dataclass(frozen=True)
+class RouteInfo:
+    """Everything the middleware stack needs to know about a request path."""
+
+    path: str
+    endpoint_name: str
+    route: str | None
+    view_name: str | None
+    requires_tenant: bool
+    rate_limit_exempt: bool
+    rate_limit_policy: dict | None
+    skip_audit_logging: bool
+    skip_metrics: bool
+
+    @property
+    def metrics_endpoint(self) -> str:
+        """Low-cardinality endpoint label for metrics."""
+        if self.route:
+            return f"/{self.route}"
+        if self.view_name:
+            return self.view_name
+        return self.path
+
+
+class RouteClassifier:
+    """
+    Classifies request paths using the URLconf and settings.
+
+    Prefix lists are read from settings once and kept as tuples so each check
+    is a single ``str.startswith`` call. Results are memoized in a bounded LRU
+    keyed by path, so a given path is resolved at most once per process.
+    """
+
+    def __init__(self):
+        self._classify = None
+        self.reset()
+
+    def reset(self):
+        """Rebuild the classifier from current settings and drop memoized routes."""
+        rate_limiting = getattr(settings, "RATE_LIMITING", {})
+
+        self.tenant_exempt_paths = tuple(
+            getattr(settings, "TENANT_EXEMPT_PATHS", DEFAULT_TENANT_EXEMPT_PATHS)
+        )
+        self.rate_limit_excluded_paths = (
+            tuple(
+                rate_limiting.get("EXCLUDED_PATHS", DEFAULT_RATE_LIMIT_EXCLUDED_PATHS)
+            )
+            + STATIC_PATHS
+        )
+        self.endpoint_limits = rate_limiting.get("ENDPOINT_LIMITS", {})
+
+        cache_size = getattr(settings, "ROUTE_CLASSIFIER_CACHE_SIZE", 4096)
+        self._classify = lru_cache(maxsize=cache_size)(self._build_route_info)
+
+    def classify(self, path: str) -> RouteInfo:
+        """Return the (memoized) RouteInfo for a path."""
+        return self._classify(path)
+
+    def cache_info(self):
+        """Expose LRU statistics for debugging and tests."""
+        return self._classify.cache_info()
+
+    def _build_route_info(self, path: str) -> RouteInfo:
+        endpoint_name, route, view_name = self._resolve(path)
+
+        return RouteInfo(
+            path=path,
+            endpoint_name=endpoint_name,
+            route=route,
+            view_name=view_name,
+            requires_tenant=(
+                path.startswith("/api/")
+                and not path.startswith(self.tenant_exempt_paths)
+            ),
+            rate_limit_exempt=path.startswith(self.rate_limit_excluded_paths),
+            rate_limit_policy=self.endpoint_limits.get(endpoint_name),
+            skip_audit_logging=path.startswith(AUDIT_EXCLUDED_PATHS),
+            skip_metrics=path.startswith(METRICS_EXCLUDED_PATHS),
+        )
+
+    def _resolve(self, path: str) -> tuple[str, str | None, str | None]:
+        """Resolve a path to (endpoint name, route template, view name)."""
+        try:
+            match = resolve(path)
+        except Resolver404:
+            return "unknown", None, None
+        except Exception as e:
+            logger.debug(f"Could not resolve path {path}: {e}")
+            return "unknown", None, None
+
+        if match.url_name:
+            endpoint_name = match.url_name
+        elif match.view_name:
+            endpoint_name = match.view_name.split(".")[-1]  # Get the last part
+        elif hasattr(match.func, "__name__"):
+            endpoint_name = match.func.__name__
+        elif hasattr(match.func, "view_class"):
+            endpoint_name = match.func.view_class.__name__
+        else:
+            endpoint_name = "unknown"
+
+        return endpoint_name, match.route or None, match.view_name or None
+
+
+route_classifier = RouteClassifier()
+
+
+def get_route_info(request) -> RouteInfo:
+    """
+    Get the RouteInfo for a request, classifying it on first access.
+
+    The result is stored on ``request.route_info`` so every middleware after
+    the first one reuses it without touching the classifier.
+    """
+    route_info = getattr(request, "route_info", None)
+    if not isinstance(route_info, RouteInfo):
+        route_info = route_classifier.classify(request.path_info)
+        request.route_info = route_info
+    return route_info
+
+
+@receiver(setting_changed)
+def _reset_route_classifier(*, setting, **kwargs):
+    if setting in _CLASSIFIER_SETTINGS:
+        route_classifier.reset()
@@ -2,23 +2,18 @@
 Core application views including platform capabilities endpoint.
 """
 
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
 from drf_spectacular.utils import extend_schema
-from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from apps.core.capabilities import get_platform_capabilities
-from apps.core.responses import ok
+from apps.core.capabilities import get_capabilities_document
+from apps.core.conditional import etag_matches
 
 
-@extend_schema(
-    summary="Get platform capabilities",
-    description="Returns capability map indicating which features are enabled based on deployment mode (Global vs Multi-Tenant)",
-    tags=["Core"],
-)
-@api_view(["GET"])
-@permission_classes([AllowAny])  # Public endpoint - no auth required
-def capabilities_view(request):
+class CapabilitiesView(APIView):
     """
     Get platform capabilities.
 
@@ -26,6 +21,43 @@ def capabilities_view(request):
     is running in Global Mode or Multi-Tenant Mode.
 
     Frontend applications use this to conditionally show/hide features.
+
+    Every SPA boot requests this, so GET and HEAD skip DRF's request
+    wrapping, authentication and content negotiation and return the body
+    rendered once by apps.core.capabilities, or 304 for a matching ETag.
     """
-    capabilities = get_platform_capabilities()
-    return ok(data=capabilities)
+
+    authentication_classes = []
+    permission_classes = [AllowAny]  # Public endpoint - no auth required
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in ("GET", "HEAD"):
+            return self.precomputed_response(request)
+        return super().dispatch(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Get platform capabilities",
+        description="Returns capability map indicating which features are enabled based on deployment mode (Global vs Multi-Tenant)",
+        tags=["Core"],
+    )
+    def get(self, request):
+        return self.precomputed_response(request)
+
+    def precomputed_response(self, request):
+        document = get_capabilities_document()
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and etag_matches(if_none_match, document.etag):
+            response = HttpResponseNotModified()
+        else:
+            response = Response(document.envelope)
+            # Assigning the content marks the response as rendered
+            response.content = document.body
+            response["Content-Type"] = document.content_type
+
+        response["ETag"] = document.etag
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+
+capabilities_view = CapabilitiesView.as_view()
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_service', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['created_at', 'id'], name='emaillog_created_idx'),
+        ),
+    ]
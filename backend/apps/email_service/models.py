@@ -130,6 +130,8 @@ class EmailLog(BaseFields):
             models.Index(fields=["recipient_email", "-created_at"]),
             models.Index(fields=["status", "-created_at"]),
             models.Index(fields=["template_slug", "-created_at"]),
+            # Keyset walk in cleanup_old_email_logs
+            models.Index(fields=["created_at", "id"], name="emaillog_created_idx"),
         ]
 
     def __str__(self):
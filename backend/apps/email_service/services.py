@@ -7,6 +7,8 @@ from django.contrib.auth import get_user_model
 from django.core.mail import EmailMultiAlternatives
 from django.utils import timezone as django_timezone
 
+from apps.core.batch_jobs import BatchJob, run_batch_job
+
 from .models import EmailLog, EmailStatus, EmailTemplate
 from .renderers import TemplateRenderer
 
@@ -405,20 +407,29 @@ def send_email_task(self, email_log_id: int):
         return False
 
 
-@shared_task
-def cleanup_old_email_logs():
-    """Celery task to cleanup old email logs (run periodically)"""
-    from datetime import timedelta
+class EmailLogCleanup(BatchJob):
+    """Delete email logs older than 90 days."""
 
-    from django.utils import timezone
+    name = "email_service.cleanup_old_email_logs"
+    batch_size = 1000
 
-    log.info("Starting email logs cleanup task")
+    def get_params(self):
+        from datetime import timedelta
+
+        return {"cutoff": django_timezone.now() - timedelta(days=90)}
 
-    # Delete logs older than 90 days
-    cutoff_date = timezone.now() - timedelta(days=90)
-    log.debug(f"Deleting email logs older than {cutoff_date}")
+    def get_queryset(self):
+        return EmailLog.objects.filter(created_at__lt=self.params["cutoff"])
+
+
+@shared_task(bind=True)
+def cleanup_old_email_logs(self):
+    """Celery task to cleanup old email logs (run periodically)"""
+    log.info("Starting email logs cleanup task")
 
-    deleted_count = EmailLog.objects.filter(created_at__lt=cutoff_date).delete()[0]
+    # Delete logs older than 90 days in checkpointed batches
+    result = run_batch_job(self, EmailLogCleanup())
+    deleted_count = result.processed
 
     log.info(f"Email logs cleanup completed: deleted {deleted_count} old logs")
     return deleted_count
@@ -10,6 +10,8 @@ from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core.pagination import StandardCursorPagination
+
 from .models import EmailLog, EmailTemplate
 from .renderers import TemplateRenderer
 from .serializers import (
@@ -269,6 +271,8 @@ class EmailLogViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = EmailLog.objects.all()
     serializer_class = EmailLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Email logs grow without bound; keyset pages stay fast however deep
+    pagination_class = StandardCursorPagination
 
     def get_queryset(self):
         """Return email logs for the current organization."""
@@ -5,3 +5,7 @@ class FeatureFlagsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.feature_flags"
     verbose_name = "Feature Flags"
+
+    def ready(self):
+        """Connect cached response invalidation signal handlers."""
+        from . import signals  # noqa: F401
@@ -10,6 +10,8 @@ from typing import Any
 
 from django.db import transaction
 
+from apps.core.conditional import bump_resource_version
+
 from ..models import FeatureAccess, FeatureFlag, UserOnboardingProgress
 from .cache_service import FeatureFlagCacheService
 
@@ -349,6 +351,8 @@ class FeatureFlagService:
         """
         if self.use_cache:
             self.cache_service.invalidate_all_flag_caches(flag_key)
+        # Flag listings are cached as rendered responses, whatever use_cache says
+        bump_resource_version("feature_flags")
 
     def _evaluate_flag_for_user(
         self, user, flag_key: str, organization=None
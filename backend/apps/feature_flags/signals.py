@@ -0,0 +1,36 @@
+"""
+Signal handlers invalidating cached feature flag responses.
+
+Flag listings are served through apps.core.conditional; any change to a flag
+or one of its access rules bumps their version stamp.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.conditional import bump_resource_version
+
+from .models import FeatureAccess, FeatureFlag
+
+
+def bump_flags_version(organization_id):
+    bump_resource_version("feature_flags", organization_id)
+    # Again after commit, so a concurrent request can't cache pre-commit rows
+    transaction.on_commit(
+        lambda: bump_resource_version("feature_flags", organization_id)
+    )
+
+
+@receiver(post_save, sender=FeatureFlag)
+@receiver(post_delete, sender=FeatureFlag)
+def invalidate_flag_responses(sender, instance, **kwargs):
+    """Invalidate flag responses when a flag is created, updated or deleted."""
+    bump_flags_version(instance.organization_id)
+
+
+@receiver(post_save, sender=FeatureAccess)
+@receiver(post_delete, sender=FeatureAccess)
+def invalidate_access_rule_responses(sender, instance, **kwargs):
+    """Invalidate flag responses, which count access rules, on rule changes."""
+    bump_flags_version(instance.organization_id)
@@ -23,8 +23,11 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.cache import AccountCache
+from apps.core.conditional import ConditionalGetMixin
 from apps.core.pagination import StandardPagination
 from apps.core.responses import created
+from apps.organizations.cache import MembershipCache
 
 from ..models import FeatureAccess, FeatureFlag
 from ..serializers import (
@@ -79,13 +82,17 @@ logger = logging.getLogger(__name__)
         tags=["Feature Flags"],
     ),
 )
-class FeatureFlagViewSet(viewsets.ModelViewSet):
+class FeatureFlagViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing feature flags.
 
     Provides CRUD operations for feature flags with proper permissions
     and tenant isolation. Supports global flags, percentage rollouts,
     time-based scheduling, and environment-specific activation.
+
+    List and detail responses are conditional: visibility depends on the
+    user's role and organization, and "isActiveNow" on the clock, so ETags
+    vary per user and roll over every minute.
     """
 
     queryset = FeatureFlag.objects.all()
@@ -97,6 +104,22 @@ class FeatureFlagViewSet(viewsets.ModelViewSet):
     search_fields = ["key", "name", "description"]
     ordering_fields = ["created_at", "updated_at", "name", "key"]
     ordering = ["-created_at"]
+    conditional_resource = "feature_flags"
+    conditional_actions = ("list", "retrieve")
+    conditional_vary_on_user = True
+    conditional_window = 60
+
+    def get_conditional_tenant_id(self):
+        # Listings span the user's organization and global flags
+        return None
+
+    def get_conditional_key_parts(self):
+        """Account and membership versions, which decide flag visibility."""
+        user_id = self.request.user.pk
+        return (
+            AccountCache.get_version(user_id),
+            MembershipCache.get_version(user_id),
+        )
 
     def get_queryset(self):
         """
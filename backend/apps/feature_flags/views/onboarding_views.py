@@ -21,6 +21,8 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.conditional import ConditionalGetMixin
+
 from ..enums import OnboardingStageTypes
 from ..models import UserOnboardingProgress
 from ..serializers import (
@@ -516,16 +518,23 @@ class OnboardingActionView(APIView):
         tags=["Feature Flags"],
     )
 )
-class OnboardingStageInfoView(APIView):
+class OnboardingStageInfoView(ConditionalGetMixin, APIView):
     """
     View for getting information about onboarding stages.
 
     Provides comprehensive details about stage requirements,
     unlocked features, progression logic, and stage descriptions
     to help understand the onboarding flow.
+
+    Stage information is static, so responses are served from ETags and
+    cached bodies shared by all tenants.
     """
 
     permission_classes = [IsAuthenticated]
+    conditional_resource = "onboarding_stages"
+
+    def get_conditional_tenant_id(self):
+        return None
 
     @extend_schema(
         summary="Get Stage Information",
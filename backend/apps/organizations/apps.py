@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OrganizationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.organizations"
+
+    def ready(self):
+        """Connect cache invalidation and member counter signal handlers."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,295 @@
+"""
+Caching for organization and membership resolution.
+
+TenantMiddleware resolves an organization from a subdomain/slug on nearly
+every API request. Lookups go through a small in-process LRU first, then the
+shared Django cache, and only then the database. Misses are cached briefly as
+well so that probing random slugs doesn't turn into a stream of queries.
+
+Entries are invalidated by Organization post_save/post_delete signals (see
+apps.organizations.signals), which also covers soft_delete() and restore().
+
+Memberships are cached the same way for the permission checks that follow
+tenant resolution (is_admin_of, is_owner_of, ...).
+"""
+
+import copy
+import logging
+
+from django.core.cache import cache
+
+from apps.core.cache import (
+    LocalLRUCache,
+    bump_version_stamp,
+    cache_key,
+    get_version_stamp,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OrganizationCache:
+    """
+    Two-tier identifier -> Organization cache.
+
+    Identifiers are the values accepted by TenantMiddleware: a sub_domain or a
+    slug. Only active organizations are cached.
+    """
+
+    # Cache timeouts (in seconds)
+    TIMEOUT = 300  # 5 minutes
+    NEGATIVE_TIMEOUT = 30  # Short-lived to blunt enumeration only
+    LOCAL_TIMEOUT = 10  # Bounds staleness across processes
+    LOCAL_MAXSIZE = 1024
+
+    MAX_IDENTIFIER_LENGTH = 50
+
+    # Stored in place of an organization for identifiers that don't resolve
+    NOT_FOUND = "__not_found__"
+
+    _local = LocalLRUCache(maxsize=LOCAL_MAXSIZE, timeout=LOCAL_TIMEOUT)
+
+    @classmethod
+    def get_lookup_key(cls, identifier: str) -> str:
+        """Generate cache key for an identifier lookup."""
+        return cache_key("org", "lookup", identifier)
+
+    @classmethod
+    def resolve(cls, identifier: str):
+        """
+        Resolve an active organization by sub_domain or slug.
+
+        Returns:
+            Organization instance (a private copy per call) or None
+        """
+        # slug and sub_domain are both capped at 50 characters
+        if not identifier or len(identifier) > cls.MAX_IDENTIFIER_LENGTH:
+            return None
+
+        key = cls.get_lookup_key(identifier)
+
+        cached = cls._local.get(key)
+        if cached is None:
+            cached = cache.get(key)
+
+            if cached is None:
+                cached = cls._load(identifier) or cls.NOT_FOUND
+                timeout = (
+                    cls.NEGATIVE_TIMEOUT if cached == cls.NOT_FOUND else cls.TIMEOUT
+                )
+                cache.set(key, cached, timeout)
+
+            cls._local.set(key, cached)
+
+        if cached == cls.NOT_FOUND:
+            return None
+
+        # Never hand out the shared instance; callers may mutate request.org
+        return copy.copy(cached)
+
+    @classmethod
+    def _load(cls, identifier: str):
+        """Load an active organization from the database (subdomain first)."""
+        from apps.organizations.models import Organization
+
+        try:
+            return Organization.objects.get(sub_domain=identifier, is_active=True)
+        except Organization.DoesNotExist:
+            pass
+
+        try:
+            return Organization.objects.get(slug=identifier, is_active=True)
+        except Organization.DoesNotExist:
+            return None
+
+    @classmethod
+    def invalidate_identifier(cls, identifier: str) -> None:
+        """Drop a single identifier from both cache tiers."""
+        if not identifier:
+            return
+        key = cls.get_lookup_key(identifier)
+        cls._local.delete(key)
+        cache.delete(key)
+
+    @classmethod
+    def invalidate(cls, organization, *extra_identifiers) -> None:
+        """
+        Drop every identifier an organization can be resolved by.
+
+        Args:
+            organization: Organization instance that changed
+            extra_identifiers: Previous slug/sub_domain values, if known
+        """
+        identifiers = {
+            organization.slug,
+            organization.sub_domain,
+            *extra_identifiers,
+        }
+        for identifier in identifiers:
+            cls.invalidate_identifier(identifier)
+        PlatformOrganizationCache.invalidate(*identifiers)
+        logger.debug(f"Invalidated organization cache for {organization.slug}")
+
+
+class PlatformOrganizationCache:
+    """
+    The Global Mode platform organization, pinned in process memory.
+
+    Every request in Global Mode resolves the same organization, so it is
+    kept in-process and only re-read from the shared cache every
+    REFRESH_INTERVAL seconds. Saving the organization drops the pin locally
+    and the shared entry for every other process.
+    """
+
+    REFRESH_INTERVAL = 60  # seconds
+    TIMEOUT = 300  # 5 minutes
+
+    _local = LocalLRUCache(maxsize=4, timeout=REFRESH_INTERVAL)
+
+    @classmethod
+    def get_key(cls, slug: str) -> str:
+        """Generate cache key for the platform organization."""
+        return cache_key("org", "platform", slug)
+
+    @classmethod
+    def get(cls, slug: str):
+        """
+        Get the active platform organization by slug.
+
+        Returns:
+            Organization instance (a private copy per call) or None. Misses are
+            not cached so bootstrapping the platform takes effect immediately.
+        """
+        from apps.organizations.models import Organization
+
+        key = cls.get_key(slug)
+
+        organization = cls._local.get(key)
+        if organization is None:
+            organization = cache.get(key)
+
+            if organization is None:
+                organization = Organization.objects.filter(
+                    slug=slug, is_active=True
+                ).first()
+                if organization is None:
+                    return None
+                cache.set(key, organization, cls.TIMEOUT)
+
+            cls._local.set(key, organization)
+
+        return copy.copy(organization)
+
+    @classmethod
+    def invalidate(cls, *slugs) -> None:
+        """Drop the pinned and shared entries for the given slugs."""
+        for slug in slugs:
+            if not slug:
+                continue
+            key = cls.get_key(slug)
+            cls._local.delete(key)
+            cache.delete(key)
+
+
+class MembershipCache:
+    """
+    Membership lookups keyed by (user_id, org_id).
+
+    Three tiers:
+    1. An identity map on the Account instance. Django and DRF build a fresh
+       user object per request, so this map lives exactly as long as the
+       request and repeated is_admin_of()/is_owner_of() checks are free.
+    2. The shared Django cache, keyed by a per-user membership version stamp.
+       Bumping the stamp orphans every cached entry for that user at once.
+    3. The database.
+
+    The stamp is bumped by OrganizationMembership post_save/post_delete
+    signals, which covers save(), activate(), suspend(), reactivate() and
+    change_role().
+    """
+
+    # Cache timeouts (in seconds)
+    TIMEOUT = 120  # 2 minutes
+    VERSION_TIMEOUT = 60 * 60 * 24  # 1 day
+
+    # Stored in place of a membership when the user isn't a member
+    NO_MEMBERSHIP = "__no_membership__"
+
+    # Attribute holding the per-request identity map on Account instances
+    IDENTITY_MAP_ATTR = "_membership_identity_map"
+
+    @classmethod
+    def get_version_key(cls, user_id) -> str:
+        """Generate cache key for a user's membership version stamp."""
+        return cache_key("user", user_id, "membership_version")
+
+    @classmethod
+    def get_membership_key(cls, user_id, organization_id, version) -> str:
+        """Generate cache key for a versioned membership entry."""
+        return cache_key("user", user_id, "org", organization_id, "membership", version)
+
+    @classmethod
+    def get_version(cls, user_id) -> int:
+        """Get the current membership version stamp for a user."""
+        return get_version_stamp(cls.get_version_key(user_id), cls.VERSION_TIMEOUT)
+
+    @classmethod
+    def bump_version(cls, user_id) -> None:
+        """Invalidate every cached membership for a user."""
+        bump_version_stamp(cls.get_version_key(user_id), cls.VERSION_TIMEOUT)
+
+    @classmethod
+    def get_membership(cls, user, organization):
+        """
+        Get a user's membership in an organization, if any.
+
+        Args:
+            user: Account instance
+            organization: Organization instance or primary key
+
+        Returns:
+            OrganizationMembership instance or None
+        """
+        from apps.organizations.models import OrganizationMembership
+
+        if organization is None or user.pk is None:
+            return None
+
+        organization_id = getattr(organization, "pk", organization)
+        identity_map = user.__dict__.setdefault(cls.IDENTITY_MAP_ATTR, {})
+
+        if organization_id in identity_map:
+            return identity_map[organization_id]
+
+        key = cls.get_membership_key(user.pk, organization_id, cls.get_version(user.pk))
+        cached = cache.get(key)
+
+        if cached is None:
+            cached = (
+                OrganizationMembership.objects.filter(
+                    user_id=user.pk, organization_id=organization_id
+                ).first()
+                or cls.NO_MEMBERSHIP
+            )
+            cache.set(key, cached, cls.TIMEOUT)
+
+        membership = None if cached == cls.NO_MEMBERSHIP else cached
+        identity_map[organization_id] = membership
+        return membership
+
+    @classmethod
+    def clear_identity_map(cls, user) -> None:
+        """Forget memberships memoized on a user instance."""
+        user.__dict__.pop(cls.IDENTITY_MAP_ATTR, None)
+
+    @classmethod
+    def invalidate(cls, membership) -> None:
+        """Invalidate cached memberships after a membership changed."""
+        from apps.organizations.models import OrganizationMembership
+
+        cls.bump_version(membership.user_id)
+
+        # The instance that made the change usually holds the same user object
+        # the caller keeps using, so drop its identity map as well
+        if OrganizationMembership.user.is_cached(membership):
+            cls.clear_identity_map(membership.user)
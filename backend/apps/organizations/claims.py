@@ -0,0 +1,202 @@
+"""
+Signed JWT tenant claims as a trusted source of membership.
+
+add_custom_claims() writes the caller's active memberships (id/slug/role) into
+every access token. With JWT_TRUST_TENANT_CLAIMS enabled, TenantMiddleware and
+the organization permission classes build the membership from those claims
+instead of querying the database.
+
+Claims are only honoured while the token's ``membership_version`` matches the
+user's current MembershipCache version stamp. Any membership change bumps the
+stamp, so role changes, suspensions and removals take effect on the very next
+request; stale tokens simply fall back to the database path.
+
+build_tenant_claims() produces those claims for login and refresh from a
+single query and caches them under the same version stamp.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from apps.core.cache import cache_key
+from apps.organizations.cache import MembershipCache
+
+logger = logging.getLogger(__name__)
+
+MEMBERSHIP_VERSION_CLAIM = "membership_version"
+
+# Attribute caching the verified token on the underlying HttpRequest
+REQUEST_TOKEN_ATTR = "_tenant_claims_token"
+
+# Built claims are also dropped by a membership version bump; the timeout
+# only bounds how long a renamed organization's old slug can linger
+CLAIMS_TIMEOUT = 300  # 5 minutes
+
+_jwt_authentication = JWTAuthentication()
+
+
+def tenant_claims_enabled() -> bool:
+    """Check whether token claims may authorize membership checks."""
+    return getattr(settings, "JWT_TRUST_TENANT_CLAIMS", False)
+
+
+def get_request_token(request):
+    """
+    Get the verified access token for a request, if any.
+
+    DRF requests carry the token on ``request.auth`` after authentication.
+    Plain Django requests (TenantMiddleware runs before DRF authenticates)
+    have the Authorization header verified here; the result is cached on the
+    request so the signature is checked at most once.
+
+    Returns:
+        Validated simplejwt Token or None
+    """
+    token = getattr(request, "auth", None)
+    if isinstance(token, Token):
+        return token
+
+    request = getattr(request, "_request", request)
+    if REQUEST_TOKEN_ATTR in request.__dict__:
+        return request.__dict__[REQUEST_TOKEN_ATTR]
+
+    token = None
+    header = _jwt_authentication.get_header(request)
+    raw_token = _jwt_authentication.get_raw_token(header) if header else None
+    if raw_token is not None:
+        try:
+            token = _jwt_authentication.get_validated_token(raw_token)
+        except (InvalidToken, TokenError):
+            # DRF rejects the request properly once it authenticates
+            token = None
+
+    request.__dict__[REQUEST_TOKEN_ATTR] = token
+    return token
+
+
+def get_claims_membership(request, organization):
+    """
+    Build a membership for the request's user from verified token claims.
+
+    Args:
+        request: Django or DRF request
+        organization: Organization the request is scoped to
+
+    Returns:
+        Unsaved OrganizationMembership mirroring the claimed role, or None
+        when claims are disabled, stale, or don't cover the organization.
+        Callers fall back to the database on None.
+    """
+    from apps.organizations.models import OrganizationMembership
+
+    if organization is None or not tenant_claims_enabled():
+        return None
+
+    token = get_request_token(request)
+    if token is None:
+        return None
+
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    version = token.get(MEMBERSHIP_VERSION_CLAIM)
+    if user_id is None or version is None:
+        return None
+
+    if version != MembershipCache.get_version(user_id):
+        logger.debug(f"Stale tenant claims for user {user_id}, using database")
+        return None
+
+    organization_id = str(organization.pk)
+    for claim in token.get("organizations", []):
+        if claim.get("id") == organization_id:
+            # Tokens carry the user id as a string; restore the pk type
+            user_pk = OrganizationMembership._meta.get_field("user").target_field
+            # Only active memberships are written into the token
+            return OrganizationMembership(
+                organization=organization,
+                user_id=user_pk.to_python(user_id),
+                role=claim.get("role", "member"),
+                status="active",
+            )
+
+    return None
+
+
+def get_claims_key(user_id, version, legacy_organization_id=None) -> str:
+    """Generate cache key for a user's built tenant claims."""
+    return cache_key(
+        "user", user_id, "tenant_claims", version, legacy_organization_id or "-"
+    )
+
+
+def build_tenant_claims(user) -> dict:
+    """
+    Build the multi-tenant organization claims for a user's access token.
+
+    All active memberships are fetched with their organizations in one query
+    and the primary organization, role and permissions are derived from them
+    in memory. The result is cached until the user's memberships change.
+
+    Args:
+        user: Account instance
+
+    Returns:
+        Dict with primary_organization_id, organization_role, permissions,
+        organizations and membership_version claims
+    """
+    # Read the version before memberships so a concurrent change makes the
+    # claims stale rather than silently missing from them
+    version = MembershipCache.get_version(user.pk)
+    key = get_claims_key(user.pk, version, user.organization_id)
+
+    claims = cache.get(key)
+    if claims is None:
+        claims = _load_tenant_claims(user)
+        claims[MEMBERSHIP_VERSION_CLAIM] = version
+        cache.set(key, claims, CLAIMS_TIMEOUT)
+
+    return claims
+
+
+def _load_tenant_claims(user) -> dict:
+    """Compute tenant claims from the user's active memberships."""
+    from apps.organizations.models import OrganizationMembership
+
+    memberships = list(
+        OrganizationMembership.objects.filter(
+            user_id=user.pk, status="active"
+        ).select_related("organization")
+    )
+
+    # Mirrors Account.get_primary_organization(): the legacy direct
+    # organization wins, otherwise the first active membership
+    if user.organization_id:
+        membership = next(
+            (m for m in memberships if m.organization_id == user.organization_id),
+            None,
+        )
+        if membership is None:
+            # Legacy organization without an active membership (rare)
+            membership = user.get_membership_in(user.organization)
+        primary_organization_id = user.organization_id
+    else:
+        membership = memberships[0] if memberships else None
+        primary_organization_id = membership.organization_id if membership else None
+
+    return {
+        "primary_organization_id": (
+            str(primary_organization_id) if primary_organization_id else None
+        ),
+        "organization_role": membership.role if membership else None,
+        "permissions": membership.get_permissions() if membership else [],
+        # All organizations user belongs to (for org switching)
+        "organizations": [
+            {"id": str(m.organization.id), "slug": m.organization.slug, "role": m.role}
+            for m in memberships
+        ],
+    }
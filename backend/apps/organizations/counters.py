@@ -0,0 +1,130 @@
+"""
+Denormalized member counters on Organization.
+
+Organization.active_member_count and pending_invite_count stand in for COUNT
+queries over the membership and invite tables in organization listings,
+stats and plan-limit checks. They are adjusted with F() expressions, in the
+transaction making the change, whenever an OrganizationMembership or Invite
+is created, changes status or is deleted (see apps.organizations.signals).
+
+Queryset .update() and bulk operations bypass the signals and must call
+adjust() themselves. reconcile() (the reconcile_member_counters command)
+recomputes drifted counters from the source tables.
+"""
+
+import logging
+from functools import reduce
+from operator import or_
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+logger = logging.getLogger(__name__)
+
+# Counter field -> status of the rows it counts
+MEMBERSHIP_COUNTER = ("active_member_count", "active")
+INVITE_COUNTER = ("pending_invite_count", "pending")
+
+
+def adjust(organization_id, **deltas) -> None:
+    """
+    Atomically add deltas to an organization's counters.
+
+    A decrement that would take a counter below zero (the counter had
+    drifted) is clamped at zero and logged, rather than failing the
+    caller's transaction on the unsigned column; reconcile() repairs it.
+
+    Example:
+        adjust(org.id, active_member_count=1, pending_invite_count=-1)
+    """
+    from apps.organizations.models import Organization
+
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    organization = Organization._base_manager.filter(pk=organization_id)
+    floors = {f"{field}__gte": -delta for field, delta in deltas.items() if delta < 0}
+    updated = organization.filter(**floors).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+    if updated or not floors:
+        return
+
+    clamped = organization.update(
+        **{field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+    )
+    if clamped:
+        logger.warning(
+            f"Member counters of organization {organization_id} would go negative "
+            f"({deltas}); clamped at 0, run reconcile_member_counters to repair"
+        )
+
+
+def status_delta(counted_status, old_status, new_status) -> int:
+    """+1/-1/0 for a row moving from old_status to new_status (None: absent)."""
+    return int(new_status == counted_status) - int(old_status == counted_status)
+
+
+def counted_subqueries() -> dict:
+    """Counter field -> correlated subquery computing its true value."""
+    from apps.organizations.models import Invite, OrganizationMembership
+
+    subqueries = {}
+    for model, (field, status) in (
+        (OrganizationMembership, MEMBERSHIP_COUNTER),
+        (Invite, INVITE_COUNTER),
+    ):
+        counted = (
+            model.objects.filter(organization=OuterRef("pk"), status=status)
+            .order_by()
+            .values("organization")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        subqueries[field] = Coalesce(
+            Subquery(counted, output_field=IntegerField()), Value(0)
+        )
+    return subqueries
+
+
+def reconcile(organization_ids=None, batch_size=500, dry_run=False) -> int:
+    """
+    Repair counters that drifted from the membership and invite tables.
+
+    Drifted organizations are found with one query, then fixed in batches
+    with an UPDATE that recounts inside the statement, so transitions
+    committed meanwhile aren't overwritten by a stale count.
+
+    Args:
+        organization_ids: Only check these organizations (default: all)
+        batch_size: Organizations fixed per UPDATE
+        dry_run: Only count drifted organizations
+
+    Returns:
+        Number of organizations whose counters had drifted
+    """
+    from apps.organizations.models import Organization
+
+    subqueries = counted_subqueries()
+    organizations = Organization._base_manager.all()
+    if organization_ids is not None:
+        organizations = organizations.filter(pk__in=organization_ids)
+
+    mismatch = reduce(or_, (~Q(**{f: F(f"actual_{f}")}) for f in subqueries))
+    drifted = list(
+        organizations.annotate(
+            **{f"actual_{field}": subquery for field, subquery in subqueries.items()}
+        )
+        .filter(mismatch)
+        .values_list("pk", flat=True)
+    )
+
+    if not dry_run:
+        for start in range(0, len(drifted), batch_size):
+            Organization._base_manager.filter(
+                pk__in=drifted[start : start + batch_size]
+            ).update(**subqueries)
+
+    logger.info(f"Member counters reconciled: {len(drifted)} organizations drifted")
+    return len(drifted)
@@ -0,0 +1,61 @@
+"""
+Management command to repair drifted organization member counters.
+
+Organization.active_member_count and pending_invite_count are maintained
+incrementally (see apps.organizations.counters). Writes that bypass model
+signals, e.g. raw SQL or queryset .update() calls, can make them drift; this
+command recounts them from the membership and invite tables.
+
+Usage:
+    python manage.py reconcile_member_counters
+    python manage.py reconcile_member_counters --organization <id> --dry-run
+
+This command is idempotent - it can be run multiple times safely.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.organizations.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recount active members and pending invites of organizations"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--organization",
+            action="append",
+            dest="organization_ids",
+            metavar="ID",
+            help="Only reconcile this organization (can be repeated)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Organizations repaired per UPDATE statement",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted organizations without repairing them",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        drifted = reconcile(
+            organization_ids=options["organization_ids"],
+            batch_size=options["batch_size"],
+            dry_run=dry_run,
+        )
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("✓ All member counters are correct"))
+        elif dry_run:
+            self.stdout.write(
+                self.style.WARNING(f"{drifted} organizations have drifted counters")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"✓ Repaired counters of {drifted} organizations")
+            )
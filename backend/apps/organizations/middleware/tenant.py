@@ -1,9 +1,13 @@
 import logging
 
 from django.conf import settings
+from django.db import IntegrityError
 from django.http import Http404, HttpResponseForbidden
 from django.utils.deprecation import MiddlewareMixin
 
+from apps.core.utils.routing import get_route_info
+from apps.organizations.cache import OrganizationCache, PlatformOrganizationCache
+from apps.organizations.claims import get_claims_membership
 from apps.organizations.models import Organization
 
 logger = logging.getLogger(__name__)
@@ -46,11 +50,10 @@ class TenantMiddleware(MiddlewareMixin):
 
         if org_slug:
             try:
-                # Try subdomain first, then slug
-                try:
-                    organization = Organization.objects.get(sub_domain=org_slug, is_active=True)
-                except Organization.DoesNotExist:
-                    organization = Organization.objects.get(slug=org_slug, is_active=True)
+                # Try subdomain first, then slug (cached, including misses)
+                organization = OrganizationCache.resolve(org_slug)
+                if organization is None:
+                    raise Organization.DoesNotExist
                 request.org = organization
 
                 # For authenticated non-superuser, validate membership
@@ -92,6 +95,11 @@ class TenantMiddleware(MiddlewareMixin):
 
                     request.membership = membership
 
+                elif not request.user.is_authenticated:
+                    # Token-authenticated API traffic: DRF authenticates after
+                    # middleware, so take the membership from verified claims
+                    request.membership = get_claims_membership(request, organization)
+
             except Organization.DoesNotExist:
                 logger.warning(f"Organization not found: {org_slug}")
                 raise Http404("Organization not found")
@@ -131,32 +139,11 @@ class TenantMiddleware(MiddlewareMixin):
     def _is_tenant_endpoint(self, request):
         """
         Check if this is a tenant-scoped endpoint that requires organization.
+
+        Exempt paths (auth, profile, docs, health) are configured through
+        TENANT_EXEMPT_PATHS and evaluated once per path by the route classifier.
         """
-        path = request.path_info
-
-        # Paths that DON'T require organization context
-        exempt_paths = [
-            "/admin/",
-            "/api/v1/auth/",
-            "/api/v1/accounts/users/me/",  # User profile doesn't need org
-            "/api/v1/capabilities/",  # Capabilities endpoint is public
-            "/api/docs/",
-            "/api/redoc/",
-            "/api/schema/",
-            "/health/",
-            "/ready/",
-        ]
-
-        # Check for exempt paths
-        for exempt_path in exempt_paths:
-            if path.startswith(exempt_path):
-                return False
-
-        # API endpoints generally require organization context
-        if path.startswith("/api/"):
-            return True
-
-        return False
+        return get_route_info(request).requires_tenant
 
     def _process_global_mode(self, request):
         """
@@ -167,40 +154,15 @@ class TenantMiddleware(MiddlewareMixin):
         - No organization resolution needed
         - Auto-create membership for authenticated users
         - No membership validation
-        """
-        from apps.organizations.models import OrganizationMembership
 
+        The platform organization is pinned in process memory and memberships
+        come from MembershipCache, so returning users cost no queries.
+        """
         global_org_slug = getattr(settings, "GLOBAL_SCOPE_ORG_SLUG", "platform")
 
-        try:
-            # Get the global platform organization
-            organization = Organization.objects.get(slug=global_org_slug, is_active=True)
-            request.org = organization
-
-            # For authenticated users, ensure they have a membership
-            if request.user.is_authenticated:
-                # Check if user already has membership
-                membership = OrganizationMembership.objects.filter(
-                    organization=organization,
-                    user=request.user
-                ).first()
-
-                if not membership:
-                    # Auto-create active membership for user in global mode
-                    membership = OrganizationMembership.objects.create(
-                        organization=organization,
-                        user=request.user,
-                        role="member",
-                        status="active",
-                    )
-                    logger.info(
-                        f"Auto-created global membership for user {request.user.email} "
-                        f"in organization {global_org_slug}"
-                    )
-
-                request.membership = membership
-
-        except Organization.DoesNotExist:
+        # Get the global platform organization
+        organization = PlatformOrganizationCache.get(global_org_slug)
+        if organization is None:
             logger.error(
                 f"Global organization '{global_org_slug}' not found. "
                 f"Run 'python manage.py bootstrap_global_mode' to create it."
@@ -210,4 +172,48 @@ class TenantMiddleware(MiddlewareMixin):
                 f"Contact system administrator."
             )
 
+        request.org = organization
+
+        # For authenticated users, ensure they have a membership
+        if request.user.is_authenticated:
+            membership = request.user.get_membership_in(organization)
+
+            if not membership:
+                membership = self._provision_global_membership(
+                    request.user, organization
+                )
+
+            request.membership = membership
+
         return None
+
+    def _provision_global_membership(self, user, organization):
+        """
+        Auto-create an active membership for a user in global mode.
+
+        Concurrent first requests from the same user race to create the row;
+        the (organization, user) unique constraint lets exactly one insert win
+        and get_or_create() returns the winner's row to everyone else.
+        """
+        from apps.organizations.models import OrganizationMembership
+
+        for attempt in range(2):
+            try:
+                membership, created = OrganizationMembership.objects.get_or_create(
+                    organization=organization,
+                    user=user,
+                    defaults={"role": "member", "status": "active"},
+                )
+                break
+            except IntegrityError:
+                # Lost the race after get_or_create's own re-read; try once more
+                if attempt:
+                    raise
+
+        if created:
+            logger.info(
+                f"Auto-created global membership for user {user.email} "
+                f"in organization {organization.slug}"
+            )
+
+        return membership
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0006_organization_extended_properties'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invite',
+            index=models.Index(fields=['status', 'expires_at', 'id'], name='invite_status_expires_idx'),
+        ),
+    ]
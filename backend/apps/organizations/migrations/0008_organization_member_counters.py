@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:48
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_of(model, status):
+    counted = (
+        model.objects.filter(organization=OuterRef('pk'), status=status)
+        .order_by()
+        .values('organization')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+
+def backfill_counters(apps, schema_editor):
+    Organization = apps.get_model('organizations', 'Organization')
+    OrganizationMembership = apps.get_model('organizations', 'OrganizationMembership')
+    Invite = apps.get_model('organizations', 'Invite')
+
+    Organization.objects.update(
+        active_member_count=count_of(OrganizationMembership, 'active'),
+        pending_invite_count=count_of(Invite, 'pending'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0007_invite_status_expires_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='active_member_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of active memberships'),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='pending_invite_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of pending invites'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
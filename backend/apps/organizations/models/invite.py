@@ -5,7 +5,7 @@ from datetime import timedelta
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -98,6 +98,12 @@ class Invite(models.Model):
         verbose_name = "Invite"
         verbose_name_plural = "Invites"
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset walk in expire_stale_invites
+            models.Index(
+                fields=["status", "expires_at", "id"], name="invite_status_expires_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Invite to {self.email} for {self.organization.name} ({self.status})"
@@ -163,7 +169,10 @@ class Invite(models.Model):
             self.expires_at = timezone.now() + timedelta(days=7)
 
         self.clean()
-        super().save(*args, **kwargs)
+        # One transaction, so the status read for the counters stays locked
+        # until they are adjusted (see apps.organizations.signals)
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
 
     def generate_token(self):
         """Generate a secure random token for the invite."""
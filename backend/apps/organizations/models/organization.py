@@ -7,6 +7,8 @@ from django.utils.translation import gettext_lazy as _
 
 from ..managers import OrganizationManager
 
+COUNTER_FIELDS = ("active_member_count", "pending_invite_count")
+
 
 class Organization(models.Model):
     id = models.UUIDField(
@@ -106,6 +108,15 @@ class Organization(models.Model):
         help_text="Extended properties for special organization flags (e.g., is_global_scope, protected)",
     )
 
+    # Denormalized counters, adjusted with F() updates by membership and
+    # invite transitions (see apps.organizations.counters)
+    active_member_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Number of active memberships"
+    )
+    pending_invite_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Number of pending invites"
+    )
+
     # Manager
     objects = OrganizationManager()
 
@@ -155,6 +166,18 @@ class Organization(models.Model):
 
     def save(self, *args, **kwargs):
         self.clean()
+
+        # Never write back counters read before a concurrent adjustment
+        if (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -188,11 +211,14 @@ class Organization(models.Model):
 
     def get_active_members_count(self):
         """Get count of active members in organization."""
-        return self.memberships.filter(status="active").count()
+        # The instance may be stale (e.g. cached); read the current counter
+        self.refresh_from_db(fields=["active_member_count"])
+        return self.active_member_count
 
     def get_pending_invites_count(self):
         """Get count of pending invites."""
-        return self.invites.filter(status="pending").count()
+        self.refresh_from_db(fields=["pending_invite_count"])
+        return self.pending_invite_count
 
     def can_add_member(self):
         """Check if organization can add more members based on plan limits."""
@@ -231,7 +257,7 @@ class Organization(models.Model):
         )
 
         # Log the deletion for audit purposes
-        from apps.core.models import AuditLog
+        from apps.core.audit.models import AuditLog
 
         AuditLog.log_event(
             event_type="data_deletion",
@@ -278,7 +304,7 @@ class Organization(models.Model):
         )
 
         # Log the restoration for audit purposes
-        from apps.core.models import AuditLog
+        from apps.core.audit.models import AuditLog
 
         AuditLog.log_event(
             event_type="data_restoration",
@@ -306,12 +332,21 @@ class Organization(models.Model):
             and timezone.now() < self.scheduled_permanent_deletion
         )
 
-    def permanently_delete(self):
+    def permanently_delete(self, batch_size=None, on_progress=None):
         """
         Permanently delete the organization and all associated data.
         This is irreversible and should only be called after soft delete grace period.
+
+        Related data is deleted bottom-up in small batches (see
+        apps.core.cascade) rather than loaded by Django's deletion collector,
+        so large organizations don't hold long locks. An interrupted deletion
+        can be run again.
+
+        Returns:
+            Counter of deleted rows per model label
         """
-        from apps.core.models import AuditLog
+        from apps.core.audit.models import AuditLog
+        from apps.core.cascade import BulkCascade
 
         # Log the permanent deletion before deleting
         AuditLog.log_event(
@@ -330,18 +365,12 @@ class Organization(models.Model):
             },
         )
 
-        # Delete all related data
-        # Django will cascade delete based on ForeignKey relationships
-        # But we'll be explicit for important data:
-
-        # Delete memberships
-        self.memberships.all().delete()
-
-        # Delete invites
-        self.invites.all().delete()
-
-        # Delete the organization itself (this will cascade to other related objects)
-        self.delete()
+        # Memberships, invites, every tenant-scoped model (the
+        # TenantAwareModel %(class)s_set relations) and what hangs off them
+        cascade = BulkCascade(batch_size=batch_size, on_progress=on_progress)
+        cascade.delete(Organization._base_manager.filter(pk=self.pk))
+        self.pk = None
+        return cascade.deleted
 
     class Meta:
         verbose_name = "Organization"
@@ -2,9 +2,26 @@ import logging
 
 from rest_framework.permissions import BasePermission
 
+from apps.organizations.claims import get_claims_membership
+
 logger = logging.getLogger(__name__)
 
 
+def _get_membership(request):
+    """
+    Get the caller's membership in the request organization.
+
+    TenantMiddleware sets request.membership for session users. Token users
+    are authenticated by DRF after middleware runs, so with
+    JWT_TRUST_TENANT_CLAIMS enabled their membership comes from the verified
+    token claims instead.
+    """
+    membership = getattr(request, "membership", None)
+    if membership is None:
+        membership = get_claims_membership(request, request.org)
+    return membership
+
+
 class IsOrgMember(BasePermission):
     """
     Permission class that requires user to have active membership in the request organization.
@@ -28,10 +45,11 @@ class IsOrgMember(BasePermission):
             return False
 
         # Must have active membership in the organization
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        return request.membership.is_active()
+        return membership.is_active()
 
 
 class IsOrgAdmin(BasePermission):
@@ -53,10 +71,11 @@ class IsOrgAdmin(BasePermission):
             return False
 
         # Must have admin membership
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        return request.membership.is_admin()
+        return membership.is_admin()
 
 
 class IsOrgOwner(BasePermission):
@@ -78,10 +97,11 @@ class IsOrgOwner(BasePermission):
             return False
 
         # Must have owner membership
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        return request.membership.is_owner()
+        return membership.is_owner()
 
 
 class CanManageMembers(BasePermission):
@@ -103,10 +123,11 @@ class CanManageMembers(BasePermission):
             return False
 
         # Must have membership with member management capability
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        return request.membership.can_manage_members()
+        return membership.can_manage_members()
 
 
 class CanManageBilling(BasePermission):
@@ -128,10 +149,11 @@ class CanManageBilling(BasePermission):
             return False
 
         # Must have membership with billing management capability
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        return request.membership.can_manage_billing()
+        return membership.can_manage_billing()
 
 
 class IsOwnerOrReadOnly(BasePermission):
@@ -153,10 +175,11 @@ class IsOwnerOrReadOnly(BasePermission):
             return False
 
         # Must have active membership
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        if not request.membership.is_active():
+        if not membership.is_active():
             return False
 
         # Read permissions for all members
@@ -164,7 +187,7 @@ class IsOwnerOrReadOnly(BasePermission):
             return True
 
         # Write permissions only for owners
-        return request.membership.is_owner()
+        return membership.is_owner()
 
 
 class IsAdminOrReadOnly(BasePermission):
@@ -186,10 +209,11 @@ class IsAdminOrReadOnly(BasePermission):
             return False
 
         # Must have active membership
-        if not hasattr(request, "membership") or not request.membership:
+        membership = _get_membership(request)
+        if not membership:
             return False
 
-        if not request.membership.is_active():
+        if not membership.is_active():
             return False
 
         # Read permissions for all members
@@ -197,7 +221,7 @@ class IsAdminOrReadOnly(BasePermission):
             return True
 
         # Write permissions only for admins/owners
-        return request.membership.is_admin()
+        return membership.is_admin()
 
 
 # Legacy permission for backward compatibility (deprecated)
@@ -7,21 +7,13 @@ from .models import Invite, Organization, OrganizationMembership
 class OrganizationSerializer(serializers.ModelSerializer):
     """Serializer for Organization model."""
 
-    member_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(
+        source="active_member_count",
+        read_only=True,
+        help_text="Number of active members in this organization",
+    )
     subscription_status = serializers.SerializerMethodField()
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_member_count(self, obj):
-        """
-        Get the number of active members in this organization.
-        Uses annotation from queryset if available, otherwise falls back to query.
-        """
-        # Check if the queryset was annotated with member_count
-        if hasattr(obj, "active_member_count"):
-            return obj.active_member_count
-        # Fallback to query (slower, but works if annotation not provided)
-        return obj.memberships.filter(status="active").count()
-
     @extend_schema_field(serializers.CharField)
     def get_subscription_status(self, obj):
         """Get the current subscription status."""
@@ -59,6 +51,37 @@ class OrganizationSerializer(serializers.ModelSerializer):
         ]
 
 
+class OrganizationListSerializer(OrganizationSerializer):
+    """
+    Organization list item, rendered from a column projection.
+
+    The list view loads only PROJECTION_FIELDS (plus the subscription status)
+    and no memberships, so a page costs the same however large the listed
+    organizations are. Members are listed by the nested, paginated members
+    endpoint.
+    """
+
+    PROJECTION_FIELDS = (
+        "id",
+        "name",
+        "slug",
+        "description",
+        "logo",
+        "sub_domain",
+        "plan",
+        "is_active",
+        "on_trial",
+        "trial_ends_on",
+        "paid_until",
+        "active_member_count",
+        "created_at",
+        "updated_at",
+    )
+
+    class Meta(OrganizationSerializer.Meta):
+        read_only_fields = OrganizationSerializer.Meta.fields
+
+
 class OrganizationMembershipSerializer(serializers.ModelSerializer):
     """Serializer for OrganizationMembership model."""
 
@@ -0,0 +1,40 @@
+"""
+Post-commit side effects for organization flows (see apps.core.side_effects).
+"""
+
+import logging
+
+from apps.core.side_effects import side_effect
+
+logger = logging.getLogger(__name__)
+
+
+@side_effect
+def log_invite_accepted(membership_id, ip_address, user_agent):
+    """Record the audit entry for a membership created from an invite."""
+    from apps.core.audit.models import AuditAction, AuditLog
+    from apps.organizations.models import OrganizationMembership
+
+    membership = (
+        OrganizationMembership.objects.select_related("organization", "user")
+        .filter(pk=membership_id)
+        .first()
+    )
+    if membership is None:
+        logger.info(f"Skipping invite audit for deleted membership {membership_id}")
+        return
+
+    AuditLog.log_event(
+        action=AuditAction.MEMBER_JOIN,
+        user=membership.user,
+        organization=membership.organization,
+        resource_type="membership",
+        resource_id=membership.id,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        details={
+            "membership_id": str(membership.id),
+            "role": membership.role,
+            "action_type": "invite_accepted",
+        },
+    )
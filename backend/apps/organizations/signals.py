@@ -0,0 +1,137 @@
+"""
+Signal handlers keeping organization caches and member counters coherent
+with the database.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from . import counters
+from .cache import MembershipCache, OrganizationCache
+from .models import Invite, Organization, OrganizationMembership
+
+# Model -> (Organization counter field, status of the rows it counts)
+COUNTERS = {
+    OrganizationMembership: counters.MEMBERSHIP_COUNTER,
+    Invite: counters.INVITE_COUNTER,
+}
+
+
+@receiver(pre_save, sender=Organization)
+def remember_organization_identifiers(sender, instance, update_fields=None, **kwargs):
+    """Capture the stored slug/sub_domain so renamed identifiers get invalidated."""
+    instance._previous_identifiers = ()
+
+    if not instance.pk or instance._state.adding:
+        return
+    if update_fields is not None and not {"slug", "sub_domain"} & set(update_fields):
+        return
+
+    previous = (
+        Organization.objects.filter(pk=instance.pk)
+        .values_list("slug", "sub_domain")
+        .first()
+    )
+    if previous:
+        instance._previous_identifiers = previous
+
+
+@receiver(post_save, sender=Organization)
+def invalidate_organization_on_save(sender, instance, **kwargs):
+    """Drop cached lookups when an organization is created, updated or (soft) deleted."""
+    identifiers = getattr(instance, "_previous_identifiers", ())
+    OrganizationCache.invalidate(instance, *identifiers)
+
+    # Invalidate again after commit so a concurrent request can't re-cache the
+    # pre-commit row between our delete and the commit
+    transaction.on_commit(lambda: OrganizationCache.invalidate(instance, *identifiers))
+
+
+@receiver(post_delete, sender=Organization)
+def invalidate_organization_on_delete(sender, instance, **kwargs):
+    """Drop cached lookups when an organization is permanently deleted."""
+    OrganizationCache.invalidate(instance)
+    transaction.on_commit(lambda: OrganizationCache.invalidate(instance))
+
+
+@receiver(post_save, sender=OrganizationMembership)
+def invalidate_membership_on_save(sender, instance, **kwargs):
+    """Bump the user's membership version on create, role or status changes."""
+    MembershipCache.invalidate(instance)
+    transaction.on_commit(lambda: MembershipCache.bump_version(instance.user_id))
+
+
+@receiver(post_delete, sender=OrganizationMembership)
+def invalidate_membership_on_delete(sender, instance, **kwargs):
+    """Bump the user's membership version when a membership is removed."""
+    MembershipCache.invalidate(instance)
+    transaction.on_commit(lambda: MembershipCache.bump_version(instance.user_id))
+
+
+def stored_status(sender, instance):
+    """
+    Read the row's stored status, locking the row inside a transaction so
+    concurrent transitions of the same row are counted once.
+    """
+    rows = sender._base_manager.filter(pk=instance.pk)
+    if transaction.get_connection(instance._state.db).in_atomic_block:
+        rows = rows.select_for_update()
+    return rows.values_list("status", flat=True).first()
+
+
+@receiver(pre_save, sender=OrganizationMembership)
+@receiver(pre_save, sender=Invite)
+def remember_previous_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Capture the stored status so the counters can be adjusted after saving."""
+    if raw or instance._state.adding:
+        instance._previous_status = None
+    elif update_fields is not None and "status" not in update_fields:
+        instance._previous_status = instance.status
+    else:
+        instance._previous_status = stored_status(sender, instance)
+
+
+@receiver(pre_delete, sender=OrganizationMembership)
+@receiver(pre_delete, sender=Invite)
+def remember_status_before_delete(sender, instance, origin=None, **kwargs):
+    """Capture the stored status, so a row deleted concurrently is uncounted once."""
+    if origin is instance:
+        instance._previous_status = stored_status(sender, instance)
+    else:
+        # Bulk or cascaded delete: skip the per-row read
+        instance._previous_status = instance.status
+
+
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_save, sender=Invite)
+def adjust_counters_on_save(sender, instance, raw=False, **kwargs):
+    """Count rows entering or leaving the counted status."""
+    if raw:
+        return
+    field, status = COUNTERS[sender]
+    previous = getattr(instance, "_previous_status", None)
+    delta = counters.status_delta(status, previous, instance.status)
+    adjust_counter(instance, field, delta)
+    instance._previous_status = instance.status
+
+
+@receiver(post_delete, sender=OrganizationMembership)
+@receiver(post_delete, sender=Invite)
+def adjust_counters_on_delete(sender, instance, **kwargs):
+    """Uncount a deleted row."""
+    field, status = COUNTERS[sender]
+    previous = getattr(instance, "_previous_status", instance.status)
+    delta = counters.status_delta(status, previous, None)
+    adjust_counter(instance, field, delta)
+
+
+def adjust_counter(instance, field, delta):
+    """Adjust the organization's counter, and the organization loaded with it."""
+    if not delta:
+        return
+    counters.adjust(instance.organization_id, **{field: delta})
+
+    if instance._meta.get_field("organization").is_cached(instance):
+        organization = instance.organization
+        setattr(organization, field, max(getattr(organization, field) + delta, 0))
@@ -1,11 +1,16 @@
 # organizations/tasks.py
 
+import hashlib
 import logging
+from collections import Counter
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.db import transaction
 from django.utils import timezone
 
-from apps.core.audit.models import AuditLog
+from apps.core.audit.models import AuditAction, AuditLog
+from apps.core.batch_jobs import BatchJob, run_batch_job
+from apps.organizations import counters
 
 logger = logging.getLogger(__name__)
 
@@ -62,81 +67,113 @@ def schedule_permanent_deletion(self, organization_id):
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
 
-@shared_task
-def cleanup_expired_deletions():
-    """
-    Periodic task to clean up organizations that have passed their deletion date.
-    This runs daily to catch any missed deletions.
-    Should be scheduled in Celery Beat:
-
-    CELERY_BEAT_SCHEDULE = {
-        'cleanup-expired-deletions': {
-            'task': 'apps.organizations.tasks.cleanup_expired_deletions',
-            'schedule': crontab(hour=2, minute=0),  # Run at 2 AM daily
-        },
-    }
-
-    In Global Mode: Skips platform organization
-    """
+def expired_organizations(now=None):
+    """Soft-deleted organizations past their scheduled deletion date."""
     from django.conf import settings
 
     from apps.organizations.models import Organization
 
-    # Get platform org slug if in global mode
-    is_global_mode = getattr(settings, "GLOBAL_MODE_ENABLED", False)
-    platform_slug = getattr(settings, "GLOBAL_SCOPE_ORG_SLUG", "platform")
-
-    # Find all organizations that are past their scheduled deletion date
     expired_orgs = Organization.objects.filter(
-        deleted_at__isnull=False, scheduled_permanent_deletion__lte=timezone.now()
+        deleted_at__isnull=False,
+        scheduled_permanent_deletion__lte=now or timezone.now(),
     )
 
     # In global mode, exclude platform organization
-    if is_global_mode:
+    if getattr(settings, "GLOBAL_MODE_ENABLED", False):
+        platform_slug = getattr(settings, "GLOBAL_SCOPE_ORG_SLUG", "platform")
         expired_orgs = expired_orgs.exclude(slug=platform_slug)
 
-    deleted_count = 0
-    error_count = 0
-    skipped_count = 0
+    return expired_orgs
 
-    for org in expired_orgs:
-        try:
-            # Double-check: Skip protected platform organization
-            if org.extended_properties.get("is_global_scope", False):
-                logger.warning(
-                    f"Skipping deletion of protected platform organization: {org.name}"
-                )
-                skipped_count += 1
-                continue
-
-            org_name = org.name
-            org_id = str(org.id)
-            logger.info(f"Cleaning up expired organization: {org_name} ({org_id})")
-            org.permanently_delete()
-            deleted_count += 1
-            logger.info(
-                f"Successfully deleted expired organization: {org_name} ({org_id})"
+
+@shared_task
+def delete_expired_organization(organization_id):
+    """
+    Permanently delete one expired organization.
+
+    Enqueued by cleanup_expired_deletions in chunks of MAX_CONCURRENT. It
+    never raises, so the chunk's callback always receives its status:
+    "deleted", "skipped", "missing" or "error".
+    """
+    try:
+        # Re-check: the organization may have been restored since enqueueing
+        org = expired_organizations().filter(id=organization_id).first()
+        if org is None:
+            return "missing"
+
+        # Double-check: Skip protected platform organization
+        if org.extended_properties.get("is_global_scope", False):
+            logger.warning(
+                f"Skipping deletion of protected platform organization: {org.name}"
             )
-        except Exception as e:
-            error_count += 1
-            logger.error(f"Error deleting expired organization {org.id}: {str(e)}")
+            return "skipped"
+
+        org_name = org.name
+        logger.info(f"Cleaning up expired organization: {org_name} ({organization_id})")
+        # Deletes in short batches; a failure part-way is resumed next run
+        deleted = org.permanently_delete()
+        logger.info(
+            f"Successfully deleted expired organization: {org_name} ({organization_id}), "
+            f"{sum(deleted.values())} rows"
+        )
+        return "deleted"
+    except Exception as e:
+        logger.error(f"Error deleting expired organization {organization_id}: {str(e)}")
+        return "error"
+
+
+def dispatch_expired_deletions(organization_ids, statuses=()):
+    """
+    Run the next ORGANIZATION_DELETION["MAX_CONCURRENT"] deletions as a chord.
+
+    The chord's callback dispatches the following chunk, so at most
+    MAX_CONCURRENT deletions run at once and no task waits for a turn.
+    """
+    from django.conf import settings
+
+    config = getattr(settings, "ORGANIZATION_DELETION", {})
+    size = max(1, config.get("MAX_CONCURRENT", 4))
+    chunk, remaining = organization_ids[:size], organization_ids[size:]
+
+    chord(delete_expired_organization.s(pk) for pk in chunk)(
+        continue_expired_deletions.s(remaining, list(statuses))
+    )
+
+
+@shared_task
+def continue_expired_deletions(chunk_statuses, organization_ids, statuses):
+    """Chord callback: dispatch the next chunk, or record the finished run."""
+    statuses = [*statuses, *chunk_statuses]
+    if organization_ids:
+        dispatch_expired_deletions(organization_ids, statuses)
+    else:
+        record_expired_deletions.delay(statuses)
+
+
+@shared_task
+def record_expired_deletions(statuses):
+    """Write one audit entry summarising the cleanup run."""
+    counts = Counter(statuses)
+    deleted_count = counts["deleted"]
+    error_count = counts["error"]
+    skipped_count = counts["skipped"]
 
     result = {
         "deleted_count": deleted_count,
         "error_count": error_count,
         "skipped_count": skipped_count,
+        "missing_count": counts["missing"],
         "timestamp": timezone.now().isoformat(),
     }
 
     # Log cleanup results for audit
     AuditLog.log_event(
-        event_type="data_deletion",
+        event_type=AuditAction.DATA_DELETE,
         resource_type="organization",
-        resource_id="bulk_cleanup",
         user=None,
         organization=None,
         outcome="success" if error_count == 0 else "partial_failure",
-        details=result,
+        details={"action": "bulk_cleanup", **result},
     )
 
     logger.info(
@@ -145,75 +182,129 @@ def cleanup_expired_deletions():
     return result
 
 
+@shared_task
+def cleanup_expired_deletions():
+    """
+    Periodic task to clean up organizations that have passed their deletion date.
+    This runs daily to catch any missed deletions.
+    Should be scheduled in Celery Beat:
+
+    CELERY_BEAT_SCHEDULE = {
+        'cleanup-expired-deletions': {
+            'task': 'apps.organizations.tasks.cleanup_expired_deletions',
+            'schedule': crontab(hour=2, minute=0),  # Run at 2 AM daily
+        },
+    }
+
+    Acts as a coordinator: enqueues one delete_expired_organization task per
+    organization, as a chain of chords of ORGANIZATION_DELETION["MAX_CONCURRENT"]
+    tasks each. Deletions within a chunk run in parallel; the last callback
+    (record_expired_deletions) writes a single audit entry for the run.
+    Failed deletions are retried by the next daily run.
+
+    In Global Mode: Skips platform organization
+    """
+    organization_ids = [
+        str(pk)
+        for pk in expired_organizations()
+        .order_by("scheduled_permanent_deletion", "pk")
+        .values_list("pk", flat=True)
+    ]
+
+    if organization_ids:
+        dispatch_expired_deletions(organization_ids)
+    else:
+        record_expired_deletions.delay([])
+
+    logger.info(
+        f"Cleanup task dispatched {len(organization_ids)} expired organization deletions"
+    )
+    return {
+        "dispatched": len(organization_ids),
+        "timestamp": timezone.now().isoformat(),
+    }
+
+
+class StaleInviteExpiry(BatchJob):
+    """Mark pending invites past their expiry date as expired."""
+
+    name = "organizations.expire_stale_invites"
+    ordering = ("expires_at", "pk")
+    batch_size = 1000
+
+    def get_params(self):
+        return {"now": timezone.now()}
+
+    def get_queryset(self):
+        from apps.organizations.models import Invite
+
+        return Invite.objects.filter(
+            status="pending", expires_at__lte=self.params["now"]
+        )
+
+    def process_batch(self, pks):
+        from django.db.models import Exists, OuterRef
+
+        from apps.organizations.models import Invite
+
+        # (organization, email, status) is unique: an invite that already has
+        # an expired sibling stays pending (it is invalid by date anyway)
+        already_expired = Invite.objects.filter(
+            organization=OuterRef("organization"),
+            email=OuterRef("email"),
+            status="expired",
+        )
+        expiring = list(
+            self.get_queryset()
+            .filter(pk__in=pks)
+            .exclude(Exists(already_expired))
+            .select_for_update()
+            .values_list("pk", "organization_id")
+        )
+        Invite.objects.filter(pk__in=[pk for pk, _ in expiring]).update(
+            status="expired", updated_at=timezone.now()
+        )
+
+        # .update() skips the signals maintaining the pending invite counters
+        for organization_id, count in Counter(org for _, org in expiring).items():
+            counters.adjust(organization_id, pending_invite_count=-count)
+        return len(expiring)
+
+
+@shared_task(bind=True)
+def expire_stale_invites(self):
+    """
+    Periodic task marking pending invites past their expiry date as expired.
+
+    Invites are validated by date when accepted, so this only keeps their
+    status (and invite listings) accurate. Runs in checkpointed batches.
+    """
+    result = run_batch_job(self, StaleInviteExpiry())
+    logger.info(f"Invite expiry task: Marked {result.processed} invites as expired")
+    return result.as_dict()
+
+
 @shared_task
 def export_organization_data(organization_id, requester_email):
     """
     Export all data for an organization (GDPR data portability).
-    Generates a comprehensive JSON export of all organization data.
+    Streams a gzip-compressed NDJSON export of all organization data to the
+    export storage (see apps.organizations.exports).
     """
-    import json
-
+    from apps.organizations.exports import (
+        OrganizationExporter,
+        get_export_download_url,
+    )
     from apps.organizations.models import Organization
 
     try:
         organization = Organization.objects.get(id=organization_id)
 
-        # Compile all organization data
-        export_data = {
-            "organization": {
-                "id": str(organization.id),
-                "name": organization.name,
-                "slug": organization.slug,
-                "description": organization.description,
-                "sub_domain": organization.sub_domain,
-                "plan": organization.plan,
-                "created_at": organization.created_at.isoformat(),
-                "updated_at": organization.updated_at.isoformat(),
-            },
-            "members": [
-                {
-                    "id": str(membership.user.id),
-                    "email": membership.user.email,
-                    "first_name": membership.user.first_name,
-                    "last_name": membership.user.last_name,
-                    "role": membership.role,
-                    "joined_at": membership.created_at.isoformat(),
-                }
-                for membership in organization.memberships.select_related("user").all()
-            ],
-            "invites": [
-                {
-                    "email": invite.email,
-                    "role": invite.role,
-                    "status": invite.status,
-                    "invited_at": invite.created_at.isoformat(),
-                }
-                for invite in organization.invites.all()
-            ],
-            "audit_logs": [
-                {
-                    "event_type": log.event_type,
-                    "resource_type": log.resource_type,
-                    "resource_id": log.resource_id,
-                    "user_email": log.user_email,
-                    "outcome": log.outcome,
-                    "details": log.details,
-                    "timestamp": log.created_at.isoformat(),
-                }
-                for log in AuditLog.objects.filter(organization=organization).order_by(
-                    "-created_at"
-                )[:1000]
-            ],
-            "exported_at": timezone.now().isoformat(),
-            "requester": requester_email,
-        }
-
-        # Save export to file (could also upload to S3)
-        export_filename = f"org_export_{organization.slug}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.json"
-        export_path = f"/tmp/{export_filename}"  # In production, use S3
-
-        with open(export_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+        exporter = OrganizationExporter(organization, requester_email)
+        export_filename = exporter.export()
+        export_url = get_export_download_url(
+            organization, export_filename, requester_email
+        )
 
         # Send export to requester via email
         from apps.accounts.models import Account
@@ -223,16 +314,20 @@ def export_organization_data(organization_id, requester_email):
         if requester:
             context = {
                 "organization": organization,
-                "export_url": f"/exports/{export_filename}",  # Should be S3 URL in production
+                "export_url": export_url,
                 "subject": f"Data Export for {organization.name}",
             }
 
-            send_email(
-                organization=organization,
-                recipient=requester,
-                template_slug="data_export",
-                context=context,
-            )
+            try:
+                send_email(
+                    organization=organization,
+                    recipient=requester,
+                    template_slug="data_export",
+                    context=context,
+                )
+            except Exception as e:
+                # The export is stored; don't report it as failed
+                logger.error(f"Failed to send data export email: {str(e)}")
 
         # Log the export for audit purposes
         AuditLog.log_event(
@@ -245,6 +340,7 @@ def export_organization_data(organization_id, requester_email):
             details={
                 "export_filename": export_filename,
                 "requester_email": requester_email,
+                "counts": exporter.counts,
             },
         )
 
@@ -253,8 +349,9 @@ def export_organization_data(organization_id, requester_email):
         )
         return {
             "status": "success",
-            "export_path": export_path,
+            "export_path": export_filename,
             "export_filename": export_filename,
+            "counts": exporter.counts,
         }
 
     except Organization.DoesNotExist:
@@ -266,53 +363,85 @@ def export_organization_data(organization_id, requester_email):
         return {"status": "error", "message": str(e)}
 
 
+# Account columns rewritten by anonymize_account()
+ANONYMIZED_FIELDS = (
+    "email",
+    "first_name",
+    "last_name",
+    "phone",
+    "bio",
+    "avatar",
+    "date_of_birth",
+    "is_active",
+    "updated_at",
+)
+
+
+def anonymize_account(user, now=None) -> str:
+    """
+    Replace an account's PII in place (without saving it).
+
+    Returns:
+        The account's original email
+    """
+    now = now or timezone.now()
+    original_email = user.email
+
+    # Generate anonymized identifier
+    digest = hashlib.sha256(f"{user.pk}{now.isoformat()}".encode()).hexdigest()
+    anonymized_id = digest[:16]
+
+    user.email = f"deleted_{anonymized_id}@anonymized.local"
+    user.first_name = "Deleted"
+    user.last_name = "User"
+    user.phone = ""
+    user.bio = ""
+    user.avatar = None
+    user.date_of_birth = None
+    user.is_active = False
+    user.updated_at = now
+    return original_email
+
+
+def anonymization_audit_entry(user, original_email, reason=None):
+    """Unsaved audit entry recording the anonymization of an account."""
+    return AuditLog(
+        action="data_deletion",
+        resource_type="user",
+        resource_id=user.pk,
+        user=None,  # User is being deleted
+        organization=None,
+        ip_address="0.0.0.0",
+        success=True,
+        details={
+            "action": "anonymize",
+            "original_email": original_email,
+            "reason": reason,
+        },
+    )
+
+
 @shared_task
 def anonymize_user_data(user_id, reason=None):
     """
     Anonymize user data (GDPR right to erasure).
     Replaces PII with anonymized data but keeps records for audit purposes.
+    For many users at once use anonymize_users.
     """
-    import hashlib
-
     from apps.accounts.models import Account
 
     try:
         user = Account.objects.get(id=user_id)
-        original_email = user.email
-
-        # Generate anonymized identifier
-        anonymized_id = hashlib.sha256(
-            f"{user_id}{timezone.now().isoformat()}".encode()
-        ).hexdigest()[:16]
 
         # Anonymize user data
-        user.email = f"deleted_{anonymized_id}@anonymized.local"
-        user.first_name = "Deleted"
-        user.last_name = "User"
-        user.phone = ""
-        user.bio = ""
-        user.avatar = None
-        user.date_of_birth = None
-        user.is_active = False
+        original_email = anonymize_account(user)
         user.save()
 
         # Delete auth providers
         user.auth_providers.all().delete()
 
         # Log the anonymization for audit purposes
-        AuditLog.log_event(
-            event_type="data_deletion",
-            resource_type="user",
-            resource_id=str(user.id),
-            user=None,  # User is being deleted
-            organization=None,
-            outcome="success",
-            details={
-                "action": "anonymize",
-                "original_email": original_email,
-                "reason": reason,
-            },
-        )
+        anonymization_audit_entry(user, original_email, reason).save()
 
         logger.info(f"User data anonymized: {original_email} -> {user.email}")
         return {
@@ -328,3 +457,93 @@ def anonymize_user_data(user_id, reason=None):
     except Exception as e:
         logger.error(f"Error anonymizing user data {user_id}: {str(e)}")
         return {"status": "error", "message": str(e)}
+
+
+class UserAnonymization(BatchJob):
+    """
+    Anonymize a set of accounts in bulk.
+
+    Each batch is one bulk_update over the PII columns, one DELETE of the
+    batch's auth providers and one bulk_create of audit entries. Accounts
+    already anonymized are skipped, so an erasure request can be resumed or
+    re-run safely. The checkpoint is keyed by the requested user ids.
+    """
+
+    batch_size = 500
+
+    def __init__(self, user_ids, reason=None, dry_run=False, **kwargs):
+        super().__init__(**kwargs)
+        self.user_ids = sorted({str(user_id) for user_id in user_ids})
+        self.reason = reason
+        self.dry_run = dry_run
+
+        request = hashlib.sha256(",".join(self.user_ids).encode()).hexdigest()[:16]
+        self.name = f"organizations.anonymize_users.{request}"
+        if dry_run:
+            self.name += ".dry_run"
+
+    def get_queryset(self):
+        from apps.accounts.models import Account
+
+        return Account.objects.filter(pk__in=self.user_ids).exclude(
+            email__endswith="@anonymized.local"
+        )
+
+    def process_batch(self, pks):
+        from apps.accounts.cache import AccountCache
+        from apps.accounts.models import Account, AccountAuthProvider
+
+        users = list(self.get_queryset().filter(pk__in=pks).only("pk", "email"))
+        if self.dry_run:
+            return len(users)
+
+        now = timezone.now()
+        entries = [
+            anonymization_audit_entry(user, anonymize_account(user, now), self.reason)
+            for user in users
+        ]
+        Account.objects.bulk_update(users, ANONYMIZED_FIELDS)
+        AccountAuthProvider.objects.filter(user_id__in=pks).delete()
+        AuditLog.objects.bulk_create(entries)
+
+        # bulk_update skips the post_save cache invalidation
+        user_ids = [user.pk for user in users]
+        for user_id in user_ids:
+            AccountCache.invalidate(user_id)
+        transaction.on_commit(
+            lambda: [AccountCache.invalidate(user_id) for user_id in user_ids]
+        )
+        return len(users)
+
+
+@shared_task(bind=True)
+def anonymize_users(self, user_ids, reason=None, dry_run=False, batch_size=None):
+    """
+    Anonymize many users at once (e.g. enterprise offboarding erasure).
+
+    Same anonymization as anonymize_user_data, in checkpointed batches (see
+    UserAnonymization). A run that exhausts its time budget is continued by
+    a follow-up task. With dry_run nothing is changed; the result reports
+    how many accounts would be anonymized.
+    """
+    job = UserAnonymization(
+        user_ids, reason=reason, dry_run=dry_run, batch_size=batch_size
+    )
+    result = run_batch_job(
+        self,
+        job,
+        user_ids=user_ids,
+        reason=reason,
+        dry_run=dry_run,
+        batch_size=batch_size,
+    )
+
+    logger.info(
+        f"User anonymization{' (dry run)' if dry_run else ''}: "
+        f"{result.processed} of {len(job.user_ids)} accounts"
+    )
+    return {
+        **result.as_dict(),
+        "requested": len(job.user_ids),
+        "dry_run": dry_run,
+    }
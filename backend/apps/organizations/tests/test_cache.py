@@ -0,0 +1,266 @@
+"""
+Tests for organization resolution caching.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import Account
+from apps.accounts.tests.factories import AccountFactory
+from apps.organizations.cache import MembershipCache, OrganizationCache
+from apps.organizations.middleware.tenant import TenantMiddleware
+from apps.organizations.tests.factories import (
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestOrganizationCache:
+    """Test the two-tier organization lookup cache."""
+
+    def test_resolve_by_subdomain_and_slug(self):
+        """Test organizations resolve by sub_domain or slug."""
+        org = OrganizationFactory(slug="acme-corp", sub_domain="acme")
+
+        assert OrganizationCache.resolve("acme") == org
+        assert OrganizationCache.resolve("acme-corp") == org
+
+    def test_repeated_resolution_hits_cache(self):
+        """Test only the first resolution touches the database."""
+        org = OrganizationFactory(sub_domain="acme")
+        OrganizationCache.resolve("acme")
+
+        with CaptureQueriesContext(connection) as queries:
+            assert OrganizationCache.resolve("acme") == org
+
+        assert len(queries) == 0
+
+    def test_shared_cache_used_when_local_tier_is_cold(self):
+        """Test the shared cache answers after the local LRU is cleared."""
+        OrganizationFactory(sub_domain="acme")
+        OrganizationCache.resolve("acme")
+        OrganizationCache._local.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            assert OrganizationCache.resolve("acme") is not None
+
+        assert len(queries) == 0
+
+    def test_resolve_returns_private_copies(self):
+        """Test callers can't mutate the cached instance."""
+        OrganizationFactory(sub_domain="acme")
+
+        first = OrganizationCache.resolve("acme")
+        first.name = "Mutated"
+
+        assert OrganizationCache.resolve("acme").name != "Mutated"
+
+    def test_misses_are_cached(self):
+        """Test unknown identifiers are negatively cached."""
+        assert OrganizationCache.resolve("missing-org") is None
+
+        with CaptureQueriesContext(connection) as queries:
+            assert OrganizationCache.resolve("missing-org") is None
+
+        assert len(queries) == 0
+
+    def test_overlong_identifier_skips_lookup(self):
+        """Test identifiers longer than any slug never hit the database."""
+        with CaptureQueriesContext(connection) as queries:
+            assert OrganizationCache.resolve("x" * 200) is None
+
+        assert len(queries) == 0
+
+    def test_creating_org_clears_negative_entry(self):
+        """Test a new organization replaces a cached miss."""
+        assert OrganizationCache.resolve("newco") is None
+
+        org = OrganizationFactory(sub_domain="newco")
+
+        assert OrganizationCache.resolve("newco") == org
+
+    def test_update_invalidates_cached_entry(self):
+        """Test saving an organization refreshes its cached lookup."""
+        org = OrganizationFactory(sub_domain="acme")
+        OrganizationCache.resolve("acme")
+
+        org.name = "Renamed Org"
+        org.save()
+
+        assert OrganizationCache.resolve("acme").name == "Renamed Org"
+
+    def test_changed_subdomain_invalidates_old_identifier(self):
+        """Test the previous sub_domain stops resolving after a rename."""
+        org = OrganizationFactory(sub_domain="oldname")
+        OrganizationCache.resolve("oldname")
+
+        org.sub_domain = "newname"
+        org.save()
+
+        assert OrganizationCache.resolve("oldname") is None
+        assert OrganizationCache.resolve("newname") == org
+
+    def test_deactivation_and_reactivation_invalidate(self):
+        """Test deactivated organizations stop resolving until reactivated."""
+        org = OrganizationFactory(sub_domain="acme")
+        OrganizationCache.resolve("acme")
+
+        # soft_delete() and restore() persist is_active through update_fields
+        org.is_active = False
+        org.save(update_fields=["is_active"])
+        assert OrganizationCache.resolve("acme") is None
+
+        org.is_active = True
+        org.save(update_fields=["is_active"])
+        assert OrganizationCache.resolve("acme") == org
+
+    def test_delete_invalidates(self):
+        """Test permanently deleted organizations stop resolving."""
+        org = OrganizationFactory(sub_domain="acme")
+        OrganizationCache.resolve("acme")
+
+        org.delete()
+
+        assert OrganizationCache.resolve("acme") is None
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestTenantMiddlewareOrganizationCache:
+    """Test TenantMiddleware resolves organizations through the cache."""
+
+    def setup_method(self):
+        self.factory = RequestFactory()
+        self.middleware = TenantMiddleware(get_response=lambda r: HttpResponse())
+
+    def _request(self, org_slug):
+        request = self.factory.get("/api/v1/organizations/", HTTP_X_ORG_SLUG=org_slug)
+        request.user = AnonymousUser()
+        return request
+
+    def test_middleware_resolves_without_queries_when_warm(self):
+        """Test warm requests resolve the organization without queries."""
+        org = OrganizationFactory(slug="acme-corp")
+        self.middleware.process_request(self._request("acme-corp"))
+
+        request = self._request("acme-corp")
+        with CaptureQueriesContext(connection) as queries:
+            self.middleware.process_request(request)
+
+        assert request.org == org
+        assert len(queries) == 0
+
+    def test_middleware_unknown_org_raises_404(self):
+        """Test unknown organizations still 404, cached or not."""
+        for _ in range(2):
+            with pytest.raises(Http404):
+                self.middleware.process_request(self._request("unknown-org"))
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestMembershipCache:
+    """Test request- and user/org-scoped membership caching."""
+
+    def test_repeated_permission_checks_use_identity_map(self):
+        """Test permission helpers share one membership lookup per instance."""
+        membership = OrganizationMembershipFactory(role="admin", status="active")
+        user, org = membership.user, membership.organization
+        MembershipCache.clear_identity_map(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert user.is_admin_of(org)
+            assert not user.is_owner_of(org)
+            assert user.can_manage_members_in(org)
+            assert not user.can_manage_billing_in(org)
+
+        assert len(queries) == 1
+
+    def test_shared_cache_serves_fresh_user_instances(self):
+        """Test a new user instance (next request) hits the shared cache."""
+        membership = OrganizationMembershipFactory(status="active")
+        org = membership.organization
+        membership.user.get_membership_in(org)
+
+        fresh_user = Account.objects.get(pk=membership.user_id)
+        with CaptureQueriesContext(connection) as queries:
+            assert fresh_user.get_membership_in(org) == membership
+
+        assert len(queries) == 0
+
+    def test_missing_membership_is_cached(self):
+        """Test non-members are cached as well."""
+        user = AccountFactory()
+        org = OrganizationFactory()
+        assert user.get_membership_in(org) is None
+
+        fresh_user = Account.objects.get(pk=user.pk)
+        with CaptureQueriesContext(connection) as queries:
+            assert fresh_user.get_membership_in(org) is None
+
+        assert len(queries) == 0
+
+    def test_creating_membership_invalidates(self):
+        """Test a new membership is visible immediately."""
+        user = AccountFactory()
+        org = OrganizationFactory()
+        assert not user.is_owner_of(org)
+
+        OrganizationMembershipFactory(
+            organization=org, user=user, role="owner", status="active"
+        )
+
+        assert user.is_owner_of(org)
+        assert Account.objects.get(pk=user.pk).is_owner_of(org)
+
+    def test_role_and_status_changes_invalidate(self):
+        """Test change_role(), suspend() and reactivate() bump the version."""
+        org = OrganizationFactory(plan="enterprise", on_trial=False)
+        OrganizationMembershipFactory(organization=org, role="owner", status="active")
+        membership = OrganizationMembershipFactory(
+            organization=org, role="member", status="active"
+        )
+        user_id = membership.user_id
+
+        def fresh_membership():
+            return Account.objects.get(pk=user_id).get_membership_in(org)
+
+        version = MembershipCache.get_version(user_id)
+        assert fresh_membership().role == "member"
+
+        membership.change_role("admin")
+        assert MembershipCache.get_version(user_id) != version
+        assert fresh_membership().role == "admin"
+
+        membership.suspend()
+        assert fresh_membership().status == "suspended"
+
+        membership.reactivate()
+        assert fresh_membership().status == "active"
+
+    def test_deleting_membership_invalidates(self):
+        """Test removed memberships stop resolving."""
+        membership = OrganizationMembershipFactory(status="active")
+        user_id, org = membership.user_id, membership.organization
+        Account.objects.get(pk=user_id).get_membership_in(org)
+
+        membership.delete()
+
+        assert Account.objects.get(pk=user_id).get_membership_in(org) is None
+
+    def test_evicted_version_reseeds(self):
+        """Test entries written under an evicted version are never read."""
+        membership = OrganizationMembershipFactory(status="active")
+        user_id = membership.user_id
+        version = MembershipCache.get_version(user_id)
+
+        cache.delete(MembershipCache.get_version_key(user_id))
+
+        assert MembershipCache.get_version(user_id) != version
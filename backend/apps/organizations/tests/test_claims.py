@@ -0,0 +1,273 @@
+"""
+Tests for JWT tenant claims as a membership fast path.
+"""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.tests.factories import AccountFactory
+from apps.accounts.views.auth import add_custom_claims
+from apps.organizations.cache import MembershipCache
+from apps.organizations.claims import (
+    MEMBERSHIP_VERSION_CLAIM,
+    build_tenant_claims,
+    get_claims_membership,
+)
+from apps.organizations.middleware.tenant import TenantMiddleware
+from apps.organizations.permissions import IsOrgAdmin
+from apps.organizations.tests.factories import (
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+)
+
+
+def issue_access_token(user):
+    """Issue an access token carrying the tenant claims, as login does."""
+    access = RefreshToken.for_user(user).access_token
+    add_custom_claims(access, user)
+    return access
+
+
+def token_request(access, org_slug):
+    """Build a plain Django request authenticated only by a bearer token."""
+    request = RequestFactory().get(
+        "/api/v1/organizations/",
+        HTTP_AUTHORIZATION=f"Bearer {access}",
+        HTTP_X_ORG_SLUG=org_slug,
+    )
+    request.user = AnonymousUser()
+    return request
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestClaimsMembership:
+    """Test membership resolution from verified token claims."""
+
+    @pytest.fixture(autouse=True)
+    def trust_claims(self, settings):
+        settings.JWT_TRUST_TENANT_CLAIMS = True
+
+    def test_token_carries_membership_version(self):
+        """Test access tokens record the user's membership version."""
+        membership = OrganizationMembershipFactory(status="active")
+
+        access = issue_access_token(membership.user)
+
+        assert access[MEMBERSHIP_VERSION_CLAIM] == MembershipCache.get_version(
+            membership.user_id
+        )
+
+    def test_claims_membership_without_queries(self):
+        """Test a current token yields the claimed membership without queries."""
+        membership = OrganizationMembershipFactory(role="admin", status="active")
+        request = token_request(
+            issue_access_token(membership.user), membership.organization.slug
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            claimed = get_claims_membership(request, membership.organization)
+
+        assert len(queries) == 0
+        assert claimed.role == "admin"
+        assert claimed.user_id == membership.user_id
+        assert claimed.is_admin()
+
+    def test_membership_change_makes_claims_stale(self):
+        """Test a role change revokes the claims immediately."""
+        org = OrganizationFactory(plan="enterprise", on_trial=False)
+        OrganizationMembershipFactory(organization=org, role="owner", status="active")
+        membership = OrganizationMembershipFactory(
+            organization=org, role="admin", status="active"
+        )
+        request = token_request(issue_access_token(membership.user), org.slug)
+
+        membership.change_role("member")
+
+        assert get_claims_membership(request, org) is None
+
+    def test_unclaimed_organization_falls_back(self):
+        """Test organizations missing from the claims aren't authorized."""
+        membership = OrganizationMembershipFactory(status="active")
+        other_org = OrganizationFactory()
+        request = token_request(issue_access_token(membership.user), other_org.slug)
+
+        assert get_claims_membership(request, other_org) is None
+
+    def test_invalid_token_is_ignored(self):
+        """Test tampered tokens never produce a membership."""
+        membership = OrganizationMembershipFactory(status="active")
+        request = token_request("not-a-token", membership.organization.slug)
+
+        assert get_claims_membership(request, membership.organization) is None
+
+    def test_disabled_by_setting(self, settings):
+        """Test claims are ignored unless explicitly enabled."""
+        settings.JWT_TRUST_TENANT_CLAIMS = False
+        membership = OrganizationMembershipFactory(status="active")
+        request = token_request(
+            issue_access_token(membership.user), membership.organization.slug
+        )
+
+        assert get_claims_membership(request, membership.organization) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestClaimsAuthorization:
+    """Test TenantMiddleware and permissions authorize from claims."""
+
+    @pytest.fixture(autouse=True)
+    def trust_claims(self, settings):
+        settings.JWT_TRUST_TENANT_CLAIMS = True
+
+    def test_middleware_sets_membership_from_claims(self):
+        """Test token requests get request.membership from the claims."""
+        membership = OrganizationMembershipFactory(role="owner", status="active")
+        org = membership.organization
+        middleware = TenantMiddleware(get_response=lambda r: HttpResponse())
+        access = issue_access_token(membership.user)
+        middleware.process_request(token_request(access, org.slug))
+
+        request = token_request(access, org.slug)
+        with CaptureQueriesContext(connection) as queries:
+            middleware.process_request(request)
+
+        assert len(queries) == 0
+        assert request.org == org
+        assert request.membership.is_owner()
+
+    def test_permission_uses_claims_for_token_users(self):
+        """Test IsOrgAdmin authorizes DRF token requests from the claims."""
+        membership = OrganizationMembershipFactory(role="admin", status="active")
+        access = issue_access_token(membership.user)
+
+        request = APIRequestFactory().get("/api/v1/organizations/")
+        force_authenticate(request, user=membership.user, token=access)
+        drf_request = APIView().initialize_request(request)
+        drf_request.org = membership.organization
+        drf_request.membership = None
+
+        assert IsOrgAdmin().has_permission(drf_request, APIView())
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestGlobalModeClaims:
+    """Test the platform organization claims issued in global mode."""
+
+    @pytest.fixture(autouse=True)
+    def global_mode(self, settings):
+        settings.JWT_TRUST_TENANT_CLAIMS = True
+        settings.GLOBAL_MODE_ENABLED = True
+        settings.GLOBAL_SCOPE_ORG_SLUG = "platform"
+
+    @pytest.fixture
+    def platform_org(self):
+        return OrganizationFactory(name="Platform", slug="platform")
+
+    def test_active_member_is_claimed(self, platform_org):
+        """Test active platform members authorize from the claims."""
+        membership = OrganizationMembershipFactory(
+            organization=platform_org, role="admin", status="active"
+        )
+        access = issue_access_token(membership.user)
+
+        claimed = get_claims_membership(
+            token_request(access, platform_org.slug), platform_org
+        )
+
+        assert access["organization_role"] == "admin"
+        assert claimed.role == "admin"
+
+    def test_suspended_member_is_not_claimed(self, platform_org):
+        """Test suspended platform members get no claimed membership."""
+        membership = OrganizationMembershipFactory(
+            organization=platform_org, role="admin", status="suspended"
+        )
+        access = issue_access_token(membership.user)
+        request = token_request(access, platform_org.slug)
+
+        assert access["organizations"] == []
+        assert access["organization_role"] is None
+        assert access["permissions"] == []
+        assert get_claims_membership(request, platform_org) is None
+
+    def test_user_without_membership_is_not_claimed(self, platform_org):
+        """Test users without a platform membership fall back to the database."""
+        access = issue_access_token(AccountFactory())
+        request = token_request(access, platform_org.slug)
+
+        assert access["organizations"] == []
+        assert access["primary_organization_id"] == str(platform_org.id)
+        assert get_claims_membership(request, platform_org) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestBuildTenantClaims:
+    """Test the single-query claims builder used by login and refresh."""
+
+    def test_claims_for_many_organizations_use_one_query(self):
+        """Test claim building doesn't grow with the number of organizations."""
+        user = AccountFactory()
+        memberships = [
+            OrganizationMembershipFactory(user=user, status="active") for _ in range(30)
+        ]
+        MembershipCache.get_version(user.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            claims = build_tenant_claims(user)
+
+        assert len(queries) == 1
+        assert len(claims["organizations"]) == 30
+        # Memberships are ordered newest first, like get_primary_organization()
+        assert claims["primary_organization_id"] == str(
+            user.get_primary_organization().id
+        )
+        assert {c["id"] for c in claims["organizations"]} == {
+            str(m.organization_id) for m in memberships
+        }
+
+    def test_claims_match_primary_membership(self):
+        """Test role and permissions come from the primary membership."""
+        membership = OrganizationMembershipFactory(role="owner", status="active")
+
+        claims = build_tenant_claims(membership.user)
+
+        assert claims["primary_organization_id"] == str(membership.organization_id)
+        assert claims["organization_role"] == "owner"
+        assert claims["permissions"] == membership.get_permissions()
+
+    def test_claims_are_cached_until_membership_changes(self):
+        """Test warm builds are free and membership changes rebuild them."""
+        membership = OrganizationMembershipFactory(status="active")
+        user = membership.user
+        build_tenant_claims(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            build_tenant_claims(user)
+        assert len(queries) == 0
+
+        OrganizationMembershipFactory(user=user, status="active")
+
+        assert len(build_tenant_claims(user)["organizations"]) == 2
+
+    def test_suspended_memberships_are_excluded(self):
+        """Test only active memberships are claimed."""
+        user = AccountFactory()
+        OrganizationMembershipFactory(user=user, status="suspended")
+
+        claims = build_tenant_claims(user)
+
+        assert claims["primary_organization_id"] is None
+        assert claims["organization_role"] is None
+        assert claims["permissions"] == []
+        assert claims["organizations"] == []
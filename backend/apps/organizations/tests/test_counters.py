@@ -0,0 +1,125 @@
+"""
+Tests for the denormalized organization member counters.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.organizations.models import Organization, OrganizationMembership
+from apps.organizations.tests.factories import (
+    InviteFactory,
+    OrganizationFactory,
+    OrganizationMembershipFactory,
+)
+
+
+def counters_of(organization):
+    return Organization.objects.values_list(
+        "active_member_count", "pending_invite_count"
+    ).get(pk=organization.pk)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestMemberCounters:
+    """Test counters follow membership and invite transitions."""
+
+    def test_membership_transitions(self):
+        """Test active members are counted through their status changes."""
+        org = OrganizationFactory(plan="pro")
+        OrganizationMembershipFactory(organization=org, role="owner")
+        membership = OrganizationMembershipFactory(organization=org)
+        OrganizationMembershipFactory(organization=org, status="suspended")
+
+        assert counters_of(org) == (2, 0)
+        assert org.active_member_count == 2  # the instance is kept in step
+
+        membership.suspend()
+        assert counters_of(org) == (1, 0)
+
+        membership.reactivate()
+        assert counters_of(org) == (2, 0)
+
+        membership.delete()
+        assert counters_of(org) == (1, 0)
+        assert org.get_active_members_count() == 1
+
+    def test_invite_transitions(self):
+        """Test pending invites are counted until revoked or deleted."""
+        org = OrganizationFactory()
+        invite = InviteFactory(organization=org, email="one@example.com")
+        other = InviteFactory(organization=org, email="two@example.com")
+
+        assert counters_of(org) == (0, 2)
+
+        invite.revoke()
+        assert counters_of(org) == (0, 1)
+
+        other.delete()
+        assert counters_of(org) == (0, 0)
+
+    def test_saving_a_stale_organization_keeps_counters(self):
+        """Test a full save doesn't write back counters read earlier."""
+        org = OrganizationFactory()
+        stale = Organization.objects.get(pk=org.pk)
+        OrganizationMembershipFactory(organization=org)
+
+        stale.name = "Renamed"
+        stale.save()
+
+        assert counters_of(org) == (1, 0)
+        assert Organization.objects.get(pk=org.pk).name == "Renamed"
+
+    def test_decrement_from_zero_is_clamped(self, caplog):
+        """Test a drifted counter stops at zero instead of failing the action."""
+        org = OrganizationFactory(plan="pro")
+        OrganizationMembershipFactory(organization=org, role="owner")
+        membership = OrganizationMembershipFactory(organization=org)
+        invite = InviteFactory(organization=org)
+        Organization.objects.filter(pk=org.pk).update(
+            active_member_count=0, pending_invite_count=0
+        )
+
+        with caplog.at_level("WARNING", logger="apps.organizations.counters"):
+            membership.suspend()
+            invite.revoke()
+
+        assert counters_of(org) == (0, 0)
+        assert "clamped at 0" in caplog.text
+
+        call_command("reconcile_member_counters", stdout=StringIO())
+        assert counters_of(org) == (1, 0)
+
+    def test_row_deleted_twice_is_uncounted_once(self):
+        """Test deleting a stale copy of a deleted row leaves the counter alone."""
+        org = OrganizationFactory(plan="pro")
+        OrganizationMembershipFactory(organization=org, role="owner")
+        membership = OrganizationMembershipFactory(organization=org)
+        stale = OrganizationMembership.objects.get(pk=membership.pk)
+
+        membership.delete()
+        stale.delete()
+
+        assert counters_of(org) == (1, 0)
+
+    def test_reconcile_command_repairs_drift(self):
+        """Test the command recounts drifted organizations only."""
+        drifted = OrganizationFactory()
+        OrganizationMembershipFactory(organization=drifted)
+        InviteFactory(organization=drifted)
+        correct = OrganizationFactory()
+        OrganizationMembershipFactory(organization=correct)
+        Organization.objects.filter(pk=drifted.pk).update(
+            active_member_count=7, pending_invite_count=0
+        )
+
+        out = StringIO()
+        call_command("reconcile_member_counters", "--dry-run", stdout=out)
+        assert "1 organizations have drifted counters" in out.getvalue()
+        assert counters_of(drifted) == (7, 0)
+
+        call_command("reconcile_member_counters", stdout=StringIO())
+        assert counters_of(drifted) == (1, 1)
+        assert counters_of(correct) == (1, 0)
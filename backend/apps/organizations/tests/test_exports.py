@@ -0,0 +1,186 @@
+"""
+Tests for the streaming organization data export.
+"""
+
+import gzip
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from apps.core.audit.models import AuditAction, AuditLog
+from apps.organizations.exports import (
+    OrganizationExporter,
+    get_export_download_url,
+    get_export_storage,
+    load_export_link,
+)
+from apps.organizations.tasks import export_organization_data
+from apps.organizations.tests.factories import (
+    ActiveMembershipFactory,
+    InviteFactory,
+    OrganizationFactory,
+)
+
+
+def read_export(storage, name):
+    """Parse an exported file into its records."""
+    with storage.open(name) as f:
+        return [json.loads(line) for line in gzip.decompress(f.read()).splitlines()]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestOrganizationExport:
+    """Test gzipped NDJSON exports streamed to export storage."""
+
+    @pytest.fixture(autouse=True)
+    def export_storage(self, settings, tmp_path):
+        settings.ORGANIZATION_EXPORT_STORAGE = {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        }
+
+    def create_audit_logs(self, organization, count):
+        for _ in range(count):
+            AuditLog.log_event(
+                action=AuditAction.MEMBER_JOIN,
+                organization=organization,
+                resource_type="membership",
+            )
+
+    def test_export_contains_every_section(self):
+        """Test organization, members, invites and audit logs are exported."""
+        organization = OrganizationFactory()
+        membership = ActiveMembershipFactory(organization=organization)
+        InviteFactory(organization=organization)
+        self.create_audit_logs(organization, 2)
+
+        storage = get_export_storage()
+        name = OrganizationExporter(organization, "admin@example.com").export()
+        records = read_export(storage, name)
+
+        assert name.endswith(".ndjson.gz")
+        assert [r["type"] for r in records] == [
+            "organization",
+            "member",
+            "invite",
+            "audit_log",
+            "audit_log",
+            "export",
+        ]
+        assert records[0]["data"]["slug"] == organization.slug
+        assert records[1]["data"]["email"] == membership.user.email
+        assert records[-1]["data"]["counts"] == {
+            "organization": 1,
+            "member": 1,
+            "invite": 1,
+            "audit_log": 2,
+        }
+
+    def test_audit_logs_are_complete_across_pages(self):
+        """Test keyset paging neither truncates nor repeats audit logs."""
+        organization = OrganizationFactory()
+        self.create_audit_logs(organization, 7)
+        self.create_audit_logs(OrganizationFactory(), 2)  # other tenant
+
+        storage = get_export_storage()
+        exporter = OrganizationExporter(organization, "admin@example.com", chunk_size=3)
+        records = read_export(storage, exporter.export())
+
+        logs = [r["data"] for r in records if r["type"] == "audit_log"]
+        assert len(logs) == 7
+        timestamps = [log["timestamp"] for log in logs]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    def test_task_stores_export(self):
+        """Test the Celery task streams the export into storage."""
+        organization = OrganizationFactory()
+        ActiveMembershipFactory(organization=organization)
+
+        result = export_organization_data.apply(
+            args=[str(organization.id), "admin@example.com"]
+        ).get()
+
+        assert result["status"] == "success"
+        assert result["counts"]["member"] == 1
+        assert get_export_storage().exists(result["export_filename"])
+
+
+@pytest.mark.django_db
+@pytest.mark.api
+class TestExportDownload:
+    """Test exports are downloaded through signed links only."""
+
+    @pytest.fixture(autouse=True)
+    def export_storage(self, settings, tmp_path):
+        settings.ORGANIZATION_EXPORT_STORAGE = {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        }
+        settings.SITE_URL = "https://api.example.com"
+
+    @pytest.fixture
+    def admin_membership(self):
+        return ActiveMembershipFactory(role="admin")
+
+    def export_link(self, membership):
+        organization = membership.organization
+        name = OrganizationExporter(organization, membership.user.email).export()
+        url = get_export_download_url(organization, name, membership.user.email)
+        return url, name
+
+    def test_signed_link_downloads_export(self, api_client, admin_membership):
+        """Test the mailed link serves the file without API credentials."""
+        url, name = self.export_link(admin_membership)
+
+        assert url.startswith("https://api.example.com/api/v1/organizations/exports/")
+        response = api_client.get(urlsplit(url).path)
+
+        assert response.status_code == 200
+        assert name in response["Content-Disposition"]
+        records = gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        assert json.loads(records[0])["type"] == "organization"
+
+    def test_tampered_link_is_refused(self, api_client, admin_membership):
+        """Test links whose signature doesn't verify are not found."""
+        url, _ = self.export_link(admin_membership)
+
+        response = api_client.get(urlsplit(url).path.rstrip("/") + "x/")
+
+        assert response.status_code == 404
+
+    def test_expired_link_is_refused(self, api_client, admin_membership, settings):
+        """Test links stop working after ORGANIZATION_EXPORT_LINK_MAX_AGE."""
+        url, _ = self.export_link(admin_membership)
+        settings.ORGANIZATION_EXPORT_LINK_MAX_AGE = -1
+
+        response = api_client.get(urlsplit(url).path)
+
+        assert response.status_code == 404
+
+    def test_link_revoked_with_admin_role(self, api_client, admin_membership):
+        """Test the requester must still be an active admin."""
+        url, _ = self.export_link(admin_membership)
+        admin_membership.status = "suspended"
+        admin_membership.save()
+
+        response = api_client.get(urlsplit(url).path)
+
+        assert response.status_code == 404
+
+    def test_task_mails_signed_link(self, admin_membership, monkeypatch):
+        """Test the export email links to the download view, not the storage."""
+        sent = []
+        monkeypatch.setattr(
+            "apps.email_service.services.send_email",
+            lambda **kwargs: sent.append(kwargs),
+        )
+        organization = admin_membership.organization
+
+        export_organization_data.apply(
+            args=[str(organization.id), admin_membership.user.email]
+        ).get()
+
+        token = urlsplit(sent[0]["context"]["export_url"]).path.split("/")[-2]
+        assert load_export_link(token)["org"] == str(organization.id)
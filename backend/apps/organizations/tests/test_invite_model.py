@@ -376,3 +376,35 @@ class TestInviteManager:
 
         email_invites = Invite.objects.for_email("TEST@EXAMPLE.COM")
         assert invite in email_invites
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestExpireStaleInvites:
+    """Test the batched invite expiry task."""
+
+    def test_marks_past_due_pending_invites_expired(self):
+        """Test only pending invites past their expiry date are expired."""
+        from apps.organizations.tasks import expire_stale_invites
+
+        org = OrganizationFactory()
+        stale = InviteFactory(organization=org, email="stale@example.com")
+        fresh = InviteFactory(organization=org, email="fresh@example.com")
+        # An expired sibling blocks (organization, email, status) uniqueness
+        blocked = InviteFactory(organization=org, email="blocked@example.com")
+        InviteFactory(organization=org, email="blocked@example.com", status="expired")
+        past = timezone.now() - timedelta(days=1)
+        Invite.objects.filter(pk__in=[stale.pk, blocked.pk]).update(expires_at=past)
+
+        result = expire_stale_invites.apply().get()
+
+        assert result["processed"] == 1
+        assert result["complete"]
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        blocked.refresh_from_db()
+        assert stale.status == "expired"
+        assert fresh.status == "pending"
+        assert blocked.status == "pending"
+        org.refresh_from_db()
+        assert org.pending_invite_count == 2
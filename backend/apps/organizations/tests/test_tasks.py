@@ -0,0 +1,181 @@
+"""
+Tests for organization maintenance tasks.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.accounts.models import Account, AccountAuthProvider
+from apps.accounts.tests.factories import AccountAuthProviderFactory, AccountFactory
+from apps.core.audit.models import AuditAction, AuditLog
+from apps.organizations import tasks
+from apps.organizations.models import Organization
+from apps.organizations.tasks import (
+    UserAnonymization,
+    anonymize_users,
+    cleanup_expired_deletions,
+    delete_expired_organization,
+)
+from apps.organizations.tests.factories import (
+    ActiveMembershipFactory,
+    OrganizationFactory,
+)
+
+
+def create_expired(**kwargs):
+    """Create an organization past its scheduled permanent deletion."""
+    now = timezone.now()
+    return OrganizationFactory(
+        deleted_at=now - timedelta(days=31),
+        scheduled_permanent_deletion=now - timedelta(days=1),
+        is_active=False,
+        **kwargs,
+    )
+
+
+def cleanup_audit_logs():
+    return AuditLog.objects.filter(
+        action=AuditAction.DATA_DELETE, details__action="bulk_cleanup"
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestCleanupExpiredDeletions:
+    """Test the fan-out cleanup of expired organization deletions."""
+
+    def test_deletes_expired_organizations_with_one_audit_entry(self):
+        """Test each expired organization is deleted and the run audited once."""
+        expired = [create_expired() for _ in range(3)]
+        ActiveMembershipFactory(organization=expired[0])
+        protected = create_expired(extended_properties={"is_global_scope": True})
+        pending = OrganizationFactory(
+            deleted_at=timezone.now(),
+            scheduled_permanent_deletion=timezone.now() + timedelta(days=29),
+        )
+
+        result = cleanup_expired_deletions.apply().get()
+
+        assert result["dispatched"] == 4
+        assert not Organization.objects.filter(
+            pk__in=[org.pk for org in expired]
+        ).exists()
+        remaining = Organization.objects.filter(pk__in=[protected.pk, pending.pk])
+        assert remaining.count() == 2
+
+        audit_log = cleanup_audit_logs().get()
+        assert audit_log.resource_id is None
+        assert audit_log.success
+        assert audit_log.details["deleted_count"] == 3
+        assert audit_log.details["skipped_count"] == 1
+        assert audit_log.details["error_count"] == 0
+
+    def test_nothing_expired_still_records_run(self):
+        """Test an empty run dispatches nothing but is audited."""
+        result = cleanup_expired_deletions.apply().get()
+
+        assert result["dispatched"] == 0
+        assert cleanup_audit_logs().get().details["deleted_count"] == 0
+
+    def test_restored_organization_is_not_deleted(self):
+        """Test a deletion task re-checks the organization before deleting."""
+        org = create_expired()
+        org.restore()
+
+        status = delete_expired_organization.apply(args=[str(org.pk)]).get()
+
+        assert status == "missing"
+        assert Organization.objects.filter(pk=org.pk).exists()
+
+    def test_deletions_are_dispatched_in_chunks(self, settings, monkeypatch):
+        """Test at most MAX_CONCURRENT deletions are enqueued at once."""
+        settings.ORGANIZATION_DELETION = {"MAX_CONCURRENT": 2}
+        expired = [create_expired() for _ in range(5)]
+        chunks = []
+        chord = tasks.chord
+
+        def recording_chord(header, *args, **kwargs):
+            header = list(header)
+            chunks.append(len(header))
+            return chord(header, *args, **kwargs)
+
+        monkeypatch.setattr(tasks, "chord", recording_chord)
+
+        result = cleanup_expired_deletions.apply().get()
+
+        assert result["dispatched"] == 5
+        assert chunks == [2, 2, 1]
+        assert not Organization.objects.filter(
+            pk__in=[org.pk for org in expired]
+        ).exists()
+        assert cleanup_audit_logs().get().details["deleted_count"] == 5
+
+
+def anonymization_audit_logs():
+    return AuditLog.objects.filter(action="data_deletion", details__action="anonymize")
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestAnonymizeUsers:
+    """Test bulk anonymization of many users."""
+
+    def test_anonymizes_in_bulk(self, django_assert_max_num_queries):
+        """Test PII, auth providers and audit entries are handled per batch."""
+        users = AccountFactory.create_batch(5)
+        for user in users:
+            AccountAuthProviderFactory(user=user)
+        bystander = AccountFactory()
+        user_ids = [str(user.pk) for user in users]
+
+        # Constant per batch, not per user
+        with django_assert_max_num_queries(30):
+            result = anonymize_users.apply(
+                args=[user_ids], kwargs={"reason": "offboarding", "batch_size": 5}
+            ).get()
+
+        assert result["complete"]
+        assert result["processed"] == result["requested"] == 5
+        for user in Account.objects.filter(pk__in=user_ids):
+            assert user.email.endswith("@anonymized.local")
+            assert (user.first_name, user.last_name) == ("Deleted", "User")
+            assert not user.is_active
+        assert not AccountAuthProvider.objects.filter(user_id__in=user_ids).exists()
+
+        entries = anonymization_audit_logs()
+        assert entries.count() == 5
+        assert {entry.details["original_email"] for entry in entries} == {
+            user.email for user in users
+        }
+        assert entries.first().details["reason"] == "offboarding"
+        bystander.refresh_from_db()
+        assert bystander.is_active
+
+    def test_dry_run_changes_nothing(self):
+        """Test a dry run only reports how many accounts would be anonymized."""
+        users = AccountFactory.create_batch(3)
+
+        result = anonymize_users.apply(
+            args=[[str(user.pk) for user in users]], kwargs={"dry_run": True}
+        ).get()
+
+        assert result["dry_run"]
+        assert result["processed"] == 3
+        assert not Account.objects.filter(email__endswith="@anonymized.local").exists()
+        assert not anonymization_audit_logs().exists()
+
+    def test_resumes_without_repeating_users(self):
+        """Test an interrupted request finishes without duplicate audit entries."""
+        users = AccountFactory.create_batch(5)
+        user_ids = [str(user.pk) for user in users]
+
+        first = UserAnonymization(user_ids, batch_size=2, time_budget=0).run()
+        assert not first.complete
+
+        result = anonymize_users.apply(args=[user_ids], kwargs={"batch_size": 2}).get()
+
+        assert result["complete"]
+        assert result["processed"] == 5
+        assert anonymization_audit_logs().count() == 5
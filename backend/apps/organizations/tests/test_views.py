@@ -452,6 +452,41 @@ class TestOrganizationAPIPerformance:
         assert end_time - start_time < 5.0
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_403_FORBIDDEN]
 
+    def test_list_query_count_independent_of_members(
+        self, api_client, authenticated_user
+    ):
+        """Test listing doesn't load memberships, however many there are."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        api_client.force_authenticate(user=authenticated_user)
+        url = reverse("organization-list")
+
+        def add_organization(members):
+            org = OrganizationFactory()
+            OrganizationMembershipFactory(
+                organization=org, user=authenticated_user, role="owner"
+            )
+            OrganizationMembershipFactory.create_batch(
+                members, organization=org, status="active"
+            )
+            return org
+
+        add_organization(members=1)
+        with CaptureQueriesContext(connection) as small:
+            api_client.get(url)
+
+        orgs = [add_organization(members=10) for _ in range(3)]
+        with CaptureQueriesContext(connection) as large:
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(large.captured_queries) == len(small.captured_queries)
+        member_counts = {
+            str(item["id"]): item["member_count"] for item in response.data["data"]
+        }
+        assert all(member_counts[str(org.id)] == 11 for org in orgs)
+
     def test_complex_stats_query_performance(self, api_client, organization_with_owner):
         """Test performance of stats endpoint with complex data."""
         org, membership = organization_with_owner
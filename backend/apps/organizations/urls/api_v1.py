@@ -21,6 +21,12 @@ memberships_router.register(
 )
 
 urlpatterns = [
+    # Signed export download links (mailed, so opened without API credentials)
+    path(
+        "exports/<str:token>/",
+        views.ExportDownloadView.as_view(),
+        name="organization-export-download",
+    ),
     path("", include(router.urls)),
     path("", include(invites_router.urls)),
     path("", include(memberships_router.urls)),
@@ -1,10 +1,15 @@
 from django.conf import settings
-from django.db.models import Count, Prefetch, Q
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import FileResponse
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.core.permissions import (
     CanCreateOrganization,
@@ -13,12 +18,14 @@ from apps.core.permissions import (
     CanManageOrganization,
 )
 
+from .exports import get_export_storage, load_export_link
 from .models import Invite, Organization, OrganizationMembership
 from .serializers import (
     AcceptInviteSerializer,
     CreateInviteSerializer,
     InviteSerializer,
     MembershipUpdateSerializer,
+    OrganizationListSerializer,
     OrganizationMembershipSerializer,
     OrganizationSerializer,
 )
@@ -85,30 +92,20 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         """
         Filter organizations to only those where the user has active membership.
         Superusers can see all organizations.
-        Optimized with annotations to prevent N+1 queries.
+
+        Lists load only the columns OrganizationListSerializer renders;
+        member counts come from the denormalized counters, and members are
+        listed (paginated) by the nested members endpoint.
         """
         user = self.request.user
 
-        # Base queryset with performance optimizations
-        queryset = (
-            Organization.objects.annotate(
-                # Count active members (used by serializer)
-                active_member_count=Count(
-                    "memberships", filter=Q(memberships__status="active"), distinct=True
-                )
+        # Subscription joined for subscription_status
+        if self.action == "list":
+            queryset = Organization.objects.select_related("subscription").only(
+                *OrganizationListSerializer.PROJECTION_FIELDS, "subscription__status"
             )
-            .select_related("created_by")  # Avoid extra query for creator
-            .prefetch_related(
-                # Prefetch active memberships efficiently
-                Prefetch(
-                    "memberships",
-                    queryset=OrganizationMembership.objects.filter(
-                        status="active"
-                    ).select_related("user"),
-                    to_attr="active_memberships_list",
-                )
-            )
-        )
+        else:
+            queryset = Organization.objects.select_related("created_by", "subscription")
 
         # Superusers can see all organizations
         if user.is_superuser:
@@ -119,7 +116,13 @@ class OrganizationViewSet(viewsets.ModelViewSet):
             "organization_id", flat=True
         )
 
-        return queryset.filter(id__in=user_org_ids, is_active=True).distinct()
+        # id__in can't produce duplicates; no DISTINCT needed
+        return queryset.filter(id__in=user_org_ids, is_active=True)
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return OrganizationListSerializer
+        return OrganizationSerializer
 
     def update(self, request, *args, **kwargs):
         """
@@ -179,8 +182,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         organization = self.get_object()
         # Example stats - you can customize based on your needs
         stats = {
-            "total_users": organization.memberships.filter(status="active").count(),
-            "active_users": organization.memberships.filter(status="active").count(),
+            "total_users": organization.active_member_count,
+            "active_users": organization.active_member_count,
             "created_at": organization.created_at,
             "is_on_trial": organization.on_trial,
             "trial_ends_on": organization.trial_ends_on,
@@ -529,15 +532,16 @@ class InviteViewSet(viewsets.ModelViewSet):
         try:
             membership = serializer.save(user=request.user)
 
-            # Log the acceptance
-            from apps.core.audit.logger import AuditLogger
+            # Log the acceptance once the membership is committed
+            from apps.core.audit.utils import get_client_ip, get_user_agent
+            from apps.core.side_effects import defer
+            from apps.organizations.side_effects import log_invite_accepted
 
-            AuditLogger.log_membership_created(
-                request=request,
-                organization=membership.organization,
-                user=request.user,
-                membership=membership,
-                action="invite_accepted",
+            defer(
+                log_invite_accepted,
+                membership_id=str(membership.id),
+                ip_address=get_client_ip(request),
+                user_agent=get_user_agent(request),
             )
 
             return Response(
@@ -838,3 +842,45 @@ class MembershipViewSet(viewsets.ModelViewSet):
                 "membership": OrganizationMembershipSerializer(membership).data,
             }
         )
+
+
+class ExportDownloadView(APIView):
+    """
+    Download an organization data export through its signed link.
+
+    The link is mailed by export_organization_data and opened in a browser
+    without API credentials, so the signature is the credential. It expires
+    after ORGANIZATION_EXPORT_LINK_MAX_AGE seconds and stops working once the
+    requester is no longer an active admin of the organization.
+    """
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    @extend_schema(
+        summary="Download organization data export",
+        description="Download a data export through the signed link mailed to the requester.",
+        responses={200: OpenApiTypes.BINARY, 404: dict},
+        tags=["Organizations", "GDPR"],
+    )
+    def get(self, request, token):
+        try:
+            link = load_export_link(token)
+        except signing.BadSignature:
+            raise NotFound("This export link is invalid or has expired.") from None
+
+        organization = Organization.objects.filter(pk=link["org"]).first()
+        requester = get_user_model().objects.filter(email=link["email"]).first()
+        if organization is None or requester is None:
+            raise NotFound("This export link is invalid or has expired.")
+        if not requester.is_superuser:
+            membership = requester.get_membership_in(organization)
+            if not (membership and membership.is_active() and membership.is_admin()):
+                raise NotFound("This export link is invalid or has expired.")
+
+        storage = get_export_storage()
+        if not storage.exists(link["file"]):
+            raise NotFound("This export is no longer available.")
+        return FileResponse(
+            storage.open(link["file"], "rb"), as_attachment=True, filename=link["file"]
+        )
@@ -27,7 +27,9 @@ app.autodiscover_tasks()
 # Celery Beat schedule for periodic tasks
 from celery.schedules import crontab
 
+# Merged with CELERY_BEAT_SCHEDULE from settings rather than replacing it
 app.conf.beat_schedule = {
+    **app.conf.beat_schedule,
     # Daily cleanup of expired organization deletions (runs at 2 AM)
     "cleanup-expired-deletions": {
         "task": "apps.organizations.tasks.cleanup_expired_deletions",
@@ -112,6 +112,7 @@ MIDDLEWARE = [
     "apps.core.middleware.TransactionIDMiddleware",
     "apps.core.middleware.rate_limiting.RateLimitMiddleware",  # Rate limiting
     "apps.organizations.middleware.tenant.TenantMiddleware",
+    "apps.core.middleware.side_effects.SideEffectsMiddleware",
 ]
 
 # Observability: Conditionally add metrics middleware
@@ -234,6 +235,27 @@ CELERY_BEAT_SCHEDULE = {
             "expires": 3600,  # Task expires after 1 hour if not picked up
         },
     },
+    "prune-token-blacklist": {
+        "task": "apps.accounts.tasks.prune_token_blacklist",
+        "schedule": crontab(hour=3, minute=0),  # Daily at 3:00 AM
+        "options": {
+            "expires": 3600,
+        },
+    },
+    "cleanup-old-email-logs": {
+        "task": "apps.email_service.services.cleanup_old_email_logs",
+        "schedule": crontab(hour=3, minute=30),  # Daily at 3:30 AM
+        "options": {
+            "expires": 3600,
+        },
+    },
+    "expire-stale-invites": {
+        "task": "apps.organizations.tasks.expire_stale_invites",
+        "schedule": crontab(hour=4, minute=0),  # Daily at 4:00 AM
+        "options": {
+            "expires": 3600,
+        },
+    },
 }
 
 # Email configuration
@@ -325,7 +347,7 @@ AUTH_USER_MODEL = "accounts.Account"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.CachedJWTAuthentication",
         # SessionAuthentication removed to prevent CSRF conflicts with stateless JWT API
         # Django admin uses its own session auth and doesn't rely on DRF authentication
         "rest_framework.authentication.TokenAuthentication",
@@ -338,7 +360,7 @@ REST_FRAMEWORK = {
         "apps.core.renderers.ConsistentDataJSONRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
-        "djangorestframework_camel_case.parser.CamelCaseJSONParser",
+        "apps.core.parsers.FastCamelCaseJSONParser",
         "djangorestframework_camel_case.parser.CamelCaseFormParser",
         "djangorestframework_camel_case.parser.CamelCaseMultiPartParser",
     ),
@@ -374,6 +396,68 @@ from apps.core.jwt_config import get_jwt_settings
 
 SIMPLE_JWT = get_jwt_settings(SECRET_KEY)
 
+# Authorize membership checks from the organization claims in access tokens.
+# Claims are only trusted while the token's membership version is current, so
+# membership changes still take effect on the next request.
+JWT_TRUST_TENANT_CLAIMS = config("JWT_TRUST_TENANT_CLAIMS", default=False, cast=bool)
+
+# Bloom filter answering "definitely not blacklisted" for refresh tokens
+# without querying the token_blacklist tables (see apps.accounts.token_blacklist)
+TOKEN_BLACKLIST_FILTER = {
+    "ENABLED": config("TOKEN_BLACKLIST_FILTER_ENABLED", default=True, cast=bool),
+    "CAPACITY": config("TOKEN_BLACKLIST_FILTER_CAPACITY", default=200000, cast=int),
+    "ERROR_RATE": config(
+        "TOKEN_BLACKLIST_FILTER_ERROR_RATE", default=0.001, cast=float
+    ),
+}
+
+# Post-commit side effects (see apps.core.side_effects): batched into one
+# Celery task per request, with a bounded local thread pool as fallback
+SIDE_EFFECTS = {
+    "USE_CELERY": config("SIDE_EFFECTS_USE_CELERY", default=True, cast=bool),
+    "MAX_WORKERS": config("SIDE_EFFECTS_MAX_WORKERS", default=4, cast=int),
+    "ALWAYS_EAGER": False,
+}
+
+# Storage for organization data exports (see apps.organizations.exports);
+# swap the backend for e.g. S3 in production. Exports are downloaded through
+# signed links valid for ORGANIZATION_EXPORT_LINK_MAX_AGE seconds, never
+# from the storage's own URLs
+ORGANIZATION_EXPORT_STORAGE = {
+    "BACKEND": "django.core.files.storage.FileSystemStorage",
+    "OPTIONS": {
+        "location": config("ORGANIZATION_EXPORT_ROOT", default="/tmp/org_exports"),
+    },
+}
+ORGANIZATION_EXPORT_LINK_MAX_AGE = config(
+    "ORGANIZATION_EXPORT_LINK_MAX_AGE", default=7 * 24 * 60 * 60, cast=int
+)
+
+# Expired organization cleanup (see apps.organizations.tasks): each deletion
+# cascades through the organization's data, so deletions are dispatched in
+# chunks of MAX_CONCURRENT
+ORGANIZATION_DELETION = {
+    "MAX_CONCURRENT": config(
+        "ORGANIZATION_DELETION_MAX_CONCURRENT", default=4, cast=int
+    ),
+}
+
+# JSON request bodies (see apps.core.parsers): bodies over MAX_BODY_SIZE bytes
+# are refused with a 413
+JSON_PARSER = {
+    "MAX_BODY_SIZE": config(
+        "JSON_PARSER_MAX_BODY_SIZE", default=10 * 1024 * 1024, cast=int
+    ),
+}
+
+# Error code registry (see apps.core.code_registry): compiled by
+# `manage.py compile_code_registry` to skip scanning apps at startup
+CODE_REGISTRY = {
+    "ARTIFACT_PATH": config(
+        "CODE_REGISTRY_ARTIFACT", default=str(BASE_DIR / "code_registry.json")
+    ),
+}
+
 # Frontend URL for email verification links
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 
@@ -32,6 +32,7 @@ MIDDLEWARE = [
     "apps.core.middleware.RequestTimingMiddleware",
     "apps.core.middleware.TransactionIDMiddleware",
     # Rate limiting disabled (see RATELIMIT_ENABLE below)
+    "apps.core.middleware.side_effects.SideEffectsMiddleware",
 ]
 
 # Test database configuration
@@ -72,6 +73,9 @@ STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 
+# Run deferred side effects inline (test transactions never commit)
+SIDE_EFFECTS = {"ALWAYS_EAGER": True}
+
 # Disable rate limiting for tests
 RATELIMIT_ENABLE = False
 RATE_LIMITING = {"ENABLED": False, "REDIS_URL": "redis://redis:6379/1"}
@@ -3,6 +3,7 @@ Global pytest fixtures for the entire project.
 """
 
 import pytest
+from django.core.cache import cache
 from django.test import Client
 from rest_framework.test import APIClient
 
@@ -12,6 +13,7 @@ from apps.accounts.tests.factories import (
     SuperuserAccountFactory,
     UnverifiedAccountFactory,
 )
+from apps.core.cache import clear_local_caches
 from apps.organizations.tests.factories import (
     OrganizationFactory,
     OrganizationMembershipFactory,
@@ -30,6 +32,21 @@ def django_db_setup(django_db_setup, django_db_blocker):
         pass
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """
+    Clear the shared and in-process caches around each test.
+
+    Database rows are rolled back between tests without firing signals, so
+    cached organizations/memberships would otherwise leak into later tests.
+    """
+    cache.clear()
+    clear_local_caches()
+    yield
+    cache.clear()
+    clear_local_caches()
+
+
 @pytest.fixture
 def api_client():
     """DRF API client."""